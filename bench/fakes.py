@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 가짜 검사기
+실제 API/모델/JVM 없이 지연 분포, 오류율, CPU 비용을 흉내 냅니다.
+
+스펙 문자열 예:
+    hanspell,latency=lognormal,mean=0.08,sigma=0.6,error=0.02
+    spacing,cpu=0.003,batch_overhead=0.02
+    rule,cpu=0.0002,flag=0.3
+"""
+
+import hashlib
+import math
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from checkers.base import BaseChecker
+from utils.ratelimit import AdaptiveRateLimiter
+
+# 실제 검사기와 비슷한 기본 프로필
+DEFAULT_PROFILES = [
+    "hanspell,latency=lognormal,mean=0.08,sigma=0.5,error=0.01,flag=0.2,cost=50",
+    "spacing,cpu=0.003,batch_overhead=0.01,flag=0.1,cost=5",
+    "rule,cpu=0.0002,flag=0.05,cost=1",
+    "languagetool,latency=lognormal,mean=0.03,sigma=0.4,flag=0.05,cost=20",
+]
+
+
+class FakeChecker(BaseChecker):
+    """
+    설정 가능한 가짜 검사기.
+
+    Args:
+        name: 검사기 이름 (리포트 sources 에 그대로 쓰임)
+        latency: 지연 분포 (const, uniform, exp, lognormal)
+        mean: 문장당 평균 대기 시간(초) - sleep 으로 흉내 내는 I/O 대기
+        sigma: lognormal 분포의 로그 표준편차 (uniform 이면 ±비율)
+        cpu: 문장당 CPU 바쁜 대기 시간(초) - GIL 을 잡는 연산
+        batch_overhead: check_batch 호출당 고정 비용(초)
+        error: 오류 결과 비율 (0~1)
+        flag: 플래그 비율 (0~1, 문장 해시로 결정되어 실행마다 같음)
+        rate: 초당 최대 호출 수 (0이면 제한 없음)
+        cost: 문장당 상대 비용 (실행 계획 --plan 의 절약 비용 계산용)
+        seed: 지연 난수 시드
+    """
+
+    def __init__(self, name: str, latency: str = "const", mean: float = 0.0, sigma: float = 0.5,
+                 cpu: float = 0.0, batch_overhead: float = 0.0, error: float = 0.0,
+                 flag: float = 0.1, rate: float = 0.0, cost: float = 1.0, seed: int = 0):
+        self.name = name
+        self.latency = latency
+        self.mean = mean
+        self.sigma = sigma
+        self.cpu = cpu
+        self.batch_overhead = batch_overhead
+        self.error = error
+        self.flag = flag
+        self.cost = cost
+        # 지연(sleep)이 있으면 I/O 레인 한도를 쓴다
+        self.io_bound = mean > 0
+        self._limiter = AdaptiveRateLimiter(rate, max_rate=rate) if rate > 0 else None
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.sentences = 0
+        self.errors = 0
+
+    @classmethod
+    def from_spec(cls, spec: str, rate: float = 0.0) -> "FakeChecker":
+        """'이름,키=값,...' 문자열로 생성."""
+        name, *pairs = [part.strip() for part in spec.split(",") if part.strip()]
+        kwargs = {"rate": rate}
+        for pair in pairs:
+            key, _, value = pair.partition("=")
+            key = key.strip()
+            kwargs[key] = value if key == "latency" else float(value)
+        if "seed" in kwargs:
+            kwargs["seed"] = int(kwargs["seed"])
+        return cls(name, **kwargs)
+
+    def check(self, sentence: str) -> Dict:
+        return self.check_batch([sentence])[0]
+
+    def check_batch(self, sentences: List[str]) -> List[Dict]:
+        with self._lock:
+            self.calls += 1
+            self.sentences += len(sentences)
+        if self.batch_overhead:
+            time.sleep(self.batch_overhead)
+        return [self._check_one(sentence) for sentence in sentences]
+
+    def _check_one(self, sentence: str) -> Dict:
+        if self._limiter is not None:
+            self._limiter.acquire()
+        wait = self._sample()
+        if wait > 0:
+            time.sleep(wait)
+        if self.cpu > 0:
+            _spin(self.cpu)
+
+        digest = hashlib.md5(f"{self.name}:{sentence}".encode("utf-8")).digest()
+        if self.error and self._uniform() < self.error:
+            with self._lock:
+                self.errors += 1
+            return {"flag": False, "meta": {"error": "simulated error"}}
+        if digest[0] / 256.0 < self.flag:
+            return {"flag": True, "suggestion": sentence + " ", "meta": {"fake": True}}
+        return {"flag": False}
+
+    def _uniform(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def _sample(self) -> float:
+        """지연 분포에서 대기 시간 하나 추출."""
+        if self.mean <= 0:
+            return 0.0
+        with self._lock:
+            if self.latency == "uniform":
+                return self._rng.uniform(self.mean * (1 - self.sigma), self.mean * (1 + self.sigma))
+            if self.latency == "exp":
+                return self._rng.expovariate(1.0 / self.mean)
+            if self.latency == "lognormal":
+                # 평균이 mean 이 되도록 mu 보정
+                mu = math.log(self.mean) - self.sigma ** 2 / 2
+                return self._rng.lognormvariate(mu, self.sigma)
+        return self.mean
+
+
+def _spin(seconds: float):
+    """GIL 을 잡은 채 seconds 동안 바쁜 대기 (CPU 비용 흉내)."""
+    end = time.perf_counter() + seconds
+    x = 0
+    while time.perf_counter() < end:
+        x += 1
+
+
+def build_fakes(specs: Optional[List[str]] = None, rate: float = 0.0) -> List[FakeChecker]:
+    """스펙 목록으로 가짜 검사기 생성 (rate 는 hanspell 가짜 검사기에만 적용)."""
+    checkers = []
+    for spec in specs or DEFAULT_PROFILES:
+        name = spec.split(",", 1)[0].strip()
+        checkers.append(FakeChecker.from_spec(spec, rate=rate if name == "hanspell" else 0.0))
+    return checkers
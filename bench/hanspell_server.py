@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 Hanspell 대역 서버
+네이버 맞춤법 API와 같은 형식(JSON/JSONP)으로 응답하며 지연, 오류율, 허용 속도를 조절할 수 있습니다.
+AsyncHanspellChecker 를 --hanspell-endpoint 로 이 서버에 연결해 오프라인으로 측정합니다.
+
+사용법:
+    python -m bench.hanspell_server [--port 8765] [--latency 0.08] [--error 0.01] [--max-rate 30]
+    python run.py 문서.pdf --hanspell --hanspell-backend async --hanspell-endpoint http://127.0.0.1:8765/
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+from urllib.parse import parse_qs, urlparse
+
+# 대역 서버가 고쳐 주는 흔한 오탈자
+_CORRECTIONS = {
+    "됬": "됐",
+    "되요": "돼요",
+    "않되": "안 되",
+    "몇일": "며칠",
+    "금새": "금세",
+    "설겆이": "설거지",
+    "어떻해": "어떡해",
+}
+
+
+class HanspellStandIn(ThreadingHTTPServer):
+    """
+    지연/오류/속도 제한을 흉내 내는 Hanspell 대역 서버.
+
+    Args:
+        address: (host, port) - port 0 이면 빈 포트 자동 선택
+        latency: 평균 응답 지연(초, 지수 분포)
+        error: 500 응답 비율 (0~1)
+        max_rate: 초당 허용 요청 수 - 넘으면 429 (0이면 제한 없음)
+        jsonp: True 면 callback(...) 형식으로 응답
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), latency: float = 0.05,
+                 error: float = 0.0, max_rate: float = 0.0, jsonp: bool = False, seed: int = 0):
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.error = error
+        self.max_rate = max_rate
+        self.jsonp = jsonp
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = []
+        self.requests = 0
+        self.throttled = 0
+        self.failed = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "HanspellStandIn":
+        """백그라운드 스레드에서 서비스 시작."""
+        threading.Thread(target=self.serve_forever, name="hanspell-stand-in", daemon=True).start()
+        return self
+
+    def decide(self) -> Tuple[int, float]:
+        """(상태 코드, 지연) 결정."""
+        with self._lock:
+            self.requests += 1
+            now = time.monotonic()
+            if self.max_rate > 0:
+                self._window = [t for t in self._window if now - t < 1.0]
+                if len(self._window) >= self.max_rate:
+                    self.throttled += 1
+                    return 429, 0.0
+                self._window.append(now)
+            delay = self._rng.expovariate(1.0 / self.latency) if self.latency > 0 else 0.0
+            if self.error and self._rng.random() < self.error:
+                self.failed += 1
+                return 500, delay
+            return 200, delay
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status, delay = self.server.decide()
+        if delay:
+            time.sleep(delay)
+        if status != 200:
+            self._send(status, b"")
+            return
+
+        query = parse_qs(urlparse(self.path).query)
+        text = query.get("q", [""])[0]
+        corrected = text
+        for wrong, right in _CORRECTIONS.items():
+            corrected = corrected.replace(wrong, right)
+        result = {"message": {"result": {
+            "errata_count": int(corrected != text),
+            "origin_html": text,
+            "html": corrected,
+            "notag_html": corrected,
+        }}}
+        body = json.dumps(result, ensure_ascii=False)
+        if self.server.jsonp:
+            body = f"{query.get('_callback', ['callback'])[0]}({body});"
+        self._send(200, body.encode("utf-8"))
+
+    def _send(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Hanspell 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="평균 응답 지연(초)")
+    parser.add_argument("--error", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--max-rate", type=float, default=0.0, help="초당 허용 요청 수 (넘으면 429)")
+    parser.add_argument("--jsonp", action="store_true", help="JSONP 형식으로 응답")
+    args = parser.parse_args()
+
+    server = HanspellStandIn((args.host, args.port), latency=args.latency, error=args.error,
+                             max_rate=args.max_rate, jsonp=args.jsonp)
+    print(f"Hanspell 대역 서버: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"요청 {server.requests}건, 429 {server.throttled}건, 500 {server.failed}건")
+
+
+if __name__ == "__main__":
+    main()
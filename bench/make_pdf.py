@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+합성 한국어 PDF 생성기
+머리글/바닥글/쪽번호, 반복 문장, 흔한 오탈자가 섞인 텍스트 PDF를 만듭니다.
+
+사용법:
+    python -m bench.make_pdf out.pdf [--pages 50] [--sentences 25] [--dup 0.1] [--typo 0.1]
+"""
+
+import argparse
+import random
+from typing import List
+
+_SUBJECTS = ["프로젝트 관리자는", "이해관계자는", "팀원들은", "품질 관리 계획은", "위험 관리 절차는",
+             "일정 계획은", "범위 기술서는", "조달 담당자는", "변경 통제 위원회는", "스폰서는"]
+_OBJECTS = ["요구사항을", "작업 분류 체계를", "위험 등록부를", "품질 기준을", "의사소통 계획을",
+            "승인된 변경 요청을", "산출물을", "교훈 사항을", "자원 달력을", "예산 기준선을"]
+_VERBS = ["검토해야 한다.", "정기적으로 갱신한다.", "문서화하여 공유한다.", "승인 후 배포한다.",
+          "감시하고 통제한다.", "확인하고 기록한다.", "분석하여 보고한다.", "계획 단계에서 정의한다."]
+# 오탈자가 들어간 서술부 (정상: 됐다, 안 된다, 며칠, 금세, 돼요)
+_TYPO_VERBS = ["모두 확정됬다.", "누락하면 않된다.", "몇일 안에 검토한다.", "금새 갱신한다.",
+               "함께 보면 되요."]
+
+
+def synthetic_sentences(count: int, dup: float = 0.1, typo: float = 0.1, seed: int = 0) -> List[str]:
+    """반복 비율 dup, 오탈자 비율 typo 인 한국어 문장 생성."""
+    rng = random.Random(seed)
+    sentences: List[str] = []
+    for _ in range(count):
+        if sentences and rng.random() < dup:
+            sentences.append(rng.choice(sentences))
+            continue
+        verbs = _TYPO_VERBS if rng.random() < typo else _VERBS
+        sentences.append(f"{rng.choice(_SUBJECTS)} {rng.choice(_OBJECTS)} {rng.choice(verbs)}")
+    return sentences
+
+
+def make_pdf(path: str, pages: int = 50, sentences_per_page: int = 25, dup: float = 0.1,
+             typo: float = 0.1, seed: int = 0) -> str:
+    """합성 PDF 저장 후 경로 반환."""
+    import fitz
+
+    sentences = synthetic_sentences(pages * sentences_per_page, dup, typo, seed)
+    doc = fitz.open()
+    for page_no in range(pages):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((72, 40), "제3장 품질관리 · 벤치마크 문서", fontname="korea", fontsize=8)
+        body = sentences[page_no * sentences_per_page:(page_no + 1) * sentences_per_page]
+        rect = fitz.Rect(72, 72, 523, 790)
+        page.insert_textbox(rect, " ".join(body), fontname="korea", fontsize=10, lineheight=1.6)
+        page.insert_text((290, 815), str(page_no + 1), fontname="korea", fontsize=8)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 한국어 PDF 생성기")
+    parser.add_argument("out", help="저장할 PDF 경로")
+    parser.add_argument("--pages", type=int, default=50, help="페이지 수")
+    parser.add_argument("--sentences", type=int, default=25, help="페이지당 문장 수")
+    parser.add_argument("--dup", type=float, default=0.1, help="반복 문장 비율")
+    parser.add_argument("--typo", type=float, default=0.1, help="오탈자 문장 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    make_pdf(args.out, args.pages, args.sentences, args.dup, args.typo, args.seed)
+    print(f"저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사 오케스트레이션 벤치마크
+run.py 의 실제 흐름(추출 → 분리 → 마이크로 배치 → 검사 → 리포트)을 가짜 검사기로 돌려
+--workers / 속도 / 실행 방식(--scheduling)별 처리량, 문장당 지연(p50/p99), 작업자 사용률을 측정합니다.
+추출 캐시를 미리 채워 두므로 측정값은 스케줄링과 검사 비용 위주입니다.
+
+사용법:
+    python -m bench.orchestration [--pdf 문서.pdf] [--workers 1,4,8] [--rates 5,20] [--scheduling lanes,shared]
+    python -m bench.orchestration --fake "hanspell,latency=exp,mean=0.1,error=0.05" --fake "rule,cpu=0.0005"
+    python -m bench.orchestration --hanspell-server --server-latency 0.08 --server-max-rate 30
+    python -m bench.orchestration --workers 4 -- --batch-size 16 --batch-wait 0.01   (run.py 인자 추가)
+"""
+
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+import run
+from bench.fakes import DEFAULT_PROFILES, build_fakes
+from bench.hanspell_server import HanspellStandIn
+from bench.make_pdf import make_pdf
+from utils.pdf import ExtractionCache, extract_pages
+
+
+class _Probe:
+    """run.py 전역 함수를 감싸 문장별 지연과 작업자 사용 시간을 기록."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.busy = 0.0
+        self.sentences = 0
+        self.schedulers = []
+        self._lock = threading.Lock()
+
+    def dedup_class(self):
+        probe = self
+
+        class TimedDedupIndex(run.DedupIndex):
+            def submit(self, sentence):
+                start = time.perf_counter()
+                future = super().submit(sentence)
+                future.add_done_callback(lambda _: probe._record(time.perf_counter() - start))
+                return future
+
+        return TimedDedupIndex
+
+    def scheduler_class(self):
+        probe = self
+
+        class RecordedLaneScheduler(run.LaneScheduler):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                probe.schedulers.append(self)
+
+        return RecordedLaneScheduler
+
+    def utilization(self, workers: int, wall: float) -> float:
+        """shared: 공용 풀 사용률, lanes: thread/process 레인 전체 사용률 (async 레인 제외)."""
+        if wall <= 0:
+            return 0.0
+        lanes = [lane for scheduler in self.schedulers for lane in scheduler.lanes if lane.kind != "async"]
+        if lanes:
+            return sum(lane.busy for lane in lanes) / (sum(lane.limit for lane in lanes) * wall)
+        return self.busy / (workers * wall)
+
+    def check_sentences(self, original):
+        def timed(sentences, checkers, *args):
+            start = time.perf_counter()
+            try:
+                return original(sentences, checkers, *args)
+            finally:
+                with self._lock:
+                    self.busy += time.perf_counter() - start
+        return timed
+
+    def _record(self, latency: float):
+        with self._lock:
+            self.latencies.append(latency)
+            self.sentences += 1
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def run_once(pdf: str, workers: int, rate: float, specs: Optional[List[str]], work_dir: str,
+             server: Optional[HanspellStandIn] = None, extra: Optional[List[str]] = None,
+             kss_backend: str = "punct", verbose: bool = False, scheduling: str = "lanes") -> Dict:
+    """설정 하나로 run.main() 을 실행하고 측정값 반환."""
+    out_dir = tempfile.mkdtemp(prefix="out_", dir=work_dir)
+    argv = ["run.py", pdf, "--out-dir", out_dir, "--format", "csv",
+            "--workers", str(workers), "--hanspell-rate", str(int(rate)), "--scheduling", scheduling,
+            "--kss-backend", kss_backend, "--kss-workers", "1",
+            "--extract-cache", os.path.join(work_dir, "extract_cache.sqlite3")]
+    if server is not None:
+        argv += ["--hanspell", "--hanspell-backend", "async", "--hanspell-endpoint", server.url]
+    argv += extra or []
+
+    probe = _Probe()
+    original = {name: getattr(run, name)
+                for name in ("build_checkers", "check_sentences", "DedupIndex", "LaneScheduler")}
+
+    def build_checkers(args):
+        # 대역 서버를 쓰면 hanspell 만 실제 비동기 백엔드로, 나머지는 가짜 검사기
+        fakes = build_fakes(specs, rate)
+        if server is None:
+            return fakes
+        return original["build_checkers"](args) + [c for c in fakes if c.name != "hanspell"]
+
+    run.build_checkers = build_checkers
+    run.check_sentences = probe.check_sentences(original["check_sentences"])
+    run.DedupIndex = probe.dedup_class()
+    run.LaneScheduler = probe.scheduler_class()
+    cwd = os.getcwd()
+    saved_argv = sys.argv
+    try:
+        # 검사기 캐시 파일이 저장소에 남지 않도록 작업 디렉토리에서 실행
+        os.chdir(out_dir)
+        sys.argv = argv
+        sink = sys.stdout if verbose else open(os.devnull, "w", encoding="utf-8")
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            run.main()
+        wall = time.perf_counter() - start
+        if not verbose:
+            sink.close()
+    finally:
+        sys.argv = saved_argv
+        os.chdir(cwd)
+        for name, value in original.items():
+            setattr(run, name, value)
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    return {
+        "workers": workers,
+        "rate": rate,
+        "scheduling": scheduling,
+        "sentences": probe.sentences,
+        "wall": wall,
+        "throughput": probe.sentences / wall if wall else 0.0,
+        "p50": percentile(probe.latencies, 50),
+        "p99": percentile(probe.latencies, 99),
+        "utilization": probe.utilization(workers, wall),
+    }
+
+
+def _numbers(text: str, cast=float) -> List:
+    return [cast(v) for v in text.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검사 오케스트레이션 벤치마크")
+    parser.add_argument("--pdf", help="측정할 PDF (없으면 합성 PDF 생성)")
+    parser.add_argument("--pages", type=int, default=30, help="합성 PDF 페이지 수")
+    parser.add_argument("--sentences", type=int, default=20, help="합성 PDF 페이지당 문장 수")
+    parser.add_argument("--workers", default="1,4,8", help="비교할 --workers 값 (쉼표 구분)")
+    parser.add_argument("--rates", default="20", help="비교할 Hanspell 초당 요청 수 (정수, 쉼표 구분)")
+    parser.add_argument("--scheduling", default="lanes", help="비교할 실행 방식 (lanes, shared, 쉼표 구분)")
+    parser.add_argument("--fake", action="append", metavar="SPEC",
+                        help="가짜 검사기 스펙 (반복 가능, 예: hanspell,latency=lognormal,mean=0.08,error=0.01)")
+    parser.add_argument("--hanspell-server", action="store_true",
+                        help="hanspell 은 가짜 검사기 대신 로컬 대역 서버 + 비동기 백엔드 사용")
+    parser.add_argument("--server-latency", type=float, default=0.08, help="대역 서버 평균 지연(초)")
+    parser.add_argument("--server-error", type=float, default=0.0, help="대역 서버 500 응답 비율")
+    parser.add_argument("--server-max-rate", type=float, default=0.0, help="대역 서버 허용 초당 요청 수")
+    parser.add_argument("--kss-backend", default="punct", help="문장 분리 백엔드 (기본 punct: 분리 비용 최소화)")
+    parser.add_argument("--verbose", action="store_true", help="run.py 출력 표시")
+    parser.add_argument("extra", nargs=argparse.REMAINDER, help="-- 뒤에 run.py 인자 추가")
+    args = parser.parse_args()
+    extra = [a for a in args.extra if a != "--"]
+
+    work_dir = tempfile.mkdtemp(prefix="bench_")
+    server = None
+    try:
+        pdf = args.pdf or make_pdf(os.path.join(work_dir, "synthetic.pdf"), args.pages, args.sentences)
+        pdf = os.path.abspath(pdf)
+
+        # 추출 캐시 예열 (측정에서 추출 비용 제외)
+        list(extract_pages(pdf, cache=ExtractionCache(os.path.join(work_dir, "extract_cache.sqlite3"))))
+
+        if args.hanspell_server:
+            server = HanspellStandIn(latency=args.server_latency, error=args.server_error,
+                                     max_rate=args.server_max_rate).start()
+        print("검사기: " + (" | ".join(args.fake or DEFAULT_PROFILES)))
+        if server is not None:
+            print(f"hanspell: 대역 서버 {server.url} (지연 {args.server_latency}s, "
+                  f"오류 {args.server_error}, 허용 {args.server_max_rate or '무제한'}/s)")
+        print(f"{'방식':>6} {'workers':>7} {'rate':>6} {'문장':>6} {'문장/s':>8} {'p50 ms':>8} "
+              f"{'p99 ms':>8} {'사용률':>6} {'시간 s':>7}")
+        for rate in _numbers(args.rates, int):
+            for workers in _numbers(args.workers, int):
+                for scheduling in [s.strip() for s in args.scheduling.split(",") if s.strip()]:
+                    r = run_once(pdf, workers, rate, args.fake, work_dir, server, extra,
+                                 args.kss_backend, args.verbose, scheduling)
+                    print(f"{r['scheduling']:>6} {r['workers']:>7} {r['rate']:>6g} {r['sentences']:>6} "
+                          f"{r['throughput']:>8.1f} {r['p50'] * 1000:>8.1f} {r['p99'] * 1000:>8.1f} "
+                          f"{r['utilization'] * 100:>5.0f}% {r['wall']:>7.2f}")
+    finally:
+        if server is not None:
+            server.shutdown()
+            print(f"대역 서버: 요청 {server.requests}건, 429 {server.throttled}건, 500 {server.failed}건")
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
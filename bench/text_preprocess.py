@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TextPreprocessor 마이크로벤치마크
+normalize_text + visible_korean_ratio 조합과 처리량을 비교하고, 결과가 같은지 확인합니다.
+
+사용법:
+    python -m bench.text_preprocess [--pdf 경로] [--pages 200] [--repeat 5]
+"""
+
+import argparse
+import random
+import time
+
+from utils.text import TextPreprocessor, normalize_text, visible_korean_ratio
+
+_WORDS = ["프로젝트", "관리", "일정", "범위", "품질", "위험", "이해관계자", "의사소통",
+          "계획", "실행", "감시", "통제", "종료", "PMBOK", "WBS", "2024년", "5월"]
+_NOISE = ["­", "​", "﻿", "\t", " ", "  ", "\n\n", "\x0c"]
+
+
+def synthetic_pages(count: int, chars: int = 3000, seed: int = 0):
+    """잡음 문자가 섞인 페이지 크기 한국어 텍스트 생성."""
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(count):
+        parts = []
+        size = 0
+        while size < chars:
+            word = rng.choice(_WORDS)
+            if rng.random() < 0.1:
+                word += rng.choice(_NOISE)
+            parts.append(word)
+            size += len(word) + 1
+            if rng.random() < 0.08:
+                parts.append("다.\n")
+        pages.append(" ".join(parts))
+    return pages
+
+
+def pdf_pages(path: str):
+    from utils.pdf import extract_pages
+    return [text for _, text, _ in extract_pages(path)]
+
+
+def legacy(text: str):
+    normalized = normalize_text(text)
+    return normalized, visible_korean_ratio(normalized)
+
+
+def bench(label: str, fn, pages, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in pages:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    total_chars = sum(len(p) for p in pages)
+    print(f"{label:<28} {best * 1000:9.2f} ms  {total_chars / best / 1e6:7.2f} M chars/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TextPreprocessor 마이크로벤치마크")
+    parser.add_argument("--pdf", help="실제 PDF에서 페이지 텍스트를 가져와 측정")
+    parser.add_argument("--pages", type=int, default=200, help="합성 페이지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    pages = pdf_pages(args.pdf) if args.pdf else synthetic_pages(args.pages)
+    pre = TextPreprocessor()
+
+    # 결과 동일성 확인
+    for text in pages:
+        normalized, ratio = legacy(text)
+        prepared = pre.process(text)
+        assert prepared.text == normalized, "정규화 결과 불일치"
+        assert abs(prepared.korean_ratio - ratio) < 1e-12, "한글 비율 불일치"
+
+    print(f"페이지 {len(pages)}개, 평균 {sum(map(len, pages)) // max(len(pages), 1)}자")
+    old = bench("normalize_text + ratio", legacy, pages, args.repeat)
+    new = bench("TextPreprocessor.process", pre.process, pages, args.repeat)
+    print(f"속도 향상: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사 결과 캐시 관리 도구
+캐시 통계 확인, 최소 형태로 압축, 내보내기/가져오기(여러 검수자 캐시 병합),
+마감 전 말뭉치로 캐시 예열을 합니다.
+
+사용법:
+    python cache_tool.py stats
+    python cache_tool.py compact
+    python cache_tool.py export shared.jsonl.gz [--namespace hanspell]
+    python cache_tool.py import a.jsonl.gz b_cache.sqlite3
+    python cache_tool.py prewarm 문서1.pdf 문장.txt --checkers hanspell,spacing [--time-limit 600]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from utils.cache import (DEFAULT_CACHE_PATH, cache_stats, compact, export_entries, file_size,
+                         merge_entries)
+
+
+def current_versions():
+    """namespace → 현재 코드의 캐시 버전 (compact 가 예전 버전을 지울 때 사용)."""
+    from checkers.hanspell_checker import HanspellChecker
+    from checkers.language_tool_checker import LanguageToolChecker
+    from checkers.spacing_checker import SpacingChecker
+    from utils.pdf import _EXTRACT_CACHE_VERSION
+    return {
+        HanspellChecker.name: HanspellChecker.version,
+        SpacingChecker.name: SpacingChecker.version,
+        LanguageToolChecker.name: LanguageToolChecker.version,
+        "extract": str(_EXTRACT_CACHE_VERSION),
+    }
+
+
+def _size(n: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f}{unit}" if unit == "B" else f"{n:.1f}{unit}"
+        n /= 1024.0
+
+
+def cmd_stats(args):
+    if not os.path.exists(args.cache_path):
+        print(f"캐시 파일 없음: {args.cache_path}")
+        return
+    versions = current_versions()
+    print(f"캐시: {args.cache_path} ({_size(file_size(args.cache_path))})")
+    print(f"{'namespace':<12} {'ver':>4} {'항목':>8} {'크기':>9} {'적중률':>7} {'적중':>8} {'실패':>8}  최근 갱신")
+    for row in cache_stats(args.cache_path):
+        lookups = row["hits"] + row["misses"]
+        rate = f"{row['hits'] / lookups * 100:.1f}%" if lookups else "-"
+        stale = "" if versions.get(row["namespace"], row["version"]) == row["version"] else " (예전 버전)"
+        newest = datetime.fromtimestamp(row["newest"]).strftime("%Y-%m-%d %H:%M")
+        print(f"{row['namespace']:<12} {row['version']:>4} {row['entries']:>8} {_size(row['bytes']):>9} "
+              f"{rate:>7} {row['hits']:>8} {row['misses']:>8}  {newest}{stale}")
+
+
+def cmd_compact(args):
+    result = compact(args.cache_path, None if args.keep_stale else current_versions())
+    print(f"최소 형태로 변환 {result['rewritten']}건, 예전 버전 삭제 {result['dropped']}건")
+    print(f"크기: {_size(result['before'])} → {_size(result['after'])}")
+
+
+def cmd_export(args):
+    count = export_entries(args.cache_path, args.out, args.namespace)
+    print(f"{count}건 내보냄: {args.out}")
+
+
+def cmd_import(args):
+    result = merge_entries(args.cache_path, args.sources)
+    print(f"{result['read']}건 읽음, {result['written']}건 반영 (같은 키는 최근 항목 우선)")
+
+
+def corpus_sentences(paths, args):
+    """말뭉치 파일에서 run.py 와 같은 규칙으로 검사 대상 문장 추출 (중복 제거, 순서 유지)."""
+    import run
+    from utils.pdf import extract_pages, find_running_lines
+    from utils.text import SentenceSplitter
+
+    splitter = SentenceSplitter(backend=args.kss_backend)
+    seen = {}
+    for path in paths:
+        if path.lower().endswith(".pdf"):
+            # run.py 와 같은 전처리를 거쳐야 캐시 키(문장)가 실제 실행과 일치한다
+            running_lines = set() if args.keep_running_lines else find_running_lines(
+                path, band=args.running_band, min_pages=args.running_min_pages)
+            pages = list(extract_pages(path))
+            for sentences in run.prepare_pages(pages, args, splitter, running_lines):
+                for sentence in sentences:
+                    seen.setdefault(sentence, None)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if len(line) >= args.min_length:
+                        seen.setdefault(line, None)
+    return list(seen)
+
+
+def build_prewarm_checkers(args):
+    checkers = []
+    from checkers.hanspell_async import DEFAULT_ENDPOINT
+    args.hanspell_endpoint = args.hanspell_endpoint or DEFAULT_ENDPOINT
+    for name in args.checkers.split(","):
+        name = name.strip()
+        if name == "hanspell":
+            if args.hanspell_backend == "async":
+                from checkers.hanspell_async import AsyncHanspellChecker
+                checkers.append(AsyncHanspellChecker(rate_limit_per_sec=args.hanspell_rate,
+                                                     endpoint=args.hanspell_endpoint,
+                                                     cache_file=args.cache_path))
+            else:
+                from checkers.hanspell_checker import HanspellChecker
+                checkers.append(HanspellChecker(rate_limit_per_sec=args.hanspell_rate,
+                                                cache_file=args.cache_path))
+        elif name == "spacing":
+            from checkers.spacing_checker import SpacingChecker
+            checkers.append(SpacingChecker(cache_file=args.cache_path))
+        elif name == "languagetool":
+            from checkers.language_tool_checker import LanguageToolChecker
+            checkers.append(LanguageToolChecker(cache_file=args.cache_path))
+        elif name:
+            print(f"경고: 캐시를 쓰지 않는 검사기는 예열할 수 없습니다: {name}")
+    return checkers
+
+
+def cmd_prewarm(args):
+    sentences = corpus_sentences(args.corpus, args)
+    print(f"말뭉치 문장 {len(sentences)}개")
+    deadline = time.monotonic() + args.time_limit if args.time_limit else None
+
+    for checker in build_prewarm_checkers(args):
+        todo = [s for s in sentences if checker.cache.get(s) is None]
+        print(f"{checker.name}: 캐시 없음 {len(todo)}개 예열 시작")
+        done = failed = 0
+        batches = [todo[i:i + args.batch_size] for i in range(0, len(todo), args.batch_size)]
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            # 제한 시간을 지키도록 작업자 수의 두 배까지만 미리 제출
+            pending = {}
+            while batches or pending:
+                while batches and len(pending) < args.workers * 2 and (
+                        deadline is None or time.monotonic() < deadline):
+                    batch = batches.pop(0)
+                    pending[executor.submit(checker.check_batch, batch)] = batch
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    batch = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        print(f"  배치 실패: {e}")
+                        failed += len(batch)
+                        continue
+                    for result in results:
+                        if "error" in (result.get("meta") or {}):
+                            failed += 1
+                        else:
+                            done += 1
+        # 예열 조회는 실제 실행 적중률에 넣지 않는다
+        checker.cache.hits = checker.cache.misses = 0
+        checker.shutdown()
+        skipped = len(todo) - done - failed
+        print(f"{checker.name}: 예열 {done}개, 실패 {failed}개" + (f", 시간 초과로 건너뜀 {skipped}개" if skipped else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검사 결과 캐시 관리 도구")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH, help="캐시 SQLite 파일 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="namespace별 항목 수, 크기, 누적 적중률")
+
+    p = sub.add_parser("compact", help="검사 결과를 최소 형태로 줄이고 예전 버전 항목 삭제")
+    p.add_argument("--keep-stale", action="store_true", help="예전 버전 항목을 지우지 않음")
+
+    p = sub.add_parser("export", help="JSON Lines(.gz)로 내보내기")
+    p.add_argument("out", help="출력 파일 (.jsonl 또는 .jsonl.gz)")
+    p.add_argument("--namespace", action="append", help="내보낼 namespace (반복 가능, 기본: 전체)")
+
+    p = sub.add_parser("import", help="다른 캐시(SQLite 또는 JSON Lines) 병합")
+    p.add_argument("sources", nargs="+", help="가져올 캐시 파일들")
+
+    p = sub.add_parser("prewarm", help="말뭉치(PDF 또는 한 줄에 한 문장인 텍스트)로 캐시 예열")
+    p.add_argument("corpus", nargs="+", help="PDF 또는 텍스트 파일")
+    p.add_argument("--checkers", default="hanspell,spacing", help="예열할 검사기 (쉼표 구분)")
+    p.add_argument("--workers", type=int, default=4, help="동시 작업자 수")
+    p.add_argument("--batch-size", type=int, default=8, help="check_batch 한 번에 넘기는 문장 수")
+    p.add_argument("--time-limit", type=float, default=0, help="예열 제한 시간(초, 0이면 제한 없음)")
+    p.add_argument("--hanspell-rate", type=int, default=5, help="Hanspell 초당 요청 수")
+    p.add_argument("--hanspell-backend", choices=["sync", "async"], default="sync", help="Hanspell 호출 방식")
+    p.add_argument("--hanspell-endpoint", default=None, help="async 백엔드 맞춤법 API 주소")
+    p.add_argument("--kss-backend", default="auto", help="kss 형태소 분석 백엔드")
+    p.add_argument("--korean-ratio", type=float, default=0.3, help="한글 비율 최소값 (run.py 와 같게)")
+    p.add_argument("--min-length", type=int, default=10, help="최소 문장 길이 (run.py 와 같게)")
+    p.add_argument("--keep-running-lines", action="store_true", help="반복 머리글/바닥글을 지우지 않음 (run.py 와 같게)")
+    p.add_argument("--running-band", type=float, default=0.1, help="머리글/바닥글 영역 비율 (run.py 와 같게)")
+    p.add_argument("--running-min-pages", type=int, default=3, help="반복 줄 최소 페이지 수 (run.py 와 같게)")
+    p.add_argument("--running-edge-lines", type=int, default=3,
+                   help="위·아래에서 지울 수 있는 최대 반복 줄 수 (run.py 와 같게)")
+
+    args = parser.parse_args()
+    {"stats": cmd_stats, "compact": cmd_compact, "export": cmd_export,
+     "import": cmd_import, "prewarm": cmd_prewarm}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
-from typing import Dict
+from typing import Dict, List, Tuple
+from utils.whitelist import mask_correction, mask_hits
 
 class BaseChecker:
     """검사기 베이스 클래스."""
     name = "base"
+    # 결과 형식/판정 로직이 바뀌면 올린다 (캐시 키에 포함)
+    version = "1"
+    # 문장당 상대 비용 (실행 계획에서 싼 검사기를 먼저 돌리고 절약한 비용을 계산할 때 사용)
+    cost = 1.0
+    # 실행 레인 종류 (thread, process, async)와 I/O 대기 위주인지 (thread 레인 동시성 한도 선택)
+    lane = "thread"
+    io_bound = False
 
     def check(self, sentence: str) -> Dict:
         """
@@ -16,6 +24,44 @@ class BaseChecker:
         """
         return {"flag": False}
 
+    def check_batch(self, sentences: List[str]) -> List[Dict]:
+        """
+        여러 문장을 한 번에 검사. 반환 리스트는 입력 순서와 같다.
+        기본 구현은 check를 차례로 호출하며, 호출당 고정 비용(모델 추론, HTTP 왕복,
+        JVM 호출)을 묶어서 줄일 수 있는 검사기는 재정의한다.
+        """
+        return [self.check(sentence) for sentence in sentences]
+
+    def apply_whitelist(self, sentence: str, result: Dict, spans: List[Tuple[int, int]]) -> Dict:
+        """
+        화이트리스트 구간(spans)과 겹치는 지적을 걸러낸 결과 (캐시된 원래 결과는 건드리지 않는다).
+        기본 구현은 문장 전체 교정안(suggestion)에서 화이트리스트 구간을 고친 부분만 원문대로 되돌리고,
+        위치(spans)가 있는 hit 은 겹치는 매칭을 뺀다. 남는 지적이 없으면 플래그를 내린다.
+        """
+        if not spans or not result.get("flag"):
+            return result
+        meta = result.get("meta") or {}
+
+        suggestion = result.get("suggestion")
+        if isinstance(suggestion, str):
+            masked = mask_correction(sentence, suggestion, spans)
+            if masked == suggestion:
+                return result
+            meta = dict(meta, whitelisted=True)
+            if masked == sentence:
+                return {"flag": False, "meta": meta}
+            return dict(result, suggestion=masked, meta=meta)
+
+        if isinstance(meta.get("hits"), list):
+            hits = mask_hits(meta["hits"], spans)
+            if hits == meta["hits"]:
+                return result
+            meta = dict(meta, hits=hits, whitelisted=True)
+            if not hits:
+                return {"flag": False, "meta": meta}
+            return dict(result, suggestions=hits, meta=meta)
+        return result
+
     def shutdown(self):
         """필요 시 리소스 정리."""
         pass
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import html
+import json
+import re
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+from .base import BaseChecker
+from .hanspell_checker import make_error, make_response
+from utils.cache import DEFAULT_CACHE_PATH, ResultCache
+from utils.ratelimit import AdaptiveRateLimiter, CircuitBreaker, RetryQueue
+
+# py-hanspell이 사용하는 네이버 맞춤법 검사 엔드포인트
+DEFAULT_ENDPOINT = "https://m.search.naver.com/p/csearch/ocontent/util/SpellerProxy"
+
+# 네이버 검사기가 한 번에 받는 최대 글자 수
+MAX_TEXT_LENGTH = 500
+
+_HEADERS = {
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "referer": "https://search.naver.com/",
+}
+
+_TAG = re.compile(r"<[^>]+>")
+
+
+class AsyncHanspellChecker(BaseChecker):
+    """
+    asyncio + aiohttp 연결 풀 기반 Hanspell 검사기.
+    전용 이벤트 루프 스레드 하나에서 keep-alive 연결로 여러 요청을 동시에 보내며,
+    요청마다 스레드를 점유하지 않는다. 속도 제한/차단기/재시도 대기열은 동기 백엔드와 같다.
+    """
+    name = "hanspell"
+    # 원격 API (요청 수 제한, 왕복 지연)
+    cost = 50.0
+    # 이벤트 루프에 바로 예약 (aiohttp 가 없으면 thread 레인으로)
+    lane = "async"
+    io_bound = True
+
+    def __init__(self, rate_limit_per_sec: int = 5, cache_file: str = DEFAULT_CACHE_PATH,
+                 endpoint: str = DEFAULT_ENDPOINT, max_in_flight: int = 16,
+                 params: Optional[Dict[str, str]] = None, timeout: float = 10.0,
+                 max_rate_per_sec: Optional[float] = None, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0):
+        self.limiter = AdaptiveRateLimiter(max(rate_limit_per_sec, 1), max_rate=max_rate_per_sec)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.deferred = RetryQueue()
+        self.endpoint = endpoint
+        self.max_in_flight = max(1, max_in_flight)
+        self.params = dict(params or {})
+        self.timeout = timeout
+        self.cache_file = cache_file
+        self.cache = ResultCache(cache_file, self.name, self.version)
+        self.cache.migrate_json("hanspell_cache.json")
+
+        # aiohttp 모듈 import 시도
+        try:
+            import aiohttp  # type: ignore
+            self._aiohttp = aiohttp
+            self._available = True
+        except ImportError:
+            print("경고: aiohttp 모듈을 찾을 수 없습니다. pip install aiohttp")
+            self._available = False
+            self.lane = "thread"
+            return
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="hanspell-async", daemon=True)
+        self._thread.start()
+        self._call(self._open()).result()
+
+    async def _open(self):
+        """이벤트 루프 안에서 세션/동시성 제한 준비."""
+        connector = self._aiohttp.TCPConnector(limit=self.max_in_flight, keepalive_timeout=30)
+        self._session = self._aiohttp.ClientSession(
+            connector=connector,
+            headers=_HEADERS,
+            timeout=self._aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    def _call(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def check(self, sentence: str) -> Dict:
+        """문장을 검사하여 맞춤법 오류를 찾습니다."""
+        return self.check_batch([sentence])[0]
+
+    def check_batch(self, sentences: List[str]) -> List[Dict]:
+        """문장 묶음을 한 번에 동시 요청으로 검사합니다."""
+        if not self._available:
+            return [{"flag": False, "meta": {"error": "aiohttp 모듈 없음"}} for _ in sentences]
+        futures = [self.submit_async(sentence) for sentence in sentences]
+        return [future.result() for future in futures]
+
+    def submit_async(self, sentence: str) -> Future:
+        """스레드를 점유하지 않고 검사를 예약, 결과 Future 반환."""
+        cached = self.cache.get(sentence)
+        if cached is not None:
+            future: Future = Future()
+            future.set_result(cached)
+            return future
+        return self._call(self._check_one(sentence))
+
+    async def _check_one(self, sentence: str) -> Dict:
+        if len(sentence) > MAX_TEXT_LENGTH:
+            return {"flag": False, "meta": {"error": f"{MAX_TEXT_LENGTH}자 초과"}}
+
+        async with self._slots:
+            # 장애 중이면 호출하지 않고 재시도 대기열로
+            if not self.breaker.allow():
+                return make_error(sentence, "circuit open", self.deferred)
+
+            # 토큰 예약은 잠금 없이 즉시 끝나고, 대기는 이벤트 루프에서
+            delay = self.limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                corrected = await self._request(sentence)
+            except Exception as e:
+                self.limiter.on_failure()
+                self.breaker.record_failure()
+                return make_error(sentence, str(e), self.deferred)
+
+        self.limiter.on_success()
+        self.breaker.record_success()
+        response = make_response(sentence, corrected)
+        self.cache.set(sentence, response)
+        return response
+
+    async def _request(self, sentence: str) -> str:
+        """엔드포인트 호출 후 교정문 추출."""
+        params = {"color_blindness": "0", "q": sentence}
+        params.update(self.params)
+        async with self._session.get(self.endpoint, params=params) as resp:
+            resp.raise_for_status()
+            body = await resp.text()
+        return parse_corrected(body)
+
+    def retry_deferred(self, rounds: int = 3) -> Dict[str, Dict]:
+        """실패했던 문장을 다시 검사하고 {문장: 결과} 반환 (성공한 문장만)."""
+        return self.deferred.drain(self.check_batch, self.breaker, rounds)
+
+    def shutdown(self):
+        """캐시를 파일에 저장하고 연결 풀/이벤트 루프 종료."""
+        self.cache.close()
+        if not self._available:
+            return
+        try:
+            self._call(self._session.close()).result(timeout=5)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+def parse_corrected(body: str) -> str:
+    """
+    네이버 맞춤법 응답(JSON 또는 JSONP)에서 태그 없는 교정문을 꺼냅니다.
+    """
+    body = body.strip()
+    if not body.startswith("{"):
+        # JSONP: callback({...});
+        body = body[body.index("(") + 1:body.rindex(")")]
+    result = json.loads(body)["message"]["result"]
+    if "notag_html" in result:
+        text = result["notag_html"]
+    else:
+        text = _TAG.sub("", result["html"].replace("<br>", "\n"))
+    return html.unescape(text)
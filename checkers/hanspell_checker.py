@@ -1,19 +1,51 @@
 # -*- coding: utf-8 -*-
 import time
-import json
-import os
 from typing import Dict, Optional
 from .base import BaseChecker
+from utils.cache import DEFAULT_CACHE_PATH, ResultCache
+from utils.ratelimit import AdaptiveRateLimiter, CircuitBreaker, RetryQueue
+
+def make_response(sentence: str, corrected: str) -> Dict:
+    """원문과 교정문을 비교해 검사 결과 생성."""
+    flag = corrected != sentence
+    return {
+        "flag": flag,
+        "suggestion": corrected if flag else None,
+        "meta": {
+            "original": sentence,
+            "corrected": corrected,
+            "timestamp": time.time()
+        }
+    }
+
+def make_error(sentence: str, error: str, retry_queue: Optional[RetryQueue] = None) -> Dict:
+    """API 호출 실패 결과 생성 (retry_queue가 있으면 재시도 대기열에 넣고 deferred 표시)."""
+    meta = {"error": error}
+    if retry_queue is not None:
+        retry_queue.add(sentence)
+        meta["deferred"] = True
+    return {"flag": False, "meta": meta}
 
 class HanspellChecker(BaseChecker):
-    """Hanspell API 기반 맞춤법 검사기."""
+    """
+    Hanspell API 기반 맞춤법 검사기.
+    모든 스레드가 적응형 토큰 버킷 하나를 공유하고, 연속 실패 시 차단기가 호출을 멈춘다.
+    실패한 문장은 retry_deferred()에서 다시 검사한다.
+    """
     name = "hanspell"
+    # 원격 API (요청 수 제한, 왕복 지연)
+    cost = 50.0
+    io_bound = True
     
-    def __init__(self, rate_limit_per_sec: int = 5, cache_file: str = "hanspell_cache.json"):
-        self.min_interval = 1.0 / max(rate_limit_per_sec, 1)
-        self._last_request = 0.0
+    def __init__(self, rate_limit_per_sec: int = 5, cache_file: str = DEFAULT_CACHE_PATH,
+                 max_rate_per_sec: Optional[float] = None, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0):
+        self.limiter = AdaptiveRateLimiter(max(rate_limit_per_sec, 1), max_rate=max_rate_per_sec)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.deferred = RetryQueue()
         self.cache_file = cache_file
-        self.cache = self._JsonCache(cache_file)
+        self.cache = ResultCache(cache_file, self.name, self.version)
+        self.cache.migrate_json("hanspell_cache.json")
         
         # hanspell 모듈 import 시도
         try:
@@ -34,8 +66,12 @@ class HanspellChecker(BaseChecker):
         if cached is not None:
             return cached
         
-        # 레이트 리미팅
-        self._rate_limit()
+        # 장애 중이면 호출하지 않고 재시도 대기열로
+        if not self.breaker.allow():
+            return make_error(sentence, "circuit open", self.deferred)
+        
+        # 레이트 리미팅 (스레드 공유 토큰 버킷)
+        self.limiter.acquire()
         
         try:
             result = self.spell_checker.check(sentence)
@@ -47,72 +83,25 @@ class HanspellChecker(BaseChecker):
                 corrected = result.result
             else:
                 corrected = str(result)
-            
-            # 원문과 교정문 비교
-            flag = corrected != sentence
-            
-            response = {
-                "flag": flag,
-                "suggestion": corrected if flag else None,
-                "meta": {
-                    "original": sentence,
-                    "corrected": corrected,
-                    "timestamp": time.time()
-                }
-            }
-            
-            # 캐시에 저장
-            self.cache.set(sentence, response)
-            
-            return response
-            
         except Exception as e:
-            return {
-                "flag": False, 
-                "meta": {"error": str(e)}
-            }
+            # 스로틀/오류: 속도를 낮추고 나중에 다시 검사
+            self.limiter.on_failure()
+            self.breaker.record_failure()
+            return make_error(sentence, str(e), self.deferred)
+        
+        self.limiter.on_success()
+        self.breaker.record_success()
+        response = make_response(sentence, corrected)
+        
+        # 캐시에 저장
+        self.cache.set(sentence, response)
+        
+        return response
     
-    def _rate_limit(self):
-        """API 호출 속도 제한."""
-        now = time.time()
-        wait_time = self.min_interval - (now - self._last_request)
-        if wait_time > 0:
-            time.sleep(wait_time)
-        self._last_request = time.time()
+    def retry_deferred(self, rounds: int = 3) -> Dict[str, Dict]:
+        """실패했던 문장을 다시 검사하고 {문장: 결과} 반환 (성공한 문장만)."""
+        return self.deferred.drain(self.check_batch, self.breaker, rounds)
     
     def shutdown(self):
         """캐시를 파일에 저장."""
-        self.cache.flush()
-    
-    class _JsonCache:
-        """JSON 파일 기반 캐시."""
-        
-        def __init__(self, filename: str):
-            self.filename = filename
-            self.data = {}
-            self._load()
-        
-        def _load(self):
-            """캐시 파일 로드."""
-            try:
-                if os.path.exists(self.filename):
-                    with open(self.filename, 'r', encoding='utf-8') as f:
-                        self.data = json.load(f)
-            except Exception:
-                self.data = {}
-        
-        def get(self, key: str) -> Optional[Dict]:
-            """캐시에서 값 조회."""
-            return self.data.get(key)
-        
-        def set(self, key: str, value: Dict):
-            """캐시에 값 저장."""
-            self.data[key] = value
-        
-        def flush(self):
-            """캐시를 파일에 저장."""
-            try:
-                with open(self.filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.data, f, ensure_ascii=False, indent=2)
-            except Exception:
-                pass
+        self.cache.close()
@@ -1,42 +1,228 @@
 # -*- coding: utf-8 -*-
-from typing import Dict
+import threading
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from .base import BaseChecker
+from utils.cache import DEFAULT_CACHE_PATH, ResultCache
+from utils.whitelist import overlaps
+
+# 문장 사이 구분자 (빈 줄 = 문단 경계라서 문장끼리 붙어 하나의 문장으로 검사되지 않는다)
+_SEPARATOR = "\n\n"
 
 class LanguageToolChecker(BaseChecker):
-    """LanguageTool 기반 맞춤법/문법 검사기."""
+    """
+    LanguageTool 기반 맞춤법/문법 검사기.
+    여러 문장을 한 요청 텍스트로 이어 붙여 검사하고, Match 오프셋으로 문장별 결과를 나눈다.
+    instances 개의 로컬 서버(JVM)를 띄우거나 servers 주소의 서버들에 붙어 요청을 나눠 보낸다.
+    """
     name = "languagetool"
+    # JVM 서버 왕복
+    cost = 20.0
+    io_bound = True
+    # 2: meta 에 Match 별 위치(matches) 추가
+    version = "2"
 
-    def __init__(self):
+    def __init__(self, cache_file: str = DEFAULT_CACHE_PATH, max_chars: int = 20000,
+                 instances: int = 1, servers: Optional[List[str]] = None):
+        self.cache_file = cache_file
+        self.cache = ResultCache(cache_file, self.name, self.version)
+        # 요청 한 번에 보내는 최대 글자 수
+        self.max_chars = max_chars
         try:
             import language_tool_python  # type: ignore
-            self.tool = language_tool_python.LanguageTool('ko')
+            if servers:
+                factories = [lambda url=url: language_tool_python.LanguageTool('ko', remote_server=url)
+                             for url in servers]
+            else:
+                factories = [lambda: language_tool_python.LanguageTool('ko')] * max(1, instances)
+            self.pool = _ToolPool(factories)
             self._available = True
         except Exception as e:
             print(f"경고: LanguageTool 초기화 실패: {e}")
             self._available = False
-            self.tool = None
+            self.pool = None
+
+    @property
+    def tool(self):
+        """첫 번째 인스턴스 (단일 인스턴스 호환용)."""
+        return self.pool.tools[0] if self.pool else None
 
     def check(self, sentence: str) -> Dict:
-        if not self._available or self.tool is None:
-            return {"flag": False, "meta": {"error": "languagetool 모듈 없음"}}
+        return self.check_batch([sentence])[0]
+
+    def check_batch(self, sentences: List[str]) -> List[Dict]:
+        """문장 묶음을 max_chars 단위 요청 몇 번으로 검사."""
+        if not self._available or self.pool is None:
+            return [{"flag": False, "meta": {"error": "languagetool 모듈 없음"}} for _ in sentences]
+
+        # 캐시 확인
+        results: List[Dict] = [self.cache.get(sentence) for sentence in sentences]
+        todo = [i for i, result in enumerate(results) if result is None]
+
+        for chunk in self._chunks(todo, sentences):
+            targets = [sentences[i] for i in chunk]
+            try:
+                checked = self._check_joined(targets)
+            except Exception as e:
+                checked = [{"flag": False, "meta": {"error": str(e)}} for _ in targets]
+                for i, result in zip(chunk, checked):
+                    results[i] = result
+                continue
+            for i, result in zip(chunk, checked):
+                results[i] = result
+                self.cache.set(sentences[i], result)
+        return results
 
-        matches = self.tool.check(sentence)
-        if not matches:
-            return {"flag": False}
+    def _chunks(self, indices: List[int], sentences: List[str]) -> List[List[int]]:
+        chunks: List[List[int]] = []
+        size = 0
+        for i in indices:
+            length = len(sentences[i]) + len(_SEPARATOR)
+            if not chunks or size + length > self.max_chars:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(i)
+            size += length
+        return chunks
 
-        suggestions = []
-        for m in matches:
-            if m.replacements:
-                suggestions.append(m.replacements[0])
+    def _check_joined(self, sentences: List[str]) -> List[Dict]:
+        """이어 붙인 텍스트를 한 번 검사하고 Match 를 시작 오프셋이 속한 문장에 배정."""
+        starts = []
+        pos = 0
+        for sentence in sentences:
+            starts.append(pos)
+            pos += len(sentence) + len(_SEPARATOR)
+
+        per_sentence: List[list] = [[] for _ in sentences]
+        for m in self.pool.check(_SEPARATOR.join(sentences)):
+            i = bisect_right(starts, m.offset) - 1
+            # 구분자 위치에서 난 Match (문단 경계 공백 규칙 등)는 버린다
+            if i < 0 or m.offset >= starts[i] + len(sentences[i]):
+                continue
+            per_sentence[i].append(m)
+        return [_to_result(matches, start) for matches, start in zip(per_sentence, starts)]
+
+    def apply_whitelist(self, sentence: str, result: Dict, spans: List[Tuple[int, int]]) -> Dict:
+        """화이트리스트 구간과 겹치는 Match 만 빼고 결과를 다시 만든다."""
+        matches = (result.get("meta") or {}).get("matches")
+        if not spans or not result.get("flag") or not matches:
+            return result
+        kept = [m for m in matches if not overlaps(m["span"][0], m["span"][1], spans)]
+        if len(kept) == len(matches):
+            return result
+        if not kept:
+            return {"flag": False, "meta": {"match_count": 0, "matches": [], "whitelisted": True}}
         return {
             "flag": True,
-            "suggestions": suggestions,
-            "meta": {"match_count": len(matches)}
+            "suggestions": [m["suggestion"] for m in kept if m["suggestion"] is not None],
+            "meta": {"match_count": len(kept), "matches": kept, "whitelisted": True}
         }
 
     def shutdown(self):
+        self.cache.close()
+        if self.pool:
+            self.pool.close()
+
+
+class _ToolPool:
+    """
+    LanguageTool 인스턴스 풀. 진행 중인 요청이 가장 적은 정상 인스턴스로 보내고,
+    연속 max_failures 회 실패한 인스턴스는 닫고 새로 띄운다 (원격 서버면 클라이언트만 다시 만든다).
+    """
+
+    def __init__(self, factories: List[Callable], max_failures: int = 2):
+        self.factories = factories
+        self.max_failures = max_failures
+        self.restarts = 0
+        # JVM 기동이 느리므로 인스턴스를 동시에 띄운다
+        with ThreadPoolExecutor(max_workers=len(factories)) as executor:
+            self.tools = list(executor.map(lambda factory: factory(), factories))
+        self._in_flight = [0] * len(self.tools)
+        self._failures = [0] * len(self.tools)
+        self._restarting = [False] * len(self.tools)
+        self._lock = threading.Lock()
+
+    def check(self, text: str):
+        """가장 한가한 인스턴스로 검사 (실패하면 다른 인스턴스로 한 번 더)."""
+        tried = set()
+        while True:
+            index = self._acquire(tried)
+            try:
+                matches = self.tools[index].check(text)
+            except Exception:
+                self._release(index, ok=False)
+                tried.add(index)
+                if len(tried) >= min(2, len(self.tools)):
+                    raise
+                continue
+            self._release(index, ok=True)
+            return matches
+
+    def _acquire(self, exclude) -> int:
+        while True:
+            with self._lock:
+                candidates = [i for i in range(len(self.tools))
+                              if not self._restarting[i] and i not in exclude]
+                if candidates:
+                    index = min(candidates, key=lambda i: self._in_flight[i])
+                    self._in_flight[index] += 1
+                    return index
+            # 모두 재시작 중이면 잠시 대기
+            time.sleep(0.1)
+
+    def _release(self, index: int, ok: bool):
+        with self._lock:
+            self._in_flight[index] -= 1
+            if ok:
+                self._failures[index] = 0
+                return
+            self._failures[index] += 1
+            if self._failures[index] < self.max_failures or self._restarting[index]:
+                return
+            self._restarting[index] = True
+        threading.Thread(target=self._restart, args=(index,), daemon=True).start()
+
+    def _restart(self, index: int):
+        """비정상 인스턴스를 닫고 다시 띄운다."""
         try:
-            if self.tool:
-                self.tool.close()
+            self.tools[index].close()
         except Exception:
             pass
+        try:
+            self.tools[index] = self.factories[index]()
+            self.restarts += 1
+        except Exception as e:
+            print(f"경고: LanguageTool 인스턴스 {index} 재시작 실패: {e}")
+        finally:
+            with self._lock:
+                self._failures[index] = 0
+                self._restarting[index] = False
+
+    def close(self):
+        for tool in self.tools:
+            try:
+                tool.close()
+            except Exception:
+                pass
+
+
+def _to_result(matches, base: int = 0) -> Dict:
+    """문장 하나의 Match 목록을 검사 결과로 변환 (base: 이어 붙인 텍스트에서 문장 시작 위치)."""
+    if not matches:
+        return {"flag": False}
+
+    suggestions = []
+    located = []
+    for m in matches:
+        suggestion = m.replacements[0] if m.replacements else None
+        if suggestion is not None:
+            suggestions.append(suggestion)
+        start = m.offset - base
+        located.append({"span": [start, start + m.errorLength], "suggestion": suggestion})
+    return {
+        "flag": True,
+        "suggestions": suggestions,
+        "meta": {"match_count": len(matches), "matches": located}
+    }
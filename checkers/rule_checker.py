@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
-import re
 import yaml
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from .base import BaseChecker
+from .rule_engine import RuleEngine
+from utils.whitelist import load_whitelist, mask_hits
 
 # 기본 규칙들
 DEFAULT_RULES = [
@@ -32,29 +33,35 @@ DEFAULT_RULES = [
 class RuleChecker(BaseChecker):
     """규칙 기반 오류 검사기."""
     name = "rule"
+    # 컴파일된 정규식
+    cost = 1.0
     
     def __init__(self, rules_yaml: Optional[str] = None, whitelist_path: Optional[str] = None):
-        self.rules = self._load_rules(rules_yaml)
-        self.whitelist = self._load_whitelist(whitelist_path)
+        self._rules = self._load_rules(rules_yaml)
+        # 같은 경로의 화이트리스트는 다른 검사기 결과 후처리와 공유
+        self.whitelist = load_whitelist(whitelist_path)
+        self._compile()
+    
+    def _compile(self):
+        """규칙을 컴파일/검증 (잘못된 규칙은 여기서 한 번만 보고하고 제외)."""
+        self.engine = RuleEngine(self._rules)
+        for error in self.engine.errors:
+            print(f"경고: {error}")
+    
+    @property
+    def rules(self) -> Tuple[Dict, ...]:
+        """현재 규칙 (읽기 전용 복사본, 바꾸려면 add_rule 또는 rules 에 새 목록을 대입)."""
+        return tuple(dict(rule) if isinstance(rule, dict) else rule for rule in self._rules)
+    
+    @rules.setter
+    def rules(self, rules: List[Dict]):
+        self._rules = list(rules)
+        self._compile()
     
     def check(self, sentence: str) -> Dict:
-        """규칙에 따라 문장을 검사합니다."""
-        # 화이트리스트 체크
-        if any(term in sentence for term in self.whitelist):
-            return {"flag": False}
-        
-        hits = []
-        
-        for rule in self.rules:
-            try:
-                if re.search(rule["pattern"], sentence):
-                    hits.append({
-                        "rule": rule["name"],
-                        "hint": rule["hint"]
-                    })
-            except re.error as e:
-                print(f"규칙 '{rule['name']}'의 정규식 오류: {e}")
-                continue
+        """규칙에 따라 문장을 검사합니다. 각 hit에 매칭 위치(spans)를 담습니다."""
+        # 화이트리스트 용어와 겹치는 매칭만 제외 (문장의 다른 곳 오류는 그대로 잡는다)
+        hits = mask_hits(self.engine.search(sentence), self.whitelist.spans(sentence))
         
         return {
             "flag": bool(hits),
@@ -65,7 +72,7 @@ class RuleChecker(BaseChecker):
     def _load_rules(self, rules_yaml: Optional[str]) -> List[Dict]:
         """YAML 파일에서 규칙을 로드합니다."""
         if not rules_yaml or not os.path.exists(rules_yaml):
-            return DEFAULT_RULES
+            return list(DEFAULT_RULES)
         
         try:
             with open(rules_yaml, 'r', encoding='utf-8') as f:
@@ -75,33 +82,18 @@ class RuleChecker(BaseChecker):
         except Exception as e:
             print(f"규칙 파일 로드 실패: {e}")
         
-        return DEFAULT_RULES
-    
-    def _load_whitelist(self, whitelist_path: Optional[str]) -> set:
-        """화이트리스트 파일을 로드합니다."""
-        whitelist = set()
-        
-        if not whitelist_path or not os.path.exists(whitelist_path):
-            return whitelist
-        
-        try:
-            with open(whitelist_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    term = line.strip()
-                    if term and not term.startswith('#'):
-                        whitelist.add(term)
-        except Exception as e:
-            print(f"화이트리스트 파일 로드 실패: {e}")
-        
-        return whitelist
+        return list(DEFAULT_RULES)
     
     def add_rule(self, name: str, pattern: str, hint: str = ""):
         """새로운 규칙을 추가합니다."""
-        self.rules.append({
+        rule = {
             "name": name,
             "pattern": pattern,
             "hint": hint
-        })
+        }
+        # 엔진에 바로 추가 (잘못된 정규식은 추가 시점에 ValueError)
+        self.engine.add(rule)
+        self._rules.append(rule)
     
     def add_whitelist_term(self, term: str):
         """화이트리스트에 용어를 추가합니다."""
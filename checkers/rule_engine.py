@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+규칙 엔진: rules.yaml 의 정규식을 로드 시점에 한 번 컴파일/검증하고,
+각 규칙이 반드시 포함해야 하는 리터럴(예: '것같', '수있다')로 매칭 불가능한 규칙을 건너뛴다.
+"""
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:  # Python 3.11+
+    from re import _constants as _sre_constants, _parser as _sre_parse
+except ImportError:  # pragma: no cover - 3.10 이하
+    import sre_constants as _sre_constants  # type: ignore
+    import sre_parse as _sre_parse  # type: ignore
+
+_LITERAL = _sre_constants.LITERAL
+_SUBPATTERN = _sre_constants.SUBPATTERN
+_BRANCH = _sre_constants.BRANCH
+_REPEATS = tuple(getattr(_sre_constants, name) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+                 if hasattr(_sre_constants, name))
+_ATOMIC_GROUP = getattr(_sre_constants, "ATOMIC_GROUP", None)
+
+
+class CompiledRule(NamedTuple):
+    name: str
+    hint: str
+    regex: "re.Pattern"
+    # 이 중 하나라도 문장에 있어야 매칭 가능 (빈 튜플이면 항상 검사)
+    literals: Tuple[str, ...]
+
+
+def required_literals(pattern: str) -> Tuple[str, ...]:
+    """
+    매칭되는 모든 문자열이 포함하는 리터럴 후보 (그중 적어도 하나는 반드시 포함).
+    안전하게 구할 수 없으면(대소문자 무시 등) 빈 튜플.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return ()
+    if parsed.state.flags & re.IGNORECASE:
+        return ()
+    return tuple(_required(parsed) or ())
+
+
+def _required(items) -> Optional[List[str]]:
+    """
+    파싱된 시퀀스에서 필수 리터럴 후보 목록 (any-of) 을 구한다.
+    여러 후보가 있으면 가장 짧은 리터럴이 가장 긴 쪽 (= 가장 선택적인 쪽) 을 고른다.
+    """
+    candidates: List[List[str]] = []
+    run: List[str] = []
+
+    def flush():
+        if run:
+            candidates.append(["".join(run)])
+            run.clear()
+
+    for op, av in items:
+        if op is _LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is _SUBPATTERN:
+            add_flags = av[1]
+            if not add_flags & re.IGNORECASE:
+                candidates.append(_required(av[-1]))
+        elif op in _REPEATS:
+            low, _, body = av
+            if low >= 1:
+                candidates.append(_required(body))
+        elif op is _BRANCH:
+            alternatives: Optional[List[str]] = []
+            for branch in av[1]:
+                found = _required(branch)
+                if not found:
+                    alternatives = None
+                    break
+                alternatives.extend(found)
+            candidates.append(alternatives)
+        elif _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+            candidates.append(_required(av))
+        # 그 밖의 문자 집합, 위치 단언, 전후방 탐색 등은 리터럴을 보장하지 않는다
+    flush()
+
+    candidates = [c for c in candidates if c]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda alternatives: min(len(a) for a in alternatives))
+
+
+def compile_rules(rules: Iterable[Dict]) -> Tuple[List[CompiledRule], List[str]]:
+    """
+    규칙 목록을 검증하고 컴파일. (컴파일된 규칙, 오류 메시지 목록) 반환.
+    잘못된 규칙은 건너뛰므로 문장마다 같은 오류가 반복되지 않는다.
+    """
+    compiled: List[CompiledRule] = []
+    errors: List[str] = []
+    names = set()
+    for index, rule in enumerate(rules, 1):
+        if not isinstance(rule, dict):
+            errors.append(f"{index}번째 규칙이 name/pattern/hint 항목이 아닙니다: {rule!r}")
+            continue
+        name = rule.get("name") or f"규칙 {index}"
+        pattern = rule.get("pattern")
+        if not isinstance(pattern, str) or not pattern:
+            errors.append(f"규칙 '{name}'에 pattern이 없습니다")
+            continue
+        try:
+            regex = re.compile(pattern)
+        except re.error as e:
+            errors.append(f"규칙 '{name}'의 정규식 오류: {e}")
+            continue
+        if name in names:
+            errors.append(f"규칙 이름 중복: '{name}' (둘 다 사용)")
+        names.add(name)
+        compiled.append(CompiledRule(str(name), str(rule.get("hint") or ""), regex, required_literals(pattern)))
+    return compiled, errors
+
+
+class RuleEngine:
+    """
+    컴파일된 규칙 묶음. 문장에 들어 있는 글자로 시작하는 필수 리터럴만 확인하고,
+    필수 리터럴이 문장에 하나도 없는 규칙의 정규식은 실행하지 않는다.
+    """
+
+    def __init__(self, rules: Iterable[Dict] = ()):
+        self.rules: List[CompiledRule] = []
+        # 리터럴 → 그 리터럴이 있어야 매칭 가능한 규칙 번호, 첫 글자 → 리터럴
+        self._rules_by_literal: Dict[str, List[int]] = {}
+        self._literals_by_first: Dict[str, List[str]] = {}
+        self._unfiltered: List[int] = []
+        # 통계 (여러 스레드에서 갱신하므로 근사값): 실행한/리터럴 필터로 건너뛴 정규식 수
+        self.skipped = 0
+        self.evaluated = 0
+        compiled, self.errors = compile_rules(rules)
+        for rule in compiled:
+            self._index(rule)
+
+    def add(self, rule: Dict):
+        """규칙 하나를 컴파일해 색인에 추가. 잘못된 규칙이면 ValueError."""
+        compiled, errors = compile_rules([rule])
+        if not compiled:
+            raise ValueError(errors[0])
+        self._index(compiled[0])
+
+    def _index(self, rule: CompiledRule):
+        index = len(self.rules)
+        self.rules.append(rule)
+        if not rule.literals:
+            self._unfiltered.append(index)
+        for literal in rule.literals:
+            if literal not in self._rules_by_literal:
+                self._literals_by_first.setdefault(literal[0], []).append(literal)
+            self._rules_by_literal.setdefault(literal, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def candidates(self, sentence: str) -> List[int]:
+        """문장에 필수 리터럴이 있는 규칙 번호 (규칙 파일 순서)."""
+        indices = set(self._unfiltered)
+        for first in set(sentence).intersection(self._literals_by_first):
+            for literal in self._literals_by_first[first]:
+                if literal in sentence:
+                    indices.update(self._rules_by_literal[literal])
+        return sorted(indices)
+
+    def search(self, sentence: str) -> List[Dict]:
+        """문장에 걸린 규칙 목록. 각 항목은 rule, hint, spans([[시작, 끝], ...])."""
+        hits = []
+        indices = self.candidates(sentence)
+        for index in indices:
+            rule = self.rules[index]
+            spans = [[m.start(), m.end()] for m in rule.regex.finditer(sentence)]
+            if spans:
+                hits.append({"rule": rule.name, "hint": rule.hint, "spans": spans})
+        self.evaluated += len(indices)
+        self.skipped += len(self.rules) - len(indices)
+        return hits
@@ -1,121 +1,152 @@
 # -*- coding: utf-8 -*-
-import json
-import os
-from typing import Dict, Optional
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
 from .base import BaseChecker
+from utils.cache import DEFAULT_CACHE_PATH, ResultCache
+from utils.pipeline import process_context
 
 class SpacingChecker(BaseChecker):
-    """kr-spacing 기반 띄어쓰기 검사기."""
+    """
+    kr-spacing 기반 띄어쓰기 검사기.
+    processes > 0 이면 모델을 작업자 프로세스마다 한 번씩 올리고 문장 묶음을 나눠 보내므로
+    GIL에 막히지 않고 코어 수만큼 추론이 병렬로 돈다.
+    """
     name = "spacing"
+    # 로컬 모델 추론
+    cost = 5.0
 
-    def __init__(self, cache_file: str = "spacing_cache.json"):
+    def __init__(self, cache_file: str = DEFAULT_CACHE_PATH, processes: int = 0):
         self.cache_file = cache_file
-        self.cache = self._JsonCache(cache_file)
+        self.cache = ResultCache(cache_file, self.name, self.version)
+        self.cache.migrate_json("spacing_cache.json")
+        self.processes = processes
+        self._pool = None
 
         # kr-spacing 모듈 import 시도
         try:
-            from krspacing import KRSpacing  # type: ignore
-            self.model = KRSpacing()
+            if processes > 0:
+                # 모델은 작업자 프로세스에서만 올린다
+                if importlib.util.find_spec("krspacing") is None:
+                    raise ImportError("krspacing")
+                self._pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                                 mp_context=process_context())
+                self.lane = "process"
+            else:
+                from krspacing import KRSpacing  # type: ignore
+                self.model = KRSpacing()
             self._available = True
         except ImportError:
             print("경고: krspacing 모듈을 찾을 수 없습니다. pip install kr-spacing")
             self._available = False
-    
+
     def check(self, sentence: str) -> Dict:
         """문장의 띄어쓰기를 검사합니다."""
+        return self.check_batch([sentence])[0]
+
+    def check_batch(self, sentences: List[str]) -> List[Dict]:
+        """문장 묶음의 띄어쓰기를 검사 (프로세스 모드면 작업자 수만큼 나눠 병렬 추론)."""
         if not self._available:
-            return {"flag": False, "meta": {"error": "krspacing 모듈 없음"}}
-        
+            return [{"flag": False, "meta": {"error": "krspacing 모듈 없음"}} for _ in sentences]
+
         # 캐시 확인
-        cached = self.cache.get(sentence)
-        if cached is not None:
-            return cached
-        
-        try:
-            # 띄어쓰기 교정
-            corrected = self.model(sentence)
-            
-            # 의미있는 변경인지 확인
-            flag = self._significant_change(sentence, corrected)
-            
-            response = {
-                "flag": flag,
-                "suggestion": corrected if flag else None,
-                "meta": {
-                    "original": sentence,
-                    "corrected": corrected,
-                    "original_length": len(sentence),
-                    "corrected_length": len(corrected)
-                }
-            }
-            
-            # 캐시에 저장
-            self.cache.set(sentence, response)
-            
-            return response
-            
-        except Exception as e:
-            return {
-                "flag": False,
-                "meta": {"error": str(e)}
-            }
-    
+        results: List[Dict] = [self.cache.get(sentence) for sentence in sentences]
+        todo = [i for i, result in enumerate(results) if result is None]
+        if not todo:
+            return results
+
+        targets = [sentences[i] for i in todo]
+        if self._pool is None:
+            checked = [_space_one(self.model, sentence) for sentence in targets]
+        else:
+            checked = self._check_in_pool(targets)
+
+        for i, result in zip(todo, checked):
+            results[i] = result
+            # 캐시에 저장 (오류 결과 제외)
+            if "error" not in result["meta"]:
+                self.cache.set(sentences[i], result)
+        return results
+
+    def _check_in_pool(self, sentences: List[str]) -> List[Dict]:
+        size = -(-len(sentences) // self.processes)
+        chunks = [sentences[i:i + size] for i in range(0, len(sentences), size)]
+        checked = []
+        for chunk, future in [(chunk, self._pool.submit(_space_batch, chunk)) for chunk in chunks]:
+            try:
+                checked.extend(future.result())
+            except Exception as e:
+                # 작업자 프로세스가 죽은 경우 등
+                checked.extend({"flag": False, "meta": {"error": str(e)}} for _ in chunk)
+        return checked
+
     def _significant_change(self, original: str, corrected: str) -> bool:
         """띄어쓰기 변경이 의미있는지 판단."""
-        if original == corrected:
-            return False
-        
-        # 길이 차이가 1 이상이면 의미있는 변경
-        if abs(len(corrected) - len(original)) >= 1:
-            return True
-        
-        # 공백 개수 변화가 있으면 의미있는 변경
-        orig_spaces = original.count(' ')
-        corr_spaces = corrected.count(' ')
-        if abs(corr_spaces - orig_spaces) >= 1:
-            return True
-        
-        # 단어 수 변화가 있으면 의미있는 변경
-        orig_words = len(original.split())
-        corr_words = len(corrected.split())
-        if abs(corr_words - orig_words) >= 1:
-            return True
-        
-        return False
-    
+        return significant_change(original, corrected)
+
     def shutdown(self):
-        """캐시를 파일에 저장."""
-        self.cache.flush()
-    
-    class _JsonCache:
-        """JSON 파일 기반 캐시."""
-        
-        def __init__(self, filename: str):
-            self.filename = filename
-            self.data = {}
-            self._load()
-        
-        def _load(self):
-            """캐시 파일 로드."""
-            try:
-                if os.path.exists(self.filename):
-                    with open(self.filename, 'r', encoding='utf-8') as f:
-                        self.data = json.load(f)
-            except Exception:
-                self.data = {}
-        
-        def get(self, key: str) -> Optional[Dict]:
-            """캐시에서 값 조회."""
-            return self.data.get(key)
-        
-        def set(self, key: str, value: Dict):
-            """캐시에 값 저장."""
-            self.data[key] = value
-        
-        def flush(self):
-            """캐시를 파일에 저장."""
-            try:
-                with open(self.filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.data, f, ensure_ascii=False, indent=2)
-            except Exception:
-                pass
+        """작업자 프로세스 종료, 캐시를 파일에 저장."""
+        if self._pool is not None:
+            self._pool.shutdown()
+        self.cache.close()
+
+
+def significant_change(original: str, corrected: str) -> bool:
+    """띄어쓰기 변경이 의미있는지 판단."""
+    if original == corrected:
+        return False
+
+    # 길이 차이가 1 이상이면 의미있는 변경
+    if abs(len(corrected) - len(original)) >= 1:
+        return True
+
+    # 공백 개수 변화가 있으면 의미있는 변경
+    orig_spaces = original.count(' ')
+    corr_spaces = corrected.count(' ')
+    if abs(corr_spaces - orig_spaces) >= 1:
+        return True
+
+    # 단어 수 변화가 있으면 의미있는 변경
+    orig_words = len(original.split())
+    corr_words = len(corrected.split())
+    if abs(corr_words - orig_words) >= 1:
+        return True
+
+    return False
+
+
+def _space_one(model, sentence: str) -> Dict:
+    """문장 하나 교정 후 검사 결과 생성."""
+    try:
+        # 띄어쓰기 교정
+        corrected = model(sentence)
+    except Exception as e:
+        return {"flag": False, "meta": {"error": str(e)}}
+
+    # 의미있는 변경인지 확인
+    flag = significant_change(sentence, corrected)
+    return {
+        "flag": flag,
+        "suggestion": corrected if flag else None,
+        "meta": {
+            "original": sentence,
+            "corrected": corrected,
+            "original_length": len(sentence),
+            "corrected_length": len(corrected)
+        }
+    }
+
+
+# 작업자 프로세스마다 한 번 올린 모델
+_WORKER_MODEL = None
+
+
+def _init_worker():
+    global _WORKER_MODEL
+    from krspacing import KRSpacing  # type: ignore
+    _WORKER_MODEL = KRSpacing()
+
+
+def _space_batch(sentences: List[str]) -> List[Dict]:
+    """작업자 프로세스에서 문장 묶음 교정 (판정까지 작업자 쪽에서 계산)."""
+    return [_space_one(_WORKER_MODEL, sentence) for sentence in sentences]
@@ -83,7 +83,8 @@ def example_with_custom_rules():
     
     # 규칙 검사기 생성
     rules_checker = RuleChecker()
-    rules_checker.rules.extend(custom_rules)
+    for rule in custom_rules:
+        rules_checker.add_rule(rule["name"], rule["pattern"], rule["hint"])
     
     # 테스트 문장 검사
     test_sentences = [
@@ -5,53 +5,103 @@
 대용량 PDF에서 한국어 오탈자, 맞춤법, 띄어쓰기 오류를 자동으로 검출합니다.
 """
 
+from utils.startup import STARTUP  # 시작 시간 측정 기준점이므로 가장 먼저 import
+
 import os
 import time
 import json
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import pandas as pd
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from utils.pdf import extract_pages, count_pages
-from utils.text import normalize_text, split_sentences, visible_korean_ratio
+from utils.text import TextPreprocessor, SentenceSplitter, strip_running_lines
 from utils.diff import simple_diff
-from checkers.base import BaseChecker
-from checkers.hanspell_checker import HanspellChecker
-from checkers.spacing_checker import SpacingChecker
-from checkers.rule_checker import RuleChecker
-from checkers.language_tool_checker import LanguageToolChecker
+from utils.pipeline import DedupIndex, MicroBatcher, run_pipeline
+from utils.report import ReportWriter
+from utils.ratelimit import is_deferred
+from utils.cache import DEFAULT_CACHE_PATH
+from utils.whitelist import load_whitelist
+from utils.plan import ExecutionPlan
+from utils.lanes import LANE_KINDS, Lane, LaneScheduler
+
+# PDF 추출(fitz, pdfplumber)과 검사기 백엔드(asyncio, yaml, JVM 등)는 무거우므로
+# 실제로 쓰는 시점에 import 한다 (--help, 짧은 작업의 시작 시간 단축)
+
+def _build_hanspell(args):
+    max_rate = args.hanspell_max_rate or args.hanspell_rate
+    if args.hanspell_backend == "async":
+        with STARTUP.section("import hanspell_async"):
+            from checkers.hanspell_async import AsyncHanspellChecker, DEFAULT_ENDPOINT
+        checker = AsyncHanspellChecker(rate_limit_per_sec=args.hanspell_rate,
+                                       endpoint=args.hanspell_endpoint or DEFAULT_ENDPOINT,
+                                       max_in_flight=args.hanspell_concurrency,
+                                       params=_key_values(args.hanspell_param),
+                                       max_rate_per_sec=max_rate,
+                                       cache_file=args.cache_path)
+    else:
+        with STARTUP.section("import hanspell_checker"):
+            from checkers.hanspell_checker import HanspellChecker
+        checker = HanspellChecker(rate_limit_per_sec=args.hanspell_rate,
+                                  max_rate_per_sec=max_rate,
+                                  cache_file=args.cache_path)
+    growth = f", 최대 {max_rate}/sec" if max_rate > args.hanspell_rate else ""
+    return checker, (f"✓ Hanspell 검사기 활성화 ({args.hanspell_backend}, "
+                     f"rate: {args.hanspell_rate}/sec{growth})")
+
+def _build_spacing(args):
+    with STARTUP.section("import spacing_checker"):
+        from checkers.spacing_checker import SpacingChecker
+    checker = SpacingChecker(cache_file=args.cache_path, processes=args.spacing_workers)
+    mode = f"프로세스 {args.spacing_workers}개" if args.spacing_workers > 0 else "단일 프로세스"
+    return checker, f"✓ kr-spacing 검사기 활성화 ({mode})"
+
+def _build_rule(args):
+    with STARTUP.section("import rule_checker"):
+        from checkers.rule_checker import RuleChecker
+    return RuleChecker(args.rules_path, args.whitelist_path), "✓ Rule 검사기 활성화"
+
+def _build_languagetool(args):
+    with STARTUP.section("import language_tool_checker"):
+        from checkers.language_tool_checker import LanguageToolChecker
+    servers = [url.strip() for url in args.languagetool_servers.split(",") if url.strip()]
+    checker = LanguageToolChecker(cache_file=args.cache_path,
+                                  instances=args.languagetool_instances,
+                                  servers=servers)
+    pool = f"서버 {len(servers)}개 연결" if servers else f"인스턴스 {args.languagetool_instances}개"
+    return checker, f"✓ LanguageTool 검사기 활성화 ({pool})"
+
+# (인자 이름, 표시 이름, 빌더) — 목록 순서가 검사기 실행 순서
+CHECKER_BUILDERS = [
+    ("hanspell", "Hanspell", _build_hanspell),
+    ("spacing", "kr-spacing", _build_spacing),
+    ("rule", "Rule", _build_rule),
+    ("languagetool", "LanguageTool", _build_languagetool),
+]
+
+def enabled_checker_names(args):
+    """인자로 켠 검사기 이름 목록 (초기화 성공 여부와 무관)."""
+    return [name for name, _, _ in CHECKER_BUILDERS if getattr(args, name)]
 
 def build_checkers(args):
-    """인자에 따라 검사기들을 동적으로 빌드."""
-    checkers = []
-    
-    if args.hanspell:
-        try:
-            checkers.append(HanspellChecker(rate_limit_per_sec=args.hanspell_rate))
-            print(f"✓ Hanspell 검사기 활성화 (rate: {args.hanspell_rate}/sec)")
-        except Exception as e:
-            print(f"✗ Hanspell 검사기 비활성화: {e}")
-    
-    if args.spacing:
-        try:
-            checkers.append(SpacingChecker())
-            print(f"✓ kr-spacing 검사기 활성화")
-        except Exception as e:
-            print(f"✗ kr-spacing 검사기 비활성화: {e}")
-    
-    if args.rule:
-        try:
-            checkers.append(RuleChecker(args.rules_path, args.whitelist_path))
-            print(f"✓ Rule 검사기 활성화")
-        except Exception as e:
-            print(f"✗ Rule 검사기 비활성화: {e}")
+    """인자에 따라 검사기들을 동적으로 빌드 (모델 로드/JVM 기동이 겹치도록 동시에 초기화)."""
+    enabled = [item for item in CHECKER_BUILDERS if getattr(args, item[0])]
 
-    if args.languagetool:
+    def build(item):
+        name, label, builder = item
         try:
-            checkers.append(LanguageToolChecker())
-            print(f"✓ LanguageTool 검사기 활성화")
+            with STARTUP.section(f"init {name}"):
+                return builder(args)
         except Exception as e:
-            print(f"✗ LanguageTool 검사기 비활성화: {e}")
+            return None, f"✗ {label} 검사기 비활성화: {e}"
+
+    with ThreadPoolExecutor(max_workers=max(1, len(enabled)), thread_name_prefix="init") as executor:
+        built = list(executor.map(build, enabled))
+
+    checkers = []
+    for checker, message in built:
+        print(message)
+        if checker is not None:
+            checkers.append(checker)
     
     if not checkers:
         print("경고: 활성화된 검사기가 없습니다!")
@@ -59,27 +109,115 @@ def build_checkers(args):
     
     return checkers
 
+def start_checkers(args) -> Future:
+    """검사기 초기화를 백그라운드 스레드에서 시작하고 build_checkers 결과의 Future 반환."""
+    future: Future = Future()
+
+    def warm_up():
+        try:
+            future.set_result(build_checkers(args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=warm_up, name="warmup", daemon=True).start()
+    return future
+
+def make_lane(checker, args):
+    """
+    검사기 실행 레인 생성. 종류는 검사기가 정하고(checker.lane), 동시성 한도는
+    I/O 대기 검사기면 --max-workers-io, CPU 검사기면 --max-workers-cpu, process 레인이면 프로세스 수.
+    --lane NAME=KIND[:LIMIT] 또는 NAME=LIMIT 로 바꿀 수 있다.
+    """
+    kind, limit = checker.lane, None
+    for spec in args.lane:
+        name, _, value = spec.partition("=")
+        if name.strip() != checker.name:
+            continue
+        value = value.strip()
+        if ":" in value:
+            value, _, count = value.partition(":")
+            if count.strip().isdigit():
+                limit = int(count)
+            else:
+                print(f"경고: --lane {spec} 의 동시성 한도를 무시합니다")
+        if value.isdigit():
+            limit = int(value)
+        elif value:
+            kind = value
+    if kind not in LANE_KINDS:
+        print(f"경고: {checker.name} 레인 종류 '{kind}'를 알 수 없어 {checker.lane} 레인을 씁니다")
+        kind = checker.lane
+    elif kind != "thread" and kind != checker.lane:
+        # async 는 submit_async, process 는 검사기 자체 프로세스 풀(--spacing-workers)이 있어야 한다
+        print(f"경고: {checker.name} 검사기는 {kind} 레인을 지원하지 않아 {checker.lane} 레인을 씁니다")
+        kind = checker.lane
+
+    if limit is None:
+        if kind == "process":
+            limit = getattr(checker, "processes", 1)
+        elif checker.io_bound:
+            limit = args.max_workers_io or args.workers
+        else:
+            limit = args.max_workers_cpu
+    return Lane(checker, kind, limit, batch_size=args.batch_size, max_wait=args.batch_wait)
+
 def check_sentence(sentence, checkers):
     """문장을 모든 검사기로 검사."""
-    flags = []
-    suggestions = {}
-    metas = {}
+    return check_sentences([sentence], checkers)[0]
+
+def check_sentences(sentences, checkers, whitelist=None, plan=None):
+    """
+    문장 묶음을 모든 검사기로 검사 (검사기별 check_batch 한 번씩).
+    whitelist 가 있으면 문장마다 화이트리스트 구간을 한 번 찾아 검사기별 지적에서 겹치는 부분을 걸러낸다.
+    plan 이 있으면 단계 순서대로 검사하고, 단계 정책에 맞는 문장만 그 단계 검사기에 보낸다.
+    """
+    merged = [([], {}, {}) for _ in sentences]
+    spans = [whitelist.spans(sentence) for sentence in sentences] if whitelist else [[] for _ in sentences]
+    stages = plan.arrange(checkers) if plan else [(checkers, None)]
     
-    for checker in checkers:
-        try:
-            result = checker.check(sentence)
-            if result["flag"]:
-                flags.append(checker.name)
-                if "suggestion" in result:
-                    suggestions[checker.name] = result["suggestion"]
-                elif "suggestions" in result:
-                    suggestions[checker.name] = result["suggestions"]
-                if "meta" in result:
-                    metas[checker.name] = result["meta"]
-        except Exception as e:
-            print(f"검사기 {checker.name} 오류: {e}")
+    for stage, policy in stages:
+        # 앞 단계까지의 결과로 한 번 선택 (같은 단계 검사기끼리는 서로 영향 없음)
+        if policy is None or policy.selects_all:
+            indices = list(range(len(sentences)))
+        else:
+            indices = [i for i, sentence in enumerate(sentences) if policy.selects(sentence, merged[i][0])]
+        
+        for checker in stage:
+            if plan:
+                plan.record(checker, len(sentences), len(indices))
+            if not indices:
+                continue
+            try:
+                results = checker.check_batch([sentences[i] for i in indices])
+            except Exception as e:
+                print(f"검사기 {checker.name} 오류: {e}")
+                continue
+
+            for i, result in zip(indices, results):
+                if spans[i]:
+                    result = checker.apply_whitelist(sentences[i], result, spans[i])
+                merge_result(merged[i], checker.name, result)
     
-    return flags, suggestions, metas
+    return merged
+
+def merge_result(merged, name, result):
+    """검사기 하나의 결과를 (flags, suggestions, metas)에 합침."""
+    flags, suggestions, metas = merged
+    if result["flag"]:
+        flags.append(name)
+        if "suggestion" in result:
+            suggestions[name] = result["suggestion"]
+        elif "suggestions" in result:
+            suggestions[name] = result["suggestions"]
+        if "meta" in result:
+            metas[name] = result["meta"]
+    elif is_deferred(result):
+        # 재시도 대기 중인 실패는 나중에 결과를 다시 합칠 수 있게 표시
+        metas[name] = result["meta"]
+
+def pending_retries(metas):
+    """재시도 대기 중인 검사기 이름 목록."""
+    return [name for name, meta in metas.items() if isinstance(meta, dict) and meta.get("deferred")]
 
 def representative_suggestion(suggestions):
     """대표 교정안 선택 (우선순위: hanspell > spacing > rule)."""
@@ -89,6 +227,104 @@ def representative_suggestion(suggestions):
         return suggestions["spacing"]
     return None
 
+_preprocessor = TextPreprocessor()
+
+def checker_calls(sentence, flags, checkers, plan=None):
+    """문장 하나에 검사기 호출이 몇 번 일어나는지 (실행 계획이 있으면 단계 정책대로)."""
+    return plan.calls_for(checkers, sentence, flags) if plan else len(checkers)
+
+def prepare_pages(pages, args, splitter, running_lines=None, stats=None):
+    """
+    페이지 묶음을 정규화하고 페이지별 검사 대상 문장 리스트로 분리.
+    stats 를 넘기면 지운 반복 줄 수("lines")와, 그 줄이 남았다면 검사했을 문장("sentences", 키 → 문장)을 모은다.
+    """
+    texts = []
+    removed_texts = []
+    for _, text, _ in pages:
+        if not text.strip():
+            texts.append("")
+            continue
+
+        # 텍스트 정규화 + 한글 비율 계산
+        prepared = _preprocessor.process(text)
+
+        # 반복 머리글/바닥글 제거
+        if running_lines:
+            stripped, removed = strip_running_lines(prepared.text, running_lines, args.running_edge_lines)
+            if removed:
+                if stats is not None:
+                    stats["lines"] = stats.get("lines", 0) + len(removed)
+                    # 한글 비율로 걸러질 페이지였다면 어차피 검사하지 않았다
+                    if prepared.korean_ratio >= args.korean_ratio:
+                        removed_texts.append("\n".join(removed))
+                prepared = _preprocessor.process(stripped)
+
+        # 한글 비율 체크
+        texts.append(prepared.text if prepared.korean_ratio >= args.korean_ratio else "")
+
+    # 지운 줄에서 나왔을 검사 대상 문장 (최소 길이 필터 후 문서 전체에서 중복 제거)
+    if removed_texts:
+        removed_sentences = stats.setdefault("sentences", {})
+        for sentences in splitter.split_many(removed_texts):
+            for sentence in sentences:
+                if len(sentence.strip()) >= args.min_length:
+                    removed_sentences.setdefault(DedupIndex.key(sentence), sentence)
+
+    # 문장 분리 (여러 페이지를 한 번에)
+    return [
+        [s for s in sentences if len(s.strip()) >= args.min_length]
+        for sentences in splitter.split_many(texts)
+    ]
+
+def build_row(page_no, sentence, is_ocr, flags, suggestions, metas, args):
+    """검사 결과로 리포트 행 생성 (플래그가 없으면 None)."""
+    if not flags:
+        return None
+
+    # 대표 교정안
+    rep_suggestion = representative_suggestion(suggestions)
+
+    # 스니펫 생성
+    snippet = sentence[:args.snippet_length]
+    if len(sentence) > args.snippet_length:
+        snippet += "…"
+
+    # 오류 타입 추출 (rule 기반)
+    error_types = []
+    if "rule" in metas and metas["rule"]:
+        for hit in metas["rule"].get("hits", []):
+            if isinstance(hit, dict) and "rule" in hit:
+                error_types.append(hit["rule"])
+
+    # diff 생성
+    diff = ""
+    if rep_suggestion:
+        diff = simple_diff(sentence, rep_suggestion)
+
+    return {
+        "page": page_no,
+        "sentence": sentence,
+        "snippet": snippet,
+        "sources": ",".join(flags),
+        "error_types": ",".join(error_types) if error_types else "",
+        "suggestion_by_source": json.dumps(suggestions, ensure_ascii=False),
+        "representative_suggestion": rep_suggestion or "",
+        "diff": diff,
+        "is_ocr": is_ocr
+    }
+
+def _int_or_auto(value):
+    """'auto' 또는 정수 인자."""
+    return value if value == "auto" else int(value)
+
+def _key_values(items):
+    """KEY=VALUE 인자 목록을 딕셔너리로."""
+    params = {}
+    for item in items:
+        key, _, value = item.partition("=")
+        params[key] = value
+    return params
+
 def main():
     parser = argparse.ArgumentParser(description="PDF 한국어 오탈자 검사기")
     parser.add_argument("pdf_path", help="검사할 PDF 파일 경로")
@@ -96,20 +332,83 @@ def main():
     parser.add_argument("--korean-ratio", type=float, default=0.3, help="한글 비율 최소값")
     parser.add_argument("--min-length", type=int, default=10, help="최소 문장 길이")
     parser.add_argument("--snippet-length", type=int, default=60, help="스니펫 길이")
-    parser.add_argument("--workers", type=int, default=4, help="동시 작업자 수")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="동시 작업자 수 (--scheduling shared 의 공용 풀, lanes 에서는 --max-workers-io 기본값)")
+    parser.add_argument("--scheduling", choices=["lanes", "shared"], default="lanes",
+                        help="검사 실행 방식 (lanes: 검사기별 레인, shared: 공용 풀에서 검사기를 차례로)")
+    parser.add_argument("--max-workers-io", type=int, default=None,
+                        help="I/O 대기 검사기(Hanspell, LanguageTool) thread 레인의 동시 배치 수 (기본: --workers)")
+    parser.add_argument("--max-workers-cpu", type=int, default=2,
+                        help="CPU 검사기(규칙, 단일 프로세스 띄어쓰기) thread 레인의 동시 배치 수")
+    parser.add_argument("--lane", action="append", default=[], metavar="NAME=KIND[:LIMIT]",
+                        help="검사기 레인 변경 (반복 가능, 예: hanspell=thread:8, rule=1)")
+    parser.add_argument("--batch-size", type=int, default=8, help="검사기에 한 번에 넘기는 최대 문장 수")
+    parser.add_argument("--batch-wait", type=float, default=0.05, help="배치를 채우기 위해 기다리는 최대 시간(초)")
+    parser.add_argument("--queue-size", type=int, default=4, help="추출 → 문장 분리 대기열 크기")
+    parser.add_argument("--max-pending-pages", type=int, default=8, help="검사 중인 최대 페이지 수")
+    parser.add_argument("--split-batch", type=int, default=8, help="문장 분리 시 한 번에 묶는 최대 페이지 수")
+    parser.add_argument("--dedup-capacity", type=int, default=10000,
+                        help="중복 문장 결과를 메모리에 남겨 두는 최대 문장 수 (0이면 검사 중인 문장끼리만 공유)")
+    parser.add_argument("--kss-backend", default="auto", help="kss 형태소 분석 백엔드 (auto, mecab, pecab, punct 등)")
+    parser.add_argument("--kss-workers", type=_int_or_auto, default=1,
+                        help="kss 멀티프로세싱 작업자 수 (auto 또는 정수, 1보다 크면 분리 배치마다 프로세스 풀을 새로 만듦)")
+    parser.add_argument("--extract-workers", type=int, default=1, help="페이지 추출 프로세스 수 (1이면 단일 프로세스)")
     parser.add_argument("--ocr", action="store_true", help="OCR 사용")
+    parser.add_argument("--all-tables", action="store_true", help="표 감지 없이 모든 페이지에 pdfplumber 표 추출 적용")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH, help="검사 결과/추출 캐시 SQLite 파일 경로")
+    parser.add_argument("--extract-cache", help="페이지 추출 캐시 파일 경로 (기본: --cache-path)")
+    parser.add_argument("--no-extract-cache", action="store_true", help="페이지 추출 캐시 사용 안 함")
     parser.add_argument("--ocr-threshold", type=int, default=50, help="OCR 트리거 문자 수")
+    parser.add_argument("--ocr-mode", choices=["page", "region"], default="page",
+                        help="OCR 범위 (page: 페이지 전체, region: 텍스트 레이어 없는 이미지 영역만)")
+    parser.add_argument("--ocr-workers", type=int, default=1, help="OCR 전용 프로세스 수 (1이면 추출 흐름에서 직접 OCR)")
+    parser.add_argument("--ocr-memory-mp", type=int, default=None,
+                        help="동시 OCR 렌더링 메가픽셀 예산, OCR 프로세스 수를 예산 // 12로 제한 (기본: 48, 0이면 제한 없음)")
+    parser.add_argument("--keep-running-lines", action="store_true", help="반복 머리글/바닥글/쪽번호 줄을 제거하지 않음")
+    parser.add_argument("--running-band", type=float, default=0.1, help="머리글/바닥글로 볼 페이지 위·아래 영역 비율")
+    parser.add_argument("--running-min-pages", type=int, default=3, help="반복 줄로 판단할 최소 페이지 수")
+    parser.add_argument("--running-edge-lines", type=int, default=3,
+                        help="페이지 위·아래에서 각각 반복 줄을 지울 수 있는 최대 줄 수")
     parser.add_argument("--hanspell", action="store_true", help="Hanspell 검사기 사용")
     parser.add_argument("--hanspell-rate", type=int, default=5, help="Hanspell 초당 요청 수")
+    parser.add_argument("--hanspell-max-rate", type=float, default=None,
+                        help="Hanspell 적응형 속도 상한 (주면 성공할 때마다 --hanspell-rate에서 여기까지 올림, "
+                             "기본: 올리지 않음)")
+    parser.add_argument("--hanspell-retry-rounds", type=int, default=3, help="실패한 Hanspell 요청 재시도 횟수 (실행 종료 전)")
+    parser.add_argument("--hanspell-backend", choices=["sync", "async"], default="sync",
+                        help="Hanspell 호출 방식 (sync: py-hanspell, async: aiohttp 연결 풀)")
+    parser.add_argument("--hanspell-endpoint", default=None, help="async 백엔드 맞춤법 API 주소 (기본: 네이버 맞춤법 검사기)")
+    parser.add_argument("--hanspell-concurrency", type=int, default=16, help="async 백엔드 동시 요청 수")
+    parser.add_argument("--hanspell-param", action="append", default=[], metavar="KEY=VALUE",
+                        help="async 백엔드 요청에 추가할 쿼리 파라미터 (반복 가능, 예: passportKey=...)")
     parser.add_argument("--spacing", action="store_true", help="kr-spacing 검사기 사용")
+    parser.add_argument("--spacing-workers", type=int, default=0,
+                        help="kr-spacing 모델을 올릴 작업자 프로세스 수 (0이면 현재 프로세스에서 추론)")
     parser.add_argument("--rule", action="store_true", help="Rule 검사기 사용")
     parser.add_argument("--languagetool", action="store_true", help="LanguageTool 검사기 사용")
+    parser.add_argument("--languagetool-instances", type=int, default=1,
+                        help="띄울 로컬 LanguageTool 서버(JVM) 수")
+    parser.add_argument("--languagetool-servers", default="",
+                        help="이미 떠 있는 LanguageTool 서버 주소 (쉼표 구분, 지정하면 새로 띄우지 않음)")
     parser.add_argument("--rules-path", default="data/rules.yaml", help="규칙 파일 경로")
-    parser.add_argument("--whitelist-path", default="data/whitelist.txt", help="화이트리스트 파일 경로")
+    parser.add_argument("--whitelist-path", default="data/whitelist.txt",
+                        help="화이트리스트 파일 경로 (모든 검사기에서 이 용어와 겹치는 지적은 제외)")
+    parser.add_argument("--plan", help="검사기 실행 계획 YAML (단계/정책, 예: data/plan.yaml). 없으면 모든 문장을 모든 검사기로")
+    parser.add_argument("--collapse-duplicates", action="store_true", help="같은 문장의 결과를 한 행으로 합치고 페이지 목록 표시")
     parser.add_argument("--format", choices=["csv", "xlsx", "both"], default="both", help="출력 형식")
+    parser.add_argument("--startup-report", action="store_true", help="import/검사기 초기화/첫 결과까지 걸린 시간 출력")
     
     args = parser.parse_args()
     
+    # 실행 계획 (없으면 모든 검사기가 모든 문장을 검사)
+    # 잘못된 계획으로 비싼 검사기가 모든 문장을 검사하지 않도록 로드에 실패하면 시작하지 않는다
+    plan = None
+    if args.plan:
+        try:
+            plan = ExecutionPlan.from_yaml(args.plan, known=[name for name, _, _ in CHECKER_BUILDERS])
+        except Exception as e:
+            parser.error(f"실행 계획 로드 실패: {e}")
+    
     # 기본 검사기 활성화 (인자가 없으면)
     if not any([args.hanspell, args.spacing, args.rule, args.languagetool]):
         args.hanspell = True
@@ -120,144 +419,212 @@ def main():
     # 출력 디렉토리 생성
     os.makedirs(args.out_dir, exist_ok=True)
     
-    # 검사기 빌드
-    checkers = build_checkers(args)
-    if not checkers:
-        return
+    # 검사기 초기화는 백그라운드에서 (모델 로드/JVM 기동 동안 PDF 추출과 문장 분리를 먼저 진행)
+    checkers_future = start_checkers(args)
     
     print(f"PDF 처리 시작: {args.pdf_path}")
-    print(f"활성 검사기: {[c.name for c in checkers]}")
+    print(f"활성 검사기: {enabled_checker_names(args)}")
     
     # PDF에서 페이지별 텍스트 추출
+    with STARTUP.section("import utils.pdf"):
+        from utils.pdf import extract_pages, count_pages, find_running_lines, ExtractionCache
     page_count = count_pages(args.pdf_path)
-    pages = extract_pages(args.pdf_path, use_ocr=args.ocr, ocr_threshold=args.ocr_threshold)
+    extract_stats = {}
+    extract_cache = None if args.no_extract_cache else ExtractionCache(args.extract_cache or args.cache_path)
+    pages = extract_pages(args.pdf_path, use_ocr=args.ocr, ocr_threshold=args.ocr_threshold,
+                          workers=args.extract_workers, detect_tables=not args.all_tables,
+                          stats=extract_stats, cache=extract_cache,
+                          ocr_workers=args.ocr_workers, ocr_memory_mp=args.ocr_memory_mp,
+                          ocr_mode=args.ocr_mode)
     print(f"총 {page_count} 페이지 처리")
 
-    rows = []
+    formats = ["csv", "xlsx"] if args.format == "both" else [args.format]
+    report = ReportWriter(args.out_dir, formats=formats, collapse=args.collapse_duplicates)
     total_sentences = 0
     flagged_sentences = 0
 
-    # 공용 스레드 풀
-    executor = ThreadPoolExecutor(max_workers=args.workers)
-    try:
-        # 페이지별 처리
-        for page_no, text, is_ocr in pages:
-            if not text.strip():
-                continue
+    splitter = SentenceSplitter(backend=args.kss_backend, num_workers=args.kss_workers)
 
-            # 텍스트 정규화
-            normalized = normalize_text(text)
+    # 반복 머리글/바닥글 탐지 (문서 전체 1회)
+    running_lines = set()
+    running_stats = {}
+    if not args.keep_running_lines:
+        running_lines = find_running_lines(args.pdf_path, band=args.running_band,
+                                           min_pages=args.running_min_pages)
+        if running_lines:
+            print(f"반복 머리글/바닥글 {len(running_lines)}종 감지: {sorted(running_lines)}")
 
-            # 한글 비율 체크
-            if visible_korean_ratio(normalized) < args.korean_ratio:
-                continue
+    first_page = threading.Event()
 
-            # 문장 분리
-            sentences = split_sentences(normalized)
-            sentences = [s for s in sentences if len(s.strip()) >= args.min_length]
-            total_sentences += len(sentences)
+    def prepare(batch):
+        if not first_page.is_set():
+            first_page.set()
+            STARTUP.mark("첫 페이지 추출")
+        prepared = prepare_pages(batch, args, splitter, running_lines, running_stats)
+        for (page_no, _, is_ocr), sentences in zip(batch, prepared):
+            if sentences:
+                print(f"페이지 {page_no} 처리 중... ({len(sentences)} 문장, OCR: {is_ocr})")
+        return prepared
 
-            if not sentences:
-                continue
+    # 화이트리스트 (규칙 검사기와 같은 오토마타를 공유해 모든 검사기 결과를 후처리)
+    whitelist = load_whitelist(args.whitelist_path)
+
+    scheduler = None
+    if args.scheduling == "lanes":
+        # 검사기마다 자기 레인(실행 방식, 동시성 한도)에서 돌고, 문장 결과는 모든 레인이 끝나면 합친다
+        # (검사기 초기화 전에 들어온 문장은 레인이 준비되면 보낸다)
+        scheduler = LaneScheduler(checkers_future, lambda checker: make_lane(checker, args),
+                                  merge_result, whitelist, plan)
+        submit = scheduler.submit
+    else:
+        # 공용 스레드 풀에서 문장 묶음마다 모든 검사기를 차례로 실행
+        executor = ThreadPoolExecutor(max_workers=args.workers)
+
+        # 페이지를 넘나들며 문장을 묶어 검사기별 check_batch로 처리
+        # (첫 배치는 검사기 초기화가 끝날 때까지 기다린다)
+        batcher = MicroBatcher(lambda batch: check_sentences(batch, checkers_future.result(), whitelist, plan),
+                               executor, batch_size=args.batch_size, max_wait=args.batch_wait)
+        submit = batcher.submit
+
+    # 문서 전체에서 같은 문장은 한 번만 검사하고 결과를 공유
+    # (아낀 호출 수는 원래 문장 결과의 플래그로 실행 계획 단계 판단을 재현해 센다)
+    dedup = DedupIndex(submit, capacity=args.dedup_capacity,
+                       calls=lambda sentence, result: checker_calls(sentence, result[0],
+                                                                   checkers_future.result(), plan))
+
+    # 검사기 호출이 실패해 재시도를 기다리는 문장 (page_no, sentence, is_ocr, result)
+    held = []
+    failed_sentences = 0
+    check_start = time.perf_counter()
+    try:
+        results = run_pipeline(pages, prepare, dedup.submit,
+                               queue_size=args.queue_size, max_pending_pages=args.max_pending_pages,
+                               split_batch=args.split_batch)
+        for page_no, is_ocr, page_results in results:
+            if checkers_future.done() and not checkers_future.result():
+                # 초기화된 검사기가 하나도 없으면 남은 페이지를 처리하지 않고 중단
+                break
+            if not total_sentences and page_results:
+                STARTUP.mark("첫 검사 결과")
+            total_sentences += len(page_results)
+            for sentence, result in page_results:
+                if isinstance(result, Exception):
+                    print(f"문장 처리 오류: {result}")
+                    continue
+                if pending_retries(result[2]):
+                    held.append((page_no, sentence, is_ocr, result))
+                    continue
+                row = build_row(page_no, sentence, is_ocr, *result, args)
+                if row:  # OR 로직: 하나라도 플래그가 있으면
+                    flagged_sentences += 1
+                    report.write(row)
+        results.close()
+
+        checkers = checkers_future.result()
 
-            print(f"페이지 {page_no} 처리 중... ({len(sentences)} 문장, OCR: {is_ocr})")
-
-            futures = {executor.submit(check_sentence, s, checkers): s for s in sentences}
-
-            for future in as_completed(futures):
-                sentence = futures[future]
-                try:
-                    flags, suggestions, metas = future.result()
-
-                    if flags:  # OR 로직: 하나라도 플래그가 있으면
-                        flagged_sentences += 1
-
-                        # 대표 교정안
-                        rep_suggestion = representative_suggestion(suggestions)
-
-                        # 스니펫 생성
-                        snippet = sentence[:args.snippet_length]
-                        if len(sentence) > args.snippet_length:
-                            snippet += "…"
-
-                        # 오류 타입 추출 (rule 기반)
-                        error_types = []
-                        if "rule" in metas and metas["rule"]:
-                            for hit in metas["rule"]:
-                                if isinstance(hit, dict) and "rule" in hit:
-                                    error_types.append(hit["rule"])
-
-                        # diff 생성
-                        diff = ""
-                        if rep_suggestion:
-                            diff = simple_diff(sentence, rep_suggestion)
-
-                        rows.append({
-                            "page": page_no,
-                            "sentence": sentence,
-                            "snippet": snippet,
-                            "sources": ",".join(flags),
-                            "error_types": ",".join(error_types) if error_types else "",
-                            "suggestion_by_source": json.dumps(suggestions, ensure_ascii=False),
-                            "representative_suggestion": rep_suggestion or "",
-                            "diff": diff,
-                            "is_ocr": is_ocr
-                        })
-
-                except Exception as e:
-                    print(f"문장 처리 오류: {e}")
+        # 실패했던 문장을 실행이 끝나기 전에 다시 검사
+        if held:
+            print(f"검사 실패 문장 {len(held)}개 재시도 중...")
+            recovered = {}
+            for checker in checkers:
+                if hasattr(checker, "retry_deferred"):
+                    recovered[checker.name] = {
+                        DedupIndex.key(s): checker.apply_whitelist(s, r, whitelist.spans(s))
+                        for s, r in checker.retry_deferred(args.hanspell_retry_rounds).items()
+                    }
+            for page_no, sentence, is_ocr, (flags, suggestions, metas) in held:
+                # 결과 튜플은 중복 문장끼리 공유되므로 복사해서 합친다
+                merged = (list(flags), dict(suggestions), dict(metas))
+                for name in pending_retries(metas):
+                    result = recovered.get(name, {}).get(DedupIndex.key(sentence))
+                    if result is not None:
+                        del merged[2][name]
+                        merge_result(merged, name, result)
+                if pending_retries(merged[2]):
+                    failed_sentences += 1
+                row = build_row(page_no, sentence, is_ocr, *merged, args)
+                if row:
+                    flagged_sentences += 1
+                    report.write(row)
     finally:
-        executor.shutdown()
-    
-    # 결과 정렬 (우선순위: rule > 다중 검사기 > 단일 검사기)
-    def sort_key(row):
-        sources = row["sources"].split(",")
-        priority = 0
-        if "rule" in sources:
-            priority += 100
-        if len(sources) > 1:
-            priority += 10
-        return (-priority, row["page"], row["sources"])
-    
-    rows.sort(key=sort_key)
-    
-    # 결과 저장
-    df = pd.DataFrame(rows)
-    
-    if args.format in ["csv", "both"]:
-        csv_path = os.path.join(args.out_dir, "review.csv")
-        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-        print(f"CSV 저장: {csv_path}")
+        check_wall = time.perf_counter() - check_start
+        if scheduler is not None:
+            scheduler.close()
+        else:
+            batcher.close()
+            executor.shutdown()
+
+    if not checkers:
+        report.discard()
+        if extract_cache is not None:
+            extract_cache.close()
+        print("검사기가 없어 리포트를 만들지 않고 종료합니다.")
+        return
     
-    if args.format in ["xlsx", "both"]:
-        xlsx_path = os.path.join(args.out_dir, "review.xlsx")
-        df.to_excel(xlsx_path, index=False)
-        print(f"XLSX 저장: {xlsx_path}")
+    # 결과 저장 (우선순위: rule > 다중 검사기 > 단일 검사기 순으로 외부 정렬)
+    paths = report.close()
+    if "csv" in paths:
+        print(f"CSV 저장: {paths['csv']}")
+    if "xlsx" in paths:
+        print(f"XLSX 저장: {paths['xlsx']}")
     
     # 통계 출력
     print(f"\n=== 처리 완료 ===")
     print(f"총 페이지: {page_count}")
+    print(f"추출 경로: fitz 전용 {extract_stats.get('fitz', 0)} 페이지, "
+          f"pdfplumber 표 추출 {extract_stats.get('pdfplumber', 0)} 페이지, "
+          f"캐시 {extract_stats.get('cache', 0)} 페이지")
+    if running_stats:
+        # 지운 줄은 검사 결과가 없으므로 앞 단계 플래그 조건으로만 올라가는 단계 호출은 세지 않는다
+        removed = running_stats.get("sentences", {})
+        saved = sum(checker_calls(sentence, (), checkers, plan) for sentence in removed.values())
+        print(f"반복 머리글/바닥글 제거: {running_stats['lines']}줄 "
+              f"(검사 대상 문장 {len(removed)}개, 검사 호출 {saved}회 절약)")
     print(f"총 문장: {total_sentences}")
+    print(f"중복 문장: {dedup.duplicates} (고유 {dedup.unique}, "
+          f"검사 호출 {dedup.saved_calls}회 절약)")
     print(f"플래그된 문장: {flagged_sentences}")
+    if failed_sentences:
+        print(f"검사 실패 문장: {failed_sentences} (재시도 후에도 일부 검사기 결과 없음)")
     print(f"검출률: {flagged_sentences/total_sentences*100:.1f}%" if total_sentences > 0 else "검출률: 0%")
     
+    # API 검사기 속도/차단 통계
+    for checker in checkers:
+        if hasattr(checker, "limiter"):
+            print(f"{checker.name} 최종 속도: {checker.limiter.rate:.1f}/sec, "
+                  f"차단기 작동 {checker.breaker.trips}회")
+    
+    # 검사 레인 구성과 사용률
+    if scheduler is not None:
+        usage = scheduler.utilization(check_wall)
+        print(f"검사 레인: {scheduler.describe()}" + (
+            " (사용률 " + ", ".join(f"{name} {value * 100:.0f}%" for name, value in usage.items()) + ")"
+            if usage else ""))
+    
+    # 실행 계획 통계 (정책으로 건너뛴 비싼 검사기 호출)
+    if plan is not None:
+        print(f"\n=== 실행 계획 ===")
+        for line in plan.describe(checkers) + plan.report():
+            print(line)
+    
     # 검사기별 통계
-    if rows:
-        source_counts = {}
-        for row in rows:
-            for source in row["sources"].split(","):
-                source_counts[source] = source_counts.get(source, 0) + 1
-        
+    if report.source_counts:
         print(f"\n=== 검사기별 통계 ===")
-        for source, count in sorted(source_counts.items()):
+        for source, count in sorted(report.source_counts.items()):
             print(f"{source}: {count}건")
     
     # 검사기 정리
+    if extract_cache is not None:
+        extract_cache.close()
     for checker in checkers:
         try:
             checker.shutdown()
         except:
             pass
 
+    if args.startup_report:
+        print()
+        print(STARTUP.report())
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 모든 검사기/추출 캐시가 함께 쓰는 기본 파일
+DEFAULT_CACHE_PATH = "cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    version TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (namespace, version, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats (
+    namespace TEXT NOT NULL,
+    version TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (namespace, version)
+);
+"""
+
+
+class ResultCache:
+    """
+    SQLite(WAL) 저장소 + 메모리 LRU 캐시.
+    키는 (namespace, version, key) 이므로 검사기 이름과 버전이 바뀌면 예전 결과를 쓰지 않는다.
+    시작 시 파일 전체를 읽지 않고, 쓰기는 batch_size 개 또는 flush_interval 초마다 한 트랜잭션으로
+    나눠 저장하므로 비정상 종료 시에도 마지막 묶음만 잃는다.
+    스레드는 잠금 하나를 공유하고, 프로세스 간에는 SQLite 잠금(WAL + busy timeout)으로 안전하다.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, namespace: str = "default", version: str = "1",
+                 capacity: int = 10000, batch_size: int = 64, flush_interval: float = 2.0):
+        self.path = path
+        self.namespace = namespace
+        self.version = str(version)
+        self.capacity = max(1, capacity)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.hits = 0
+        self.misses = 0
+        self._lru: "OrderedDict[str, Dict]" = OrderedDict()
+        self._pending: Dict[str, str] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # fork된 자식 프로세스는 부모의 연결을 쓰면 안 되므로 pid가 바뀌면 새로 연다
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시에서 값 조회."""
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return value
+            if key in self._pending:
+                value = json.loads(self._pending[key])
+            else:
+                row = self._connect().execute(
+                    "SELECT value FROM entries WHERE namespace=? AND version=? AND key=?",
+                    (self.namespace, self.version, key),
+                ).fetchone()
+                value = json.loads(row[0]) if row else None
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+            return value
+
+    def set(self, key: str, value: Dict):
+        """캐시에 값 저장 (묶음이 차거나 시간이 지나면 파일에 기록)."""
+        with self._lock:
+            self._remember(key, value)
+            self._pending[key] = json.dumps(value, ensure_ascii=False)
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+
+    def _remember(self, key: str, value: Dict):
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+
+    def flush(self):
+        """대기 중인 쓰기를 한 트랜잭션으로 저장."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            items = list(self._pending.items())
+            self._pending.clear()
+            now = time.time()
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO entries (namespace, version, key, value, updated) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(self.namespace, self.version, k, v, now) for k, v in items],
+                    )
+            except sqlite3.Error as e:
+                print(f"경고: 캐시 저장 실패 ({self.path}): {e}")
+
+    def close(self):
+        """남은 쓰기와 적중 통계를 저장하고 연결 종료."""
+        with self._lock:
+            self.flush()
+            self._save_stats()
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def _save_stats(self):
+        if not (self.hits or self.misses):
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO stats (namespace, version, hits, misses) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(namespace, version) DO UPDATE SET "
+                    "hits = hits + excluded.hits, misses = misses + excluded.misses",
+                    (self.namespace, self.version, self.hits, self.misses),
+                )
+            self.hits = self.misses = 0
+        except sqlite3.Error as e:
+            print(f"경고: 캐시 통계 저장 실패 ({self.path}): {e}")
+
+    def items(self) -> Iterable[Tuple[str, Dict]]:
+        """이 namespace/version 의 모든 (키, 값)."""
+        self.flush()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, value FROM entries WHERE namespace=? AND version=?",
+                (self.namespace, self.version),
+            ).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace=? AND version=?",
+                (self.namespace, self.version),
+            ).fetchone()[0]
+
+    def migrate_json(self, filename: str) -> int:
+        """
+        예전 JSON 캐시 파일({키: 값})을 가져온다. 이 namespace 가 비어 있을 때만 한 번 실행되며
+        가져온 항목 수를 반환한다. 상대 경로는 SQLite 캐시 파일과 같은 디렉토리 기준이다
+        (다른 --cache-path 로 실행하면 현재 디렉토리에 남은 예전 파일을 가져오지 않는다).
+        """
+        if not os.path.isabs(filename):
+            filename = os.path.join(os.path.dirname(os.path.abspath(self.path)), filename)
+        if not os.path.exists(filename) or os.path.getsize(filename) <= 2:
+            return 0
+        with self._lock:
+            if self._connect().execute(
+                "SELECT 1 FROM entries WHERE namespace=? LIMIT 1", (self.namespace,)
+            ).fetchone():
+                return 0
+            try:
+                with open(filename, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return 0
+            for key, value in data.items():
+                self._pending[key] = json.dumps(value, ensure_ascii=False)
+            self.flush()
+        print(f"예전 캐시 {filename} 에서 {self.namespace} 항목 {len(data)}개를 {self.path} 로 가져왔습니다")
+        return len(data)
+
+
+# ---- 유지보수 (cache_tool.py) ----
+
+def _open(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def cache_stats(path: str) -> List[Dict]:
+    """namespace/version 별 항목 수, 크기(바이트), 누적 적중/실패 수."""
+    conn = _open(path)
+    try:
+        rows = conn.execute(
+            "SELECT e.namespace, e.version, COUNT(*), SUM(LENGTH(CAST(e.key AS BLOB)) + "
+            "LENGTH(CAST(e.value AS BLOB))), MIN(e.updated), MAX(e.updated), "
+            "COALESCE(s.hits, 0), COALESCE(s.misses, 0) "
+            "FROM entries e LEFT JOIN stats s ON s.namespace = e.namespace AND s.version = e.version "
+            "GROUP BY e.namespace, e.version ORDER BY e.namespace, e.version"
+        ).fetchall()
+    finally:
+        conn.close()
+    keys = ("namespace", "version", "entries", "bytes", "oldest", "newest", "hits", "misses")
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def file_size(path: str) -> int:
+    """SQLite 파일 + WAL/SHM 크기 합."""
+    return sum(os.path.getsize(p) for p in (path, path + "-wal", path + "-shm") if os.path.exists(p))
+
+
+def compact_record(value: Dict) -> Dict:
+    """
+    검사 결과를 최소 형태로 줄인다. meta(original/corrected/timestamp/길이)는 문장 텍스트를
+    반복할 뿐이라 버리고, 판정에 필요한 flag 와 교정안만 남긴다.
+    지적 위치(meta.matches)는 화이트리스트 후처리에 쓰이므로 남긴다.
+    """
+    record = {"flag": bool(value.get("flag"))}
+    for field in ("suggestion", "suggestions"):
+        if value.get(field):
+            record[field] = value[field]
+    matches = (value.get("meta") or {}).get("matches")
+    if matches:
+        record["meta"] = {"matches": matches}
+    return record
+
+
+def compact(path: str, current_versions: Optional[Dict[str, str]] = None,
+            skip: Iterable[str] = ("extract",)) -> Dict[str, int]:
+    """
+    검사 결과를 최소 형태로 다시 쓰고, current_versions 에 없는 예전 버전 항목을 지운 뒤 VACUUM.
+
+    Returns:
+        {"rewritten": n, "dropped": n, "before": 바이트, "after": 바이트}
+    """
+    before = file_size(path)
+    skip = set(skip)
+    rewritten = dropped = 0
+    conn = _open(path)
+    try:
+        with conn:
+            for namespace, version in conn.execute(
+                    "SELECT DISTINCT namespace, version FROM entries").fetchall():
+                if current_versions and namespace in current_versions \
+                        and current_versions[namespace] != version:
+                    dropped += conn.execute("DELETE FROM entries WHERE namespace=? AND version=?",
+                                            (namespace, version)).rowcount
+                    continue
+                if namespace in skip:
+                    continue
+                rows = conn.execute("SELECT key, value FROM entries WHERE namespace=? AND version=?",
+                                    (namespace, version)).fetchall()
+                updates = []
+                for key, value in rows:
+                    small = json.dumps(compact_record(json.loads(value)), ensure_ascii=False)
+                    if small != value:
+                        updates.append((small, namespace, version, key))
+                conn.executemany("UPDATE entries SET value=? WHERE namespace=? AND version=? AND key=?",
+                                 updates)
+                rewritten += len(updates)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return {"rewritten": rewritten, "dropped": dropped, "before": before, "after": file_size(path)}
+
+
+def export_entries(path: str, out: str, namespaces: Optional[Iterable[str]] = None) -> int:
+    """항목을 JSON Lines 로 내보낸다 (out 이 .gz 로 끝나면 gzip). 내보낸 수 반환."""
+    namespaces = set(namespaces or [])
+    conn = _open(path)
+    count = 0
+    opener = gzip.open if out.endswith(".gz") else open
+    try:
+        with opener(out, "wt", encoding="utf-8") as f:
+            for namespace, version, key, value, updated in conn.execute(
+                    "SELECT namespace, version, key, value, updated FROM entries "
+                    "ORDER BY namespace, version, key"):
+                if namespaces and namespace not in namespaces:
+                    continue
+                f.write(json.dumps({"namespace": namespace, "version": version, "key": key,
+                                    "value": json.loads(value), "updated": updated},
+                                   ensure_ascii=False) + "\n")
+                count += 1
+    finally:
+        conn.close()
+    return count
+
+
+def _read_source(source: str) -> Iterator[Tuple[str, str, str, str, float]]:
+    """다른 캐시 파일(SQLite 또는 JSON Lines[.gz])의 항목."""
+    with open(source, "rb") as f:
+        is_sqlite = f.read(16) == b"SQLite format 3\x00"
+    if is_sqlite:
+        conn = sqlite3.connect(f"file:{source}?mode=ro", uri=True)
+        try:
+            yield from conn.execute("SELECT namespace, version, key, value, updated FROM entries")
+        finally:
+            conn.close()
+        return
+    opener = gzip.open if source.endswith(".gz") else open
+    with opener(source, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                yield (row["namespace"], str(row["version"]), row["key"],
+                       json.dumps(row["value"], ensure_ascii=False), float(row.get("updated", 0)))
+
+
+def merge_entries(path: str, sources: Iterable[str], batch_size: int = 1000) -> Dict[str, int]:
+    """
+    여러 캐시 파일을 path 로 병합. 같은 키가 있으면 더 최근(updated) 항목이 이긴다.
+
+    Returns:
+        {"read": n, "written": n}
+    """
+    conn = _open(path)
+    read = written = 0
+    try:
+        for source in sources:
+            batch = []
+            for row in _read_source(source):
+                read += 1
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    written += _upsert_newer(conn, batch)
+                    batch = []
+            written += _upsert_newer(conn, batch)
+    finally:
+        conn.close()
+    return {"read": read, "written": written}
+
+
+def _upsert_newer(conn: sqlite3.Connection, rows: List[Tuple]) -> int:
+    if not rows:
+        return 0
+    before = conn.total_changes
+    with conn:
+        conn.executemany(
+            "INSERT INTO entries (namespace, version, key, value, updated) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(namespace, version, key) DO UPDATE SET "
+            "value = excluded.value, updated = excluded.updated WHERE excluded.updated > entries.updated",
+            rows,
+        )
+    return conn.total_changes - before
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+검사기별 실행 레인
+검사기마다 실행 방식(thread, process, async)과 동시성 한도가 다른 레인을 두고,
+문장을 모든 레인에 동시에 보낸 뒤 레인 결과가 다 모이면 문장 결과로 합친다.
+느린 API 검사기가 빠른 로컬 검사기(규칙, 띄어쓰기)를 붙잡지 않는다.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .pipeline import MicroBatcher
+
+LANE_KINDS = ("thread", "process", "async")
+
+
+class Lane:
+    """
+    검사기 하나의 실행 레인.
+
+    Args:
+        checker: 검사기 (check_batch, async 레인이면 submit_async 필요)
+        kind: thread - 레인 전용 스레드 풀에서 check_batch
+              process - 검사기가 자체 프로세스 풀로 추론, 레인 스레드는 배치 분배와 대기만
+              async - submit_async 로 이벤트 루프에 바로 예약 (스레드 점유 없음, 배치 없음)
+        limit: 동시에 처리하는 배치 수 (async 는 검사기 자체 동시 요청 한도를 따름)
+    """
+
+    def __init__(self, checker, kind: str, limit: int, batch_size: int = 8, max_wait: float = 0.05):
+        if kind not in LANE_KINDS:
+            raise ValueError(f"알 수 없는 레인 종류: {kind} (가능: {', '.join(LANE_KINDS)})")
+        self.checker = checker
+        self.name = checker.name
+        self.kind = kind
+        self.limit = max(1, limit)
+        self.sentences = 0
+        # 검사기 호출에 쓴 시간 합 (사용률 계산용)
+        self.busy = 0.0
+        self._lock = threading.Lock()
+        self._executor = None
+        self._batcher = None
+        if kind != "async":
+            self._executor = ThreadPoolExecutor(max_workers=self.limit, thread_name_prefix=f"lane-{self.name}")
+            self._batcher = MicroBatcher(self._check_batch, self._executor,
+                                         batch_size=batch_size, max_wait=max_wait)
+
+    @property
+    def batches(self) -> int:
+        return self._batcher.batches if self._batcher else 0
+
+    def submit(self, sentence: str) -> Future:
+        with self._lock:
+            self.sentences += 1
+        if self._batcher is None:
+            return self.checker.submit_async(sentence)
+        return self._batcher.submit(sentence)
+
+    def _check_batch(self, sentences: List[str]) -> List[Dict]:
+        start = time.perf_counter()
+        try:
+            return self.checker.check_batch(sentences)
+        except Exception as e:
+            print(f"검사기 {self.name} 오류: {e}")
+            raise
+        finally:
+            with self._lock:
+                self.busy += time.perf_counter() - start
+
+    def describe(self) -> str:
+        limit = getattr(self.checker, "max_in_flight", self.limit) if self.kind == "async" else self.limit
+        return f"{self.name}({self.kind}×{limit})"
+
+    def close(self):
+        if self._batcher is not None:
+            self._batcher.close()
+            self._executor.shutdown()
+
+
+class _Job:
+    """문장 하나의 진행 상태."""
+    __slots__ = ("sentence", "spans", "merged", "future")
+
+    def __init__(self, sentence: str, spans):
+        self.sentence = sentence
+        self.spans = spans
+        self.merged = ([], {}, {})
+        self.future: Future = Future()
+
+
+class LaneScheduler:
+    """
+    문장을 검사기별 레인에 보내고 결과를 (flags, suggestions, metas) 로 합친다.
+    실행 계획(plan)이 있으면 단계별로 진행하며, 앞 단계 레인이 모두 끝나야 다음 단계 정책을 판단한다.
+    검사기 초기화가 끝나기 전에 들어온 문장은 모아 두었다가 레인이 준비되면 보낸다.
+
+    Args:
+        checkers_future: 검사기 목록 Future (백그라운드 초기화)
+        make_lane: 검사기 → Lane
+        merge: merge(merged, name, result) - 검사기 결과 하나를 문장 결과에 합치는 함수
+        whitelist: 화이트리스트 (문장마다 구간을 한 번 찾아 검사기별 apply_whitelist 에 넘김)
+        plan: ExecutionPlan
+    """
+
+    def __init__(self, checkers_future: Future, make_lane: Callable, merge: Callable,
+                 whitelist=None, plan=None):
+        self.make_lane = make_lane
+        self.merge = merge
+        self.whitelist = whitelist
+        self.plan = plan
+        self.lanes: List[Lane] = []
+        self._stages: Optional[List[Tuple[List[Lane], object]]] = None
+        self._waiting: List[_Job] = []
+        self._lock = threading.Lock()
+        checkers_future.add_done_callback(self._on_checkers)
+
+    def _on_checkers(self, future: Future):
+        try:
+            checkers = future.result()
+            lanes = {id(checker): self.make_lane(checker) for checker in checkers}
+            if self.plan is not None:
+                stages = [([lanes[id(c)] for c in stage], policy) for stage, policy in self.plan.arrange(checkers)]
+            else:
+                stages = [([lanes[id(c)] for c in checkers], None)]
+            error = None
+        except BaseException as e:
+            lanes, stages, error = {}, [], e
+        with self._lock:
+            self.lanes = list(lanes.values())
+            self._stages = stages
+            waiting, self._waiting = self._waiting, []
+        for job in waiting:
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                self._advance(job, 0)
+
+    def submit(self, sentence: str) -> Future:
+        spans = self.whitelist.spans(sentence) if self.whitelist else []
+        job = _Job(sentence, spans)
+        with self._lock:
+            if self._stages is None:
+                self._waiting.append(job)
+                return job.future
+        self._advance(job, 0)
+        return job.future
+
+    def _advance(self, job: _Job, index: int):
+        """index 단계부터 이 문장을 보낼 단계를 찾아 레인에 제출 (없으면 완료)."""
+        try:
+            while index < len(self._stages):
+                lanes, policy = self._stages[index]
+                selected = policy is None or policy.selects_all or policy.selects(job.sentence, job.merged[0])
+                if self.plan is not None:
+                    for lane in lanes:
+                        self.plan.record(lane.checker, 1, int(selected))
+                if selected and lanes:
+                    break
+                index += 1
+            else:
+                job.future.set_result(job.merged)
+                return
+
+            futures = [lane.submit(job.sentence) for lane in lanes]
+            remaining = [len(futures)]
+            lock = threading.Lock()
+
+            def on_done(_):
+                with lock:
+                    remaining[0] -= 1
+                    if remaining[0]:
+                        return
+                self._finish_stage(job, index, lanes, futures)
+
+            for future in futures:
+                future.add_done_callback(on_done)
+        except BaseException as e:
+            job.future.set_exception(e)
+
+    def _finish_stage(self, job: _Job, index: int, lanes: List[Lane], futures: List[Future]):
+        """단계의 모든 레인이 끝나면 검사기 순서대로 결과를 합치고 다음 단계로."""
+        try:
+            for lane, future in zip(lanes, futures):
+                if future.exception() is not None:
+                    # 검사기 오류는 그 검사기 결과만 빠진다 (기존 check_sentences 와 같음)
+                    continue
+                result = future.result()
+                if job.spans:
+                    result = lane.checker.apply_whitelist(job.sentence, result, job.spans)
+                self.merge(job.merged, lane.name, result)
+        except BaseException as e:
+            job.future.set_exception(e)
+            return
+        self._advance(job, index + 1)
+
+    def describe(self) -> str:
+        return ", ".join(lane.describe() for lane in self.lanes)
+
+    def utilization(self, wall: float) -> Dict[str, float]:
+        """레인별 사용률 (검사기 호출 시간 / (동시성 한도 × 경과 시간), async 레인 제외)."""
+        return {lane.name: lane.busy / (lane.limit * wall)
+                for lane in self.lanes if lane.kind != "async" and wall > 0}
+
+    def close(self):
+        for lane in self.lanes:
+            lane.close()
@@ -2,87 +2,431 @@
 from __future__ import annotations
 from typing import Optional
 
+import hashlib
+import importlib.util
 import os
-from typing import Generator, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Generator, Iterable, List, NamedTuple, Set, Tuple
 import fitz  # PyMuPDF
 
-# 표/레이아웃 처리를 위한 pdfplumber (선택적)
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except Exception:
-    pdfplumber = None
-    PDFPLUMBER_AVAILABLE = False
-
-# OCR 모듈/경로 준비
-try:
-    import pytesseract
-    from PIL import Image
-
-    if os.name == "nt":
-        default = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-        if os.path.exists(default):
-            pytesseract.pytesseract.tesseract_cmd = default
-        else:
-            from shutil import which
-            exe = which("tesseract")
-            if exe:
-                pytesseract.pytesseract.tesseract_cmd = exe
-    OCR_AVAILABLE = True
-except Exception:
-    pytesseract = None
-    Image = None
-    OCR_AVAILABLE = False
-
-
-def extract_pages(pdf_path: str, use_ocr: bool = False, ocr_threshold: int = 50) -> Generator[Tuple[int, str, bool], None, None]:
+from .cache import DEFAULT_CACHE_PATH, ResultCache
+from .pipeline import process_context
+from .startup import STARTUP
+from .text import running_line_signature
+
+# 표/레이아웃 처리를 위한 pdfplumber, OCR 모듈 (선택적, 실제로 쓸 때 import)
+PDFPLUMBER_AVAILABLE = importlib.util.find_spec("pdfplumber") is not None
+OCR_AVAILABLE = (importlib.util.find_spec("pytesseract") is not None
+                 and importlib.util.find_spec("PIL") is not None)
+pytesseract = None
+Image = None
+
+
+def _load_ocr():
+    """pytesseract/PIL 을 처음 OCR 할 때 import 하고 tesseract 경로 준비."""
+    global pytesseract, Image, OCR_AVAILABLE
+    if pytesseract is not None or not OCR_AVAILABLE:
+        return
+    try:
+        with STARTUP.section("import pytesseract, PIL"):
+            import pytesseract as _pytesseract
+            from PIL import Image as _Image
+
+        if os.name == "nt":
+            default = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+            if os.path.exists(default):
+                _pytesseract.pytesseract.tesseract_cmd = default
+            else:
+                from shutil import which
+                exe = which("tesseract")
+                if exe:
+                    _pytesseract.pytesseract.tesseract_cmd = exe
+        pytesseract, Image = _pytesseract, _Image
+    except Exception:
+        OCR_AVAILABLE = False
+
+# 병렬 추출 시 작업자 한 번에 넘기는 최대 페이지 수
+_MAX_CHUNK_PAGES = 16
+
+# OCR 렌더링 해상도 상한 (메가픽셀) — OCR 작업자 한 명이 잡는 메모리의 상한이기도 하다
+_OCR_MAX_MEGAPIXELS = 12
+
+# 동시 OCR 렌더링 메가픽셀 예산 기본값 (최대 렌더링 4장, RGB 약 150MB)
+DEFAULT_OCR_MEMORY_MP = 4 * _OCR_MAX_MEGAPIXELS
+
+# 추출 캐시 레코드 형식이 바뀌면 올려서 기존 항목을 무효화
+_EXTRACT_CACHE_VERSION = 1
+
+
+class _ExtractOptions(NamedTuple):
+    """작업자 프로세스로 넘기는 추출 설정"""
+    use_ocr: bool
+    ocr_threshold: int
+    detect_tables: bool
+    defer_ocr: bool = False  # True면 OCR은 별도 OCR 풀에서 수행
+    ocr_mode: str = "page"  # "page": 페이지 전체, "region": 텍스트 레이어 없는 이미지 영역만
+
+    def cache_tag(self) -> str:
+        """캐시 키에 붙는 설정 식별자 (설정이 다르면 다른 항목)"""
+        ocr = f"ocr{self.ocr_threshold}-{self.ocr_mode}" if self.use_ocr else "noocr"
+        tables = "detect" if self.detect_tables else "all"
+        return f"v{_EXTRACT_CACHE_VERSION}:{ocr}:{tables}"
+
+
+def extract_pages(pdf_path: str, use_ocr: bool = False, ocr_threshold: int = 50, workers: int = 1,
+                  detect_tables: bool = True, stats: Optional[Dict[str, int]] = None,
+                  cache: Optional["ExtractionCache"] = None, ocr_workers: int = 1,
+                  ocr_memory_mp: Optional[int] = None, ocr_mode: str = "page") -> Generator[Tuple[int, str, bool], None, None]:
     """
     페이지별 텍스트 추출 제너레이터
+    workers > 1 이면 페이지 범위를 나눠 여러 프로세스에서 추출하고, 순서는 그대로 유지한다.
+    detect_tables 이면 PyMuPDF 도형 정보로 표가 있을 법한 페이지만 pdfplumber로 넘긴다.
+    stats 딕셔너리를 넘기면 경로별 페이지 수("fitz", "pdfplumber", "cache")를 누적한다.
+    cache 를 넘기면 페이지 지문이 같은 페이지는 디스크에서 바로 돌려준다.
+    ocr_workers > 1 이면 OCR 대상 페이지를 OCR 전용 프로세스 풀에서 렌더링/인식한다.
+    풀 크기는 ocr_memory_mp(동시 렌더링 메가픽셀 예산, None이면 DEFAULT_OCR_MEMORY_MP, 0이면 제한 없음)로도 제한된다.
+    ocr_mode="region" 이면 텍스트 레이어가 없는 이미지 영역만 OCR해 본문과 읽기 순서로 합친다.
     Yields: (page_number, text, is_ocr_used)
     """
-    doc = plumber = None
+    if stats is None:
+        stats = {}
+    defer_ocr = use_ocr and OCR_AVAILABLE and ocr_workers > 1
+    opts = _ExtractOptions(use_ocr, ocr_threshold, detect_tables, defer_ocr, ocr_mode)
+
+    if cache is not None:
+        keys = [f"{fp}:{opts.cache_tag()}" for fp in page_fingerprints(pdf_path)]
+    else:
+        keys = [None] * count_pages(pdf_path)
+
+    cached = {}
+    for idx, key in enumerate(keys):
+        record = cache.get(key) if key is not None else None
+        if record is not None:
+            cached[idx] = record
+    missing = [idx for idx in range(len(keys)) if idx not in cached]
+
+    try:
+        if workers <= 1:
+            extracted = _iter_records(pdf_path, missing, opts, stats)
+        else:
+            extracted = _iter_records_parallel(pdf_path, missing, opts, stats, workers)
+
+        def ordered():
+            for idx in range(len(keys)):
+                record = cached.pop(idx, None)
+                if record is not None:
+                    stats["cache"] = stats.get("cache", 0) + 1
+                    yield idx, record, False
+                else:
+                    done_idx, record = next(extracted)
+                    assert done_idx == idx
+                    yield idx, record, True
+
+        records = ordered()
+        if defer_ocr:
+            if ocr_memory_mp is None:
+                ocr_memory_mp = DEFAULT_OCR_MEMORY_MP
+            if ocr_memory_mp > 0:
+                ocr_workers = min(ocr_workers, max(1, ocr_memory_mp // _OCR_MAX_MEGAPIXELS))
+            records = _schedule_ocr(pdf_path, records, ocr_workers, ocr_mode)
+
+        for idx, record, is_new in records:
+            if is_new and keys[idx] is not None and not record.get("error"):
+                cache.set(keys[idx], record)
+            yield _assemble_page(idx, record)
+    finally:
+        if cache is not None:
+            cache.flush()
+
+
+def _iter_records_parallel(pdf_path: str, indices: List[int], opts: _ExtractOptions,
+                           stats: Dict[str, int], workers: int) -> Generator[Tuple[int, Dict], None, None]:
+    """페이지 목록을 청크로 나눠 프로세스 풀에서 추출, 순서대로 (idx, 레코드) 반환"""
+    chunk = max(1, min(_MAX_CHUNK_PAGES, -(-len(indices) // (workers * 4))))
+    chunks = [indices[pos:pos + chunk] for pos in range(0, len(indices), chunk)]
+
+    # 진행 중인 청크 수를 제한해 결과가 메모리에 쌓이지 않게 한다
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_context()) as executor:
+        pending = deque()
+        for part in chunks:
+            pending.append(executor.submit(_extract_chunk, pdf_path, part, opts))
+            if len(pending) >= workers * 2:
+                yield from _merge_chunk(pending.popleft().result(), stats)
+        while pending:
+            yield from _merge_chunk(pending.popleft().result(), stats)
+
+
+def _schedule_ocr(pdf_path: str, records: Iterable[Tuple[int, Dict, bool]],
+                  workers: int, mode: str) -> Generator[Tuple[int, Dict, bool], None, None]:
+    """
+    OCR이 필요한 페이지를 OCR 프로세스 풀에 넘기고, 결과를 페이지 순서대로 다시 맞춰 돌려준다.
+    앞선 페이지를 기다리는 동안 쌓이는 페이지 수는 workers * 4 로 제한한다.
+    """
+    window = deque()  # (idx, record, is_new, future)
+
+    def pop_head():
+        idx, record, is_new, future = window.popleft()
+        if future is not None:
+            try:
+                record["ocr"] = future.result()
+            except Exception as e:
+                print(f"페이지 {idx + 1} OCR 실패: {e}")
+                record["error"] = str(e)
+        return idx, record, is_new
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=process_context()) as executor:
+        for idx, record, is_new in records:
+            future = None
+            if record.pop("needs_ocr", False):
+                future = executor.submit(_ocr_job, pdf_path, idx, mode)
+            window.append((idx, record, is_new, future))
+
+            # 이미 끝난 앞쪽 페이지는 바로 내보내고, 창이 가득 차면 맨 앞을 기다린다
+            while window and (window[0][3] is None or window[0][3].done()):
+                yield pop_head()
+            if len(window) >= workers * 4:
+                yield pop_head()
+        while window:
+            yield pop_head()
+
+
+# OCR 작업자 프로세스별로 열어 둔 문서 핸들
+_WORKER_DOCS: Dict[str, "fitz.Document"] = {}
+
+
+def _ocr_job(pdf_path: str, idx: int, mode: str) -> str:
+    """OCR 작업자 프로세스 진입점: 페이지 렌더링 + 인식"""
+    doc = _WORKER_DOCS.get(pdf_path)
+    if doc is None:
+        doc = _WORKER_DOCS[pdf_path] = fitz.open(pdf_path)
+    return _run_ocr(doc.load_page(idx), mode)
+
+
+def _run_ocr(page, mode: str) -> str:
+    """OCR 모드에 따라 페이지 전체 또는 이미지 영역 OCR"""
+    if mode == "region":
+        return _ocr_regions(page, lang="kor+eng", base_dpi=180)
+    return _ocr_page(page, lang="kor+eng", base_dpi=180)
+
+
+def _merge_chunk(result, stats: Dict[str, int]) -> List[Tuple[int, Dict]]:
+    """작업자 결과에서 통계를 합치고 레코드 목록만 반환"""
+    records, chunk_stats = result
+    for key, value in chunk_stats.items():
+        stats[key] = stats.get(key, 0) + value
+    return records
+
+
+def _iter_records(pdf_path: str, indices: Iterable[int], opts: _ExtractOptions,
+                  stats: Dict[str, int]) -> Generator[Tuple[int, Dict], None, None]:
+    """fitz/pdfplumber 핸들을 열고 지정한 페이지를 순서대로 추출"""
+    doc = None
+    plumber = _LazyPlumber(pdf_path)
     try:
         doc = fitz.open(pdf_path)
-        if PDFPLUMBER_AVAILABLE:
-            plumber = pdfplumber.open(pdf_path)
-        for idx in range(len(doc)):
-            page = doc.load_page(idx)
-            page_no = idx + 1
-
-            text = page.get_text("text") or ""
-
-            # 표 영역 텍스트 추출(pdfplumber)
-            if plumber:
-                try:
-                    p_page = plumber.pages[idx]
-                    tables = p_page.extract_tables()
-                    table_texts = []
-                    for table in tables:
-                        rows = [" ".join(filter(None, row)) for row in table]
-                        table_texts.append("\n".join(rows))
-                    if table_texts:
-                        text += "\n" + "\n".join(table_texts)
-                except Exception:
-                    pass
-
-            is_ocr = False
-
-            if use_ocr and OCR_AVAILABLE and _need_ocr(text, ocr_threshold):
-                try:
-                    ocr_text = _ocr_page(page, lang="kor+eng", base_dpi=180)
-                    if len(ocr_text.strip()) > len(text.strip()):
-                        text = ocr_text
-                        is_ocr = True
-                except Exception as e:
-                    # 실패 시 기본 텍스트 사용
-                    print(f"페이지 {page_no} OCR 실패: {e}")
-
-            yield page_no, text, is_ocr
+        for idx in indices:
+            yield idx, _extract_record(doc, plumber, idx, opts, stats)
     finally:
         if doc is not None:
             doc.close()
-        if plumber is not None:
-            plumber.close()
+        plumber.close()
+
+
+def _extract_chunk(pdf_path: str, indices: List[int], opts: _ExtractOptions) -> Tuple[List[Tuple[int, Dict]], Dict[str, int]]:
+    """작업자 프로세스 진입점: 자체 핸들로 지정한 페이지 추출"""
+    stats: Dict[str, int] = {}
+    records = list(_iter_records(pdf_path, indices, opts, stats))
+    return records, stats
+
+
+class _LazyPlumber:
+    """표가 있는 페이지를 처음 만날 때에만 pdfplumber 문서를 연다."""
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self._pdf = None
+
+    def page(self, idx: int):
+        if self._pdf is None:
+            with STARTUP.section("import pdfplumber"):
+                import pdfplumber
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf.pages[idx]
+
+    def close(self):
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+
+def _extract_record(doc, plumber: _LazyPlumber, idx: int, opts: _ExtractOptions, stats: Dict[str, int]) -> Dict:
+    """
+    단일 페이지 추출 (fitz 텍스트 → 표가 있으면 pdfplumber → 필요 시 OCR)
+    Returns: {"text": 본문, "tables": 표 텍스트, "ocr": OCR 결과 또는 None[, "error": OCR 오류]}
+    """
+    page = doc.load_page(idx)
+    page_no = idx + 1
+
+    text = page.get_text("text") or ""
+    table_text = ""
+
+    # 표 영역 텍스트 추출(pdfplumber)
+    use_plumber = PDFPLUMBER_AVAILABLE and (not opts.detect_tables or _has_table_lines(page))
+    path = "pdfplumber" if use_plumber else "fitz"
+    stats[path] = stats.get(path, 0) + 1
+    if use_plumber:
+        try:
+            p_page = plumber.page(idx)
+            tables = p_page.extract_tables()
+            table_texts = []
+            for table in tables:
+                rows = [" ".join(filter(None, row)) for row in table]
+                table_texts.append("\n".join(rows))
+            table_text = "\n".join(table_texts)
+        except Exception:
+            pass
+
+    record = {"text": text, "tables": table_text, "ocr": None}
+    combined = text + "\n" + table_text if table_text else text
+
+    if opts.use_ocr and OCR_AVAILABLE and _need_ocr(combined, opts.ocr_threshold):
+        if opts.defer_ocr:
+            record["needs_ocr"] = True
+            return record
+        try:
+            record["ocr"] = _run_ocr(page, opts.ocr_mode)
+        except Exception as e:
+            # 실패 시 기본 텍스트 사용 (캐시하지 않아 다음 실행에서 재시도)
+            print(f"페이지 {page_no} OCR 실패: {e}")
+            record["error"] = str(e)
+
+    return record
+
+
+def _assemble_page(idx: int, record: Dict) -> Tuple[int, str, bool]:
+    """추출 레코드를 (page_number, text, is_ocr_used)로 조립"""
+    text = record["text"]
+    if record.get("tables"):
+        text += "\n" + record["tables"]
+
+    ocr_text = record.get("ocr")
+    if ocr_text and len(ocr_text.strip()) > len(text.strip()):
+        return idx + 1, ocr_text, True
+    return idx + 1, text, False
+
+
+def _has_table_lines(page, min_len: float = 8.0, tol: float = 1.0, min_cells: int = 2) -> bool:
+    """
+    pdfplumber 기본 전략(lines)이 표로 인식할 만한 괘선 격자가 있는지 PyMuPDF 도형으로 판단.
+    가로선과 세로선이 실제로 교차해 만드는 칸이 min_cells 개 이상이면 표 후보로 본다
+    (따로 떨어진 상자나 밑줄, 장식선만 있는 페이지는 제외).
+    """
+    horizontal = []  # (y, x0, x1)
+    vertical = []  # (x, y0, y1)
+    try:
+        drawings = page.get_drawings()
+    except Exception:
+        return True  # 판단 불가 시 기존처럼 pdfplumber 사용
+
+    for path in drawings:
+        for item in path["items"]:
+            kind = item[0]
+            if kind == "l":
+                p1, p2 = item[1], item[2]
+                if abs(p1.y - p2.y) <= tol and abs(p1.x - p2.x) >= min_len:
+                    horizontal.append((p1.y, min(p1.x, p2.x), max(p1.x, p2.x)))
+                elif abs(p1.x - p2.x) <= tol and abs(p1.y - p2.y) >= min_len:
+                    vertical.append((p1.x, min(p1.y, p2.y), max(p1.y, p2.y)))
+            elif kind in ("re", "qu"):
+                rect = item[1] if kind == "re" else item[1].rect
+                if rect.width >= min_len:
+                    horizontal += [(rect.y0, rect.x0, rect.x1), (rect.y1, rect.x0, rect.x1)]
+                if rect.height >= min_len:
+                    vertical += [(rect.x0, rect.y0, rect.y1), (rect.x1, rect.y0, rect.y1)]
+
+    horizontal = _merge_rulings(horizontal, tol)
+    vertical = _merge_rulings(vertical, tol)
+    if len(horizontal) < 2 or len(vertical) < 2:
+        return False
+
+    # 가로선마다 교차하는 세로선 집합
+    crossings = [
+        {j for j, (x, y0, y1) in enumerate(vertical)
+         if x0 - tol <= x <= x1 + tol and y0 - tol <= y <= y1 + tol}
+        for y, x0, x1 in horizontal
+    ]
+    # 위아래로 이웃한 가로선 쌍이 함께 교차하는 세로선 k개는 칸 k-1개를 만든다
+    cells = 0
+    order = sorted(range(len(horizontal)), key=lambda i: horizontal[i][0])
+    for upper, lower in zip(order, order[1:]):
+        cells += max(0, len(crossings[upper] & crossings[lower]) - 1)
+        if cells >= min_cells:
+            return True
+    return False
+
+
+def _merge_rulings(segments, tol: float) -> List[Tuple[float, float, float]]:
+    """같은 위치(tol 이내)에서 이어지거나 겹치는 괘선을 하나로 합친다. 원소는 (위치, 시작, 끝)."""
+    merged: List[List[float]] = []
+    for pos, start, end in sorted(segments):
+        for seg in merged:
+            if abs(seg[0] - pos) <= tol and start <= seg[2] + tol and seg[1] <= end + tol:
+                seg[1], seg[2] = min(seg[1], start), max(seg[2], end)
+                break
+        else:
+            merged.append([pos, start, end])
+    return [tuple(seg) for seg in merged]
+
+
+def page_fingerprints(pdf_path: str) -> List[str]:
+    """페이지별 내용 지문 목록 (콘텐츠 스트림, 폼 XObject, 이미지 바이트 해시)"""
+    with fitz.open(pdf_path) as doc:
+        return [_page_fingerprint(doc, page) for page in doc]
+
+
+def _page_fingerprint(doc, page) -> str:
+    h = hashlib.sha1()
+    h.update(repr((tuple(page.rect), page.rotation)).encode())
+    h.update(page.read_contents() or b"")
+    for xobj in page.get_xobjects():
+        h.update(doc.xref_stream_raw(xobj[0]) or b"")
+    for img in page.get_images(full=True):
+        h.update(doc.xref_stream_raw(img[0]) or b"")
+    return h.hexdigest()
+
+
+class ExtractionCache(ResultCache):
+    """페이지 지문 → 추출 레코드(본문/표/OCR) 캐시 (검사기 결과와 같은 SQLite 파일 사용 가능)."""
+
+    def __init__(self, filename: str = DEFAULT_CACHE_PATH):
+        super().__init__(filename, "extract", str(_EXTRACT_CACHE_VERSION), capacity=2000)
+        # 캐시 파일 옆의 예전 JSON 추출 캐시 (키/레코드 형식이 같으므로 그대로 가져온다)
+        self.migrate_json("extract_cache.json")
+
+
+def find_running_lines(pdf_path: str, band: float = 0.1, min_pages: int = 3) -> Set[str]:
+    """
+    문서 전체에서 반복되는 머리글/바닥글/쪽번호 줄의 서명을 찾습니다.
+    페이지 위·아래 band 비율 영역의 줄만 보고, 같은 서명이 min_pages 페이지 이상에
+    나오면 반복 줄로 봅니다 (숫자는 서명에서 #로 바뀌므로 쪽번호가 달라도 같은 줄).
+    """
+    pages_by_sig: Dict[str, int] = {}
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            rect = page.rect
+            margin = rect.height * band
+            bands = (fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + margin),
+                     fitz.Rect(rect.x0, rect.y1 - margin, rect.x1, rect.y1))
+            sigs = set()
+            for clip in bands:
+                for line in (page.get_text("text", clip=clip) or "").split("\n"):
+                    sig = running_line_signature(line)
+                    if sig:
+                        sigs.add(sig)
+            for sig in sigs:
+                pages_by_sig[sig] = pages_by_sig.get(sig, 0) + 1
+    return {sig for sig, count in pages_by_sig.items() if count >= min_pages}
 
 
 def count_pages(pdf_path: str) -> int:
@@ -96,14 +440,15 @@ def _need_ocr(text: str, threshold: int) -> bool:
     return len((text or "").strip()) < int(threshold)
 
 
-def _page_pixmap(page, dpi: int, alpha: bool = False):
+def _page_pixmap(page, dpi: int, alpha: bool = False, clip=None):
     """PNG 인코딩 없이 Pixmap 생성 (빠름)"""
     scale = max(0.5, dpi / 72.0)
     mat = fitz.Matrix(scale, scale)
-    return page.get_pixmap(matrix=mat, alpha=alpha)
+    return page.get_pixmap(matrix=mat, alpha=alpha, clip=clip)
 
 
 def _pixmap_to_pil(pix) -> Optional[Image.Image]:
+    _load_ocr()
     if Image is None:
         return None
     if pix.alpha:
@@ -112,6 +457,7 @@ def _pixmap_to_pil(pix) -> Optional[Image.Image]:
 
 def _ocr_page(page, lang: str = "kor+eng", base_dpi: int = 180) -> str:
     """OCR 실행 (해상도 적응)"""
+    _load_ocr()
     if not (OCR_AVAILABLE and pytesseract and Image):
         return ""
 
@@ -119,7 +465,7 @@ def _ocr_page(page, lang: str = "kor+eng", base_dpi: int = 180) -> str:
     for _ in range(3):  # 과도한 해상도일 때 단계적으로 낮춤
         pix = _page_pixmap(page, dpi=dpi, alpha=False)
         mp = (pix.width * pix.height) / 1_000_000
-        if mp <= 12:
+        if mp <= _OCR_MAX_MEGAPIXELS:
             break
         dpi = max(96, int(dpi * 0.75))
 
@@ -127,3 +473,88 @@ def _ocr_page(page, lang: str = "kor+eng", base_dpi: int = 180) -> str:
     if img is None:
         return ""
     return pytesseract.image_to_string(img, lang=lang)
+
+
+def _ocr_regions(page, lang: str = "kor+eng", base_dpi: int = 180, min_side: float = 24.0) -> str:
+    """
+    텍스트 레이어가 없는 이미지 영역만 OCR하고, 기존 텍스트 블록과 읽기 순서(위→아래, 왼→오른)로 합친다.
+    영역별 DPI는 영역 크기로 한 번에 정해 재렌더링하지 않는다.
+    """
+    _load_ocr()
+    if not (OCR_AVAILABLE and pytesseract and Image):
+        return ""
+
+    text_blocks = [b for b in page.get_text("blocks") if b[6] == 0 and b[4].strip()]
+    text_rects = [fitz.Rect(b[:4]) for b in text_blocks]
+
+    regions = []
+    for info in page.get_image_info():
+        rect = fitz.Rect(info["bbox"]) & page.rect
+        if rect.is_empty or rect.width < min_side or rect.height < min_side:
+            continue
+        # 이미지 면적 대부분이 텍스트 블록으로 덮여 있으면 이미 텍스트 레이어가 있는 이미지로 본다
+        # (스캔 페이지 위의 쪽번호/머리글처럼 일부만 덮인 이미지는 OCR 대상)
+        if _covered_ratio(rect, text_rects) > 0.5:
+            continue
+        regions.append(rect)
+    regions = _merge_rects(regions)
+
+    if not regions:
+        # 이미지가 없는데 텍스트도 없으면(벡터 외곽선 글자 등) 페이지 전체 OCR
+        return _ocr_page(page, lang=lang, base_dpi=base_dpi) if not text_blocks else ""
+
+    # OCR 영역 안에 있는 텍스트 블록은 OCR 결과에 포함되므로 빼서 중복을 막는다
+    items = [(rect, b[4].strip()) for rect, b in zip(text_rects, text_blocks)
+             if not any(_overlap_ratio(rect, region) > 0.5 for region in regions)]
+    for rect in regions:
+        img = _pixmap_to_pil(_page_pixmap(page, dpi=_fit_dpi(rect, base_dpi), clip=rect))
+        if img is None:
+            continue
+        ocr_text = pytesseract.image_to_string(img, lang=lang).strip()
+        if ocr_text:
+            items.append((rect, ocr_text))
+
+    items.sort(key=lambda item: (round(item[0].y0), item[0].x0))
+    return "\n".join(text for _, text in items)
+
+
+def _overlap_ratio(inner, outer) -> float:
+    """inner 영역 중 outer와 겹치는 면적 비율"""
+    area = inner.get_area()
+    return (inner & outer).get_area() / area if area > 0 else 0.0
+
+
+def _covered_ratio(rect, others) -> float:
+    """rect 면적 중 others 영역이 덮는 비율 (텍스트 블록끼리는 거의 겹치지 않으므로 겹침 면적의 합, 최대 1)"""
+    area = rect.get_area()
+    if area <= 0:
+        return 0.0
+    return min(1.0, sum((rect & other).get_area() for other in others) / area)
+
+
+def _merge_rects(rects) -> list:
+    """겹치는 사각형을 더 합칠 것이 없을 때까지 합친다 (합친 결과가 새로 겹치는 경우 포함)"""
+    merged = [fitz.Rect(r) for r in rects if not r.is_empty]
+    changed = True
+    while changed:
+        changed = False
+        result = []
+        for rect in merged:
+            for i, other in enumerate(result):
+                if rect.intersects(other):
+                    result[i] = other | rect
+                    changed = True
+                    break
+            else:
+                result.append(rect)
+        merged = result
+    return merged
+
+
+def _fit_dpi(rect, base_dpi: int) -> int:
+    """영역을 base_dpi로 렌더링하되 메가픽셀 상한을 넘지 않는 DPI"""
+    area_in2 = (rect.width / 72.0) * (rect.height / 72.0)
+    if area_in2 <= 0:
+        return base_dpi
+    cap_dpi = int((_OCR_MAX_MEGAPIXELS * 1_000_000 / area_in2) ** 0.5)
+    return max(72, min(base_dpi, cap_dpi))
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import queue
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
+
+# 스테이지 종료 표시
+_DONE = object()
+
+
+def process_context():
+    """
+    작업자 프로세스 풀용 multiprocessing 컨텍스트.
+    검사기 초기화/레인/배처 스레드가 도는 프로세스에서 fork 하면 다른 스레드가 잡고 있던
+    잠금(import, 할당자, logging)이 자식에 잠긴 채 복사될 수 있으므로 forkserver(없으면 spawn)를 쓴다.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class ReorderBuffer:
+    """
+    순번(seq)이 붙은 결과를 아무 순서로나 받아 순번 순서대로 내보내는 버퍼.
+    """
+
+    def __init__(self):
+        self._items: Dict[int, Any] = {}
+        self._next = 0
+        self._closed_at: Optional[int] = None
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+
+    def put(self, seq: int, item: Any):
+        """seq 번째 결과 등록."""
+        with self._cond:
+            self._items[seq] = item
+            self._cond.notify_all()
+
+    def close(self, total: int):
+        """총 결과 수 확정 (total 개를 모두 내보내면 반복 종료)."""
+        with self._cond:
+            self._closed_at = total
+            self._cond.notify_all()
+
+    def fail(self, error: BaseException):
+        """스테이지 오류를 소비자 쪽으로 전달."""
+        with self._cond:
+            self._error = error
+            self._cond.notify_all()
+
+    def __iter__(self):
+        while True:
+            with self._cond:
+                while (self._next not in self._items and self._error is None
+                       and self._closed_at != self._next):
+                    self._cond.wait()
+                if self._error is not None:
+                    raise self._error
+                if self._next not in self._items:
+                    return
+                item = self._items.pop(self._next)
+                self._next += 1
+            yield item
+
+
+class DedupIndex:
+    """
+    실행 중 같은 문장은 검사기에 한 번만 보내고, 결과를 모든 등장 위치에 공유한다.
+    키는 NFKC + 앞뒤 공백 제거 텍스트다. 문장 안 띄어쓰기는 spacing 검사 대상이므로
+    공백 차이는 다른 문장으로 본다.
+    검사 중인 문장만 Future를 들고 있고, 끝난 결과는 최근 capacity 개만 남긴다
+    (밀려난 문장이 다시 나오면 다시 제출하며, 검사기 결과 캐시가 있으면 거기서 바로 나온다).
+    """
+
+    def __init__(self, submit: Callable[[str], Future], capacity: int = 10000,
+                 calls: Optional[Callable[[str, Any], int]] = None):
+        self._submit = submit
+        self.capacity = max(0, capacity)
+        # calls(sentence, result): 그 결과를 내려고 실제로 일어난 검사기 호출 수 (중복이 아낀 호출 수 집계용)
+        self._calls = calls
+        self._pending: Dict[str, Future] = {}
+        self._results: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total = 0
+        self.unique = 0
+        self.saved_calls = 0
+
+    @staticmethod
+    def key(sentence: str) -> str:
+        return unicodedata.normalize("NFKC", sentence).strip()
+
+    def submit(self, sentence: str) -> Future:
+        """처음 보는 문장이면 검사를 제출하고, 아니면 검사 중인 Future나 끝난 결과를 돌려준다."""
+        key = self.key(sentence)
+        with self._lock:
+            self.total += 1
+            duplicate = True
+            if key in self._results:
+                self._results.move_to_end(key)
+                future: Future = Future()
+                future.set_result(self._results[key])
+            else:
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._submit(sentence)
+                    self._pending[key] = future
+                    self.unique += 1
+                    duplicate = False
+        # 이미 끝난 Future면 콜백이 바로 실행되므로 잠금 밖에서 등록
+        if duplicate:
+            if self._calls is not None:
+                future.add_done_callback(lambda done: self._count_saved(sentence, done))
+        else:
+            future.add_done_callback(lambda done: self._resolve(key, done))
+        return future
+
+    def _count_saved(self, sentence: str, future: Future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        calls = self._calls(sentence, future.result())
+        with self._lock:
+            self.saved_calls += calls
+
+    def _resolve(self, key: str, future: Future):
+        """검사가 끝나면 Future를 놓고 결과만 남긴다 (실패한 문장은 남기지 않음)."""
+        with self._lock:
+            self._pending.pop(key, None)
+            if self.capacity and not future.cancelled() and future.exception() is None:
+                self._results[key] = future.result()
+                if len(self._results) > self.capacity:
+                    self._results.popitem(last=False)
+
+    @property
+    def duplicates(self) -> int:
+        return self.total - self.unique
+
+
+class MicroBatcher:
+    """
+    개별 제출(submit)을 모아 batch_size 개가 차거나 max_wait 초가 지나면 한 묶음으로
+    executor에 넘기는 스케줄러. 페이지 경계와 상관없이 묶는다.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], List[Any]], executor: Executor,
+                 batch_size: int = 8, max_wait: float = 0.05):
+        self.process_batch = process_batch
+        self.executor = executor
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self.batches = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._collect, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> Future:
+        """항목 하나를 제출하고 결과 Future를 받는다."""
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def close(self):
+        """남은 항목을 내보내고 수집 스레드를 종료."""
+        self._queue.put(_DONE)
+        self._thread.join()
+
+    def _collect(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+
+            if entry is _DONE:
+                if batch:
+                    self._flush(batch)
+                return
+            if entry is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.max_wait
+                batch.append(entry)
+
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+                deadline = None
+
+    def _flush(self, batch: List[Tuple[Any, Future]]):
+        self.batches += 1
+        self.executor.submit(self._run, batch)
+
+    def _run(self, batch: List[Tuple[Any, Future]]):
+        items = [item for item, _ in batch]
+        try:
+            results = self.process_batch(items)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+def _put(q: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+    """소비자가 멈췄으면 포기하는 blocking put."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def run_pipeline(pages: Iterable[Tuple[int, str, bool]],
+                 prepare: Callable[[List[Tuple[int, str, bool]]], List[List[str]]],
+                 submit: Callable[[str], Future],
+                 queue_size: int = 4,
+                 max_pending_pages: int = 8,
+                 split_batch: int = 1) -> Generator[Tuple[int, bool, List[Tuple[str, Any]]], None, None]:
+    """
+    추출 → 문장 분리 → 검사를 동시에 돌리는 스트리밍 파이프라인.
+
+    Args:
+        pages: (page_no, text, is_ocr) 이터러블 (추출 스테이지)
+        prepare: 페이지 묶음을 페이지별 검사 문장 리스트로 바꾸는 함수 (분리 스테이지)
+        submit: 문장 하나의 검사를 작업자 풀에 제출하고 Future를 돌려주는 함수 (검사 스테이지)
+        queue_size: 추출 → 분리 사이 대기열 크기
+        max_pending_pages: 검사 중이거나 소비를 기다리는 최대 페이지 수
+        split_batch: 분리 스테이지가 한 번에 묶어 처리하는 최대 페이지 수
+
+    Yields:
+        페이지 순서대로 (page_no, is_ocr, [(sentence, result 또는 Exception), ...])
+    """
+    extracted: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size))
+    reorder = ReorderBuffer()
+    stop = threading.Event()
+    pending = threading.BoundedSemaphore(max(1, max_pending_pages))
+
+    def extract_stage():
+        try:
+            for page in pages:
+                if not _put(extracted, page, stop):
+                    break
+        except BaseException as e:
+            reorder.fail(e)
+        finally:
+            # 제너레이터면 닫아서 추출 쪽 정리(finally)가 이 스레드에서 실행되게 한다
+            close = getattr(pages, "close", None)
+            if close is not None:
+                close()
+            _put(extracted, _DONE, stop)
+
+    def split_stage():
+        seq = 0
+        done = False
+        try:
+            while not done:
+                try:
+                    page = extracted.get(timeout=0.1)
+                except queue.Empty:
+                    if stop.is_set():
+                        return
+                    continue
+                if page is _DONE:
+                    break
+
+                # 이미 추출된 페이지가 있으면 split_batch 개까지 묶는다
+                batch = [page]
+                while len(batch) < split_batch:
+                    try:
+                        page = extracted.get_nowait()
+                    except queue.Empty:
+                        break
+                    if page is _DONE:
+                        done = True
+                        break
+                    batch.append(page)
+
+                for (page_no, _, is_ocr), sentences in zip(batch, prepare(batch)):
+                    # 소비자가 따라올 때까지 새 페이지 투입을 멈춘다 (역압)
+                    while not pending.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    _submit_page(seq, page_no, is_ocr, sentences)
+                    seq += 1
+            reorder.close(seq)
+        except BaseException as e:
+            reorder.fail(e)
+
+    def _submit_page(seq: int, page_no: int, is_ocr: bool, sentences: List[str]):
+        results: List[Any] = [None] * len(sentences)
+        remaining = [len(sentences)]
+        lock = threading.Lock()
+
+        def finish():
+            reorder.put(seq, (page_no, is_ocr, list(zip(sentences, results))))
+
+        if not sentences:
+            finish()
+            return
+
+        def on_done(future, i):
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = e
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                finish()
+
+        for i, sentence in enumerate(sentences):
+            future = submit(sentence)
+            future.add_done_callback(lambda f, i=i: on_done(f, i))
+
+    threads = [threading.Thread(target=extract_stage, name="extract", daemon=True),
+               threading.Thread(target=split_stage, name="split", daemon=True)]
+    for t in threads:
+        t.start()
+    try:
+        for item in reorder:
+            pending.release()
+            yield item
+    finally:
+        stop.set()
+        for t in threads:
+            t.join(timeout=1.0)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+검사기 실행 계획 (비용 기반 단계 실행)
+싼 검사기를 먼저 돌리고, 비싼 검사기(API 할당량, JVM)는 정책에 맞는 문장에만 보낸다.
+
+계획 파일 예 (data/plan.yaml, 단계 목록):
+    - checkers: [rule, spacing]
+    - checkers: [hanspell, languagetool]
+      policy:
+        flagged: true              # 앞 단계에서 플래그된 문장
+        features: ["되|돼", "\\d"]   # 정규식 중 하나라도 포함하는 문장
+        sample: 0.1                # 나머지 중 10% (문장 해시로 결정, 실행마다 같음)
+
+정책 항목은 OR 로 묶이며, 정책이 없는 단계는 모든 문장을 검사한다.
+"""
+import difflib
+import hashlib
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+_POLICY_KEYS = {"flagged", "features", "sample", "seed"}
+
+
+class Policy:
+    """
+    단계에 들어온 문장 중 검사할 문장 선택.
+
+    Args:
+        flagged: True 면 앞 단계 어느 검사기든 플래그한 문장, 이름 목록이면 그 검사기가 플래그한 문장
+        features: 정규식 목록 (하나라도 찾으면 선택)
+        sample: 나머지 문장 중 선택할 비율 (0~1)
+        seed: 표본 해시에 섞는 값 (단계마다 다른 문장을 뽑고 싶을 때)
+    """
+
+    def __init__(self, flagged=None, features: Sequence[str] = (), sample: float = 0.0, seed: str = ""):
+        self.flagged = flagged
+        self.features = re.compile("|".join(f"(?:{f})" for f in features)) if features else None
+        self.sample = float(sample)
+        self.seed = str(seed)
+        if not 0.0 <= self.sample <= 1.0:
+            raise ValueError(f"sample 은 0~1 사이여야 합니다: {sample}")
+        self.selects_all = not (flagged or features or sample)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> "Policy":
+        if not config:
+            return cls()
+        if not isinstance(config, dict):
+            raise ValueError(f"policy 는 항목 사전이어야 합니다: {config!r}")
+        unknown = set(config) - _POLICY_KEYS
+        if unknown:
+            raise ValueError(f"알 수 없는 정책 항목: {sorted(unknown)} (가능: {sorted(_POLICY_KEYS)})")
+        flagged = config.get("flagged")
+        if isinstance(flagged, str):
+            flagged = [flagged]
+        elif flagged is not None and not isinstance(flagged, (bool, list)):
+            raise ValueError(f"flagged 는 true/false 또는 검사기 이름 목록이어야 합니다: {flagged!r}")
+        features = config.get("features") or []
+        if isinstance(features, str):
+            features = [features]
+        try:
+            return cls(flagged, features, config.get("sample") or 0.0, config.get("seed", ""))
+        except re.error as e:
+            raise ValueError(f"features 정규식 오류: {e}")
+
+    def selects(self, sentence: str, flags: Sequence[str]) -> bool:
+        if self.selects_all:
+            return True
+        if self.flagged and flags:
+            if self.flagged is True or any(name in self.flagged for name in flags):
+                return True
+        if self.features is not None and self.features.search(sentence):
+            return True
+        return self.sample > 0 and sample_fraction(sentence, self.seed) < self.sample
+
+
+def sample_fraction(sentence: str, seed: str = "") -> float:
+    """문장 해시를 [0, 1) 값으로 (같은 문장은 실행/프로세스가 달라도 같은 값)."""
+    digest = hashlib.blake2b(f"{seed}\0{sentence}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2.0 ** 64
+
+
+class ExecutionPlan:
+    """
+    단계 목록 [(검사기 이름들, 정책)]. 계획에 없는 활성 검사기는 마지막 단계로 모든 문장을 검사한다.
+    검사기별로 단계에 들어온 문장 수와 실제로 보낸 문장 수를 센다.
+    """
+
+    def __init__(self, stages: List[Tuple[List[str], Policy]]):
+        self.stages = stages
+        self._lock = threading.Lock()
+        # 이름 → [단계에 들어온 문장 수, 검사한 문장 수, 문장당 비용]
+        self.counts: Dict[str, List[float]] = {}
+
+    @classmethod
+    def from_yaml(cls, path: str, known: Optional[Sequence[str]] = None) -> "ExecutionPlan":
+        """
+        계획 파일 로드. known(검사기 이름 목록)을 주면 단계에 모르는 이름이 있을 때 ValueError
+        (오타 난 검사기가 마지막 단계로 밀려 모든 문장을 검사하는 것을 막는다).
+        """
+        import yaml
+        with open(path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+        # 단계 목록 또는 {stages: [...]}
+        stages_config = config.get("stages") if isinstance(config, dict) else config
+        if not isinstance(stages_config, list) or not stages_config:
+            raise ValueError("stages 목록이 없습니다")
+
+        stages = []
+        seen = set()
+        for index, stage in enumerate(stages_config, 1):
+            if not isinstance(stage, dict) or not stage.get("checkers"):
+                raise ValueError(f"{index}번째 단계에 checkers 목록이 없습니다")
+            names = stage["checkers"]
+            names = [names] if isinstance(names, str) else [str(name) for name in names]
+            if known is not None:
+                unknown = [name for name in names if name not in known]
+                if unknown:
+                    hints = [f"{name} → {close[0]}?" for name in unknown
+                             for close in [difflib.get_close_matches(name, known, n=1)] if close]
+                    raise ValueError(f"{index}번째 단계에 알 수 없는 검사기: {unknown} (가능: {list(known)})"
+                                     + (f", {', '.join(hints)}" if hints else ""))
+            duplicated = seen.intersection(names)
+            if duplicated:
+                raise ValueError(f"검사기가 여러 단계에 있습니다: {sorted(duplicated)}")
+            seen.update(names)
+            try:
+                policy = Policy.from_config(stage.get("policy"))
+            except ValueError as e:
+                raise ValueError(f"{index}번째 단계: {e}")
+            stages.append((names, policy))
+        return cls(stages)
+
+    def arrange(self, checkers) -> List[Tuple[list, Policy]]:
+        """활성 검사기를 단계별로 배치 (단계 안에서는 비용이 싼 순서)."""
+        by_name = {checker.name: checker for checker in checkers}
+        arranged = []
+        placed = set()
+        for names, policy in self.stages:
+            stage = [by_name[name] for name in names if name in by_name]
+            if stage:
+                arranged.append((sorted(stage, key=_cost), policy))
+                placed.update(checker.name for checker in stage)
+        rest = [checker for checker in checkers if checker.name not in placed]
+        if rest:
+            arranged.append((sorted(rest, key=_cost), Policy()))
+        return arranged
+
+    def calls_for(self, checkers, sentence: str, flags: Sequence[str] = ()) -> int:
+        """
+        이 문장을 보낼 검사기 수. flags 는 이 문장의 검사 결과 플래그로, 단계마다 앞 단계 플래그만 보고
+        실제 실행과 같은 판단을 재현한다 (결과를 모르면 빈 목록 → flagged 정책 단계는 빠진다).
+        """
+        calls = 0
+        earlier = set()
+        for stage, policy in self.arrange(checkers):
+            if policy.selects(sentence, [name for name in flags if name in earlier]):
+                calls += len(stage)
+            earlier.update(checker.name for checker in stage)
+        return calls
+
+    def record(self, checker, considered: int, checked: int):
+        with self._lock:
+            counts = self.counts.setdefault(checker.name, [0, 0, _cost(checker)])
+            counts[0] += considered
+            counts[1] += checked
+
+    def describe(self, checkers) -> List[str]:
+        """단계 구성 설명."""
+        lines = []
+        for index, (stage, policy) in enumerate(self.arrange(checkers), 1):
+            names = ", ".join(f"{checker.name}(비용 {_cost(checker):g})" for checker in stage)
+            lines.append(f"{index}단계: {names} ← {_describe_policy(policy)}")
+        return lines
+
+    def report(self) -> List[str]:
+        """검사기별 호출 수와 정책으로 건너뛴 호출 수."""
+        lines = []
+        total_saved = total_cost = 0.0
+        with self._lock:
+            items = sorted(self.counts.items(), key=lambda item: -item[1][2])
+        for name, (considered, checked, cost) in items:
+            skipped = considered - checked
+            total_saved += skipped * cost
+            total_cost += considered * cost
+            ratio = f"{checked / considered * 100:.1f}%" if considered else "-"
+            lines.append(f"{name}: {int(checked)}/{int(considered)} 문장 검사 ({ratio}), "
+                         f"건너뜀 {int(skipped)}회")
+        if total_cost:
+            lines.append(f"절약한 비용: {total_saved:g} / {total_cost:g} ({total_saved / total_cost * 100:.1f}%)")
+        return lines
+
+
+def _cost(checker) -> float:
+    return float(getattr(checker, "cost", 1.0))
+
+
+def _describe_policy(policy: Policy) -> str:
+    if policy.selects_all:
+        return "모든 문장"
+    parts = []
+    if policy.flagged:
+        parts.append("앞 단계 플래그" if policy.flagged is True else f"{', '.join(policy.flagged)} 플래그")
+    if policy.features is not None:
+        parts.append(f"특징 /{policy.features.pattern}/")
+    if policy.sample:
+        parts.append(f"표본 {policy.sample * 100:g}%")
+    return " 또는 ".join(parts)
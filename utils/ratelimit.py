@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class AdaptiveRateLimiter:
+    """
+    스레드 안전 토큰 버킷. 성공하면 속도를 조금씩 올리고(가산 증가),
+    스로틀/오류가 나면 절반으로 줄인다(승산 감소, AIMD).
+    토큰은 음수까지 미리 예약되므로 동시에 호출해도 속도를 넘지 않는다.
+    """
+
+    def __init__(self, rate: float, min_rate: float = 0.5, max_rate: Optional[float] = None,
+                 burst: float = 1.0, increase: Optional[float] = None, decrease: float = 0.5,
+                 cooldown: float = 1.0):
+        self.rate = float(rate)
+        self.min_rate = min(min_rate, self.rate)
+        self.max_rate = max(max_rate or self.rate, self.rate)
+        self.burst = max(1.0, burst)
+        # 기본 가산 폭: 시작 속도의 2% (초당 5회면 50번 성공마다 +5회/초)
+        self.increase = increase if increase is not None else self.rate * 0.02
+        self.decrease = decrease
+        # 동시에 실패한 요청들이 속도를 여러 번 깎지 않도록 감소 간 최소 간격
+        self.cooldown = cooldown
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self):
+        """성공 응답: 속도 가산 증가."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_failure(self):
+        """스로틀/오류 응답: 속도 승산 감소."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 회를 넘으면 reset_timeout 초 동안 호출을 막는다(open).
+    시간이 지나면 요청 하나만 시험 삼아 보내고(half-open), 성공하면 다시 연다(closed).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지 확인 (half-open이면 시험 요청 하나만 허용)."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.trips += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def retry_after(self) -> float:
+        """다음 시험 요청까지 남은 시간(초)."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+
+class RetryQueue:
+    """
+    실패한 문장을 모아 두었다가 실행이 끝나기 전에 다시 검사하는 지연 재시도 대기열.
+    검사 결과 meta에 "deferred": True 가 있으면 아직 실패한 것으로 본다.
+    """
+
+    def __init__(self):
+        self._items: Dict[str, None] = {}
+        self._lock = threading.Lock()
+
+    def add(self, sentence: str):
+        with self._lock:
+            self._items[sentence] = None
+
+    def pop_all(self) -> List[str]:
+        with self._lock:
+            items = list(self._items)
+            self._items.clear()
+        return items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def drain(self, check_batch: Callable[[List[str]], List[Dict]],
+              breaker: Optional[CircuitBreaker] = None, rounds: int = 3) -> Dict[str, Dict]:
+        """
+        대기 중인 문장을 최대 rounds 번 다시 검사.
+        차단기가 열려 있으면 시험 요청이 가능할 때까지 기다린 뒤 보낸다.
+
+        Returns:
+            {문장: 결과} (재시도에 성공한 문장만)
+        """
+        recovered = {}
+        for _ in range(rounds):
+            pending = self.pop_all()
+            if not pending:
+                break
+            groups = [pending]
+            if breaker is not None:
+                wait = breaker.retry_after()
+                if wait > 0:
+                    time.sleep(wait)
+                # half-open에서는 시험 요청 하나만 통과하므로 첫 문장을 먼저 단독으로 보낸다
+                if breaker.state != CircuitBreaker.CLOSED:
+                    groups = [pending[:1], pending[1:]]
+            for group in groups:
+                if not group:
+                    continue
+                for sentence, result in zip(group, check_batch(group)):
+                    if not is_deferred(result):
+                        recovered[sentence] = result
+        return recovered
+
+
+def is_deferred(result: Dict) -> bool:
+    """검사 결과가 재시도 대기 중인 실패인지 확인."""
+    return bool((result.get("meta") or {}).get("deferred"))
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+import csv
+import heapq
+import os
+import shutil
+import tempfile
+from itertools import groupby
+from typing import Callable, Dict, Iterable, Iterator, List
+
+# 리포트 컬럼 순서
+REPORT_COLUMNS = [
+    "page", "sentence", "snippet", "sources", "error_types",
+    "suggestion_by_source", "representative_suggestion", "diff", "is_ocr",
+]
+
+
+def sort_key(row: Dict) -> tuple:
+    """결과 정렬 키 (우선순위: rule > 다중 검사기 > 단일 검사기, 이후 페이지 순)."""
+    sources = row["sources"].split(",")
+    priority = 0
+    if "rule" in sources:
+        priority += 100
+    if len(sources) > 1:
+        priority += 10
+    return (-priority, int(row["page"]), row["sources"])
+
+
+def external_sort(rows: Iterable[Dict], key: Callable[[Dict], tuple], tmp_dir: str,
+                  run_size: int = 5000, fieldnames: List[str] = REPORT_COLUMNS) -> Iterator[Dict]:
+    """
+    행을 run_size 단위로 정렬해 임시 파일에 쓰고 병합하는 외부 정렬 (안정 정렬).
+
+    Args:
+        rows: 정렬할 행 (REPORT_COLUMNS 키를 가진 딕셔너리)
+        key: 정렬 키 함수
+        tmp_dir: 정렬 런 파일을 둘 디렉토리 (호출자가 정리)
+        run_size: 메모리에 한 번에 올리는 최대 행 수
+        fieldnames: 행 컬럼
+
+    Returns:
+        정렬된 행 이터레이터
+    """
+    run_dir = tempfile.mkdtemp(prefix="runs_", dir=tmp_dir)
+    run_paths = []
+    chunk: List[Dict] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= run_size:
+            run_paths.append(_write_run(chunk, key, run_dir, len(run_paths), fieldnames))
+            chunk = []
+    if chunk or not run_paths:
+        run_paths.append(_write_run(chunk, key, run_dir, len(run_paths), fieldnames))
+
+    # heapq.merge는 앞선 런을 먼저 내보내므로 런 단위 안정 정렬이 전체 안정 정렬이 된다
+    return heapq.merge(*(_read_csv(path) for path in run_paths), key=key)
+
+
+def _write_run(chunk: List[Dict], key: Callable[[Dict], tuple], tmp_dir: str, index: int,
+               fieldnames: List[str]) -> str:
+    chunk.sort(key=key)
+    path = os.path.join(tmp_dir, f"run_{index:05d}.csv")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(chunk)
+    return path
+
+
+def collapse_duplicates(rows: Iterable[Dict], tmp_dir: str, run_size: int = 5000) -> Iterator[Dict]:
+    """
+    같은 문장의 행을 하나로 합친다. 대표 행은 첫 페이지의 행이고, "pages" 컬럼에
+    등장한 모든 페이지를 쉼표로 나열한다. 문장 기준 외부 정렬 후 묶으므로 메모리는 일정하다.
+    """
+    by_sentence = external_sort(rows, lambda r: (r["sentence"], int(r["page"])), tmp_dir, run_size)
+    for _, group in groupby(by_sentence, key=lambda r: r["sentence"]):
+        merged = None
+        pages = []
+        for row in group:
+            if merged is None:
+                merged = dict(row)
+            if row["page"] not in pages:
+                pages.append(row["page"])
+        merged["pages"] = ",".join(pages)
+        yield merged
+
+
+def _read_csv(path: str) -> Iterator[Dict]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+class ReportWriter:
+    """
+    플래그된 행을 받는 즉시 중간 CSV에 덧붙이고, close() 때 외부 정렬로
+    우선순위 순 review.csv / review.xlsx 를 만든다. 메모리 사용량은 행 수와 무관하다.
+    collapse=True 이면 같은 문장의 행을 하나로 합치고 "pages" 컬럼에 페이지를 나열한다.
+    """
+
+    def __init__(self, out_dir: str, formats: Iterable[str] = ("csv", "xlsx"),
+                 key: Callable[[Dict], tuple] = sort_key, run_size: int = 5000,
+                 collapse: bool = False):
+        self.out_dir = out_dir
+        self.formats = set(formats)
+        self.key = key
+        self.run_size = run_size
+        self.collapse = collapse
+        self.columns = REPORT_COLUMNS + ["pages"] if collapse else REPORT_COLUMNS
+        self.row_count = 0
+        self.source_counts: Dict[str, int] = {}
+
+        # 중단되더라도 여기까지의 결과는 남는다
+        self.partial_path = os.path.join(out_dir, "review.partial.csv")
+        self._partial = open(self.partial_path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._partial, fieldnames=REPORT_COLUMNS, lineterminator="\n")
+        self._writer.writeheader()
+        self._partial.flush()
+
+    def write(self, row: Dict):
+        """행 하나를 중간 CSV에 기록."""
+        self._writer.writerow(row)
+        self._partial.flush()
+        self.row_count += 1
+        for source in row["sources"].split(","):
+            self.source_counts[source] = self.source_counts.get(source, 0) + 1
+
+    def close(self) -> Dict[str, str]:
+        """정렬된 최종 파일을 만들고 {형식: 경로} 반환."""
+        self._partial.close()
+        paths = {}
+        tmp_dir = tempfile.mkdtemp(prefix="sort_", dir=self.out_dir)
+        try:
+            if "csv" in self.formats:
+                paths["csv"] = os.path.join(self.out_dir, "review.csv")
+                self._write_csv(paths["csv"], self._sorted_rows(tmp_dir), self.columns)
+            if "xlsx" in self.formats:
+                paths["xlsx"] = os.path.join(self.out_dir, "review.xlsx")
+                rows = _read_csv(paths["csv"]) if "csv" in paths else self._sorted_rows(tmp_dir)
+                self._write_xlsx(paths["xlsx"], rows, self.columns)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.remove(self.partial_path)
+        return paths
+
+    def discard(self):
+        """최종 파일을 만들지 않고 중간 CSV를 지운다 (실행을 중단할 때)."""
+        self._partial.close()
+        os.remove(self.partial_path)
+
+    def _sorted_rows(self, tmp_dir: str) -> Iterator[Dict]:
+        rows = _read_csv(self.partial_path)
+        if self.collapse:
+            rows = collapse_duplicates(rows, tmp_dir, self.run_size)
+        return external_sort(rows, self.key, tmp_dir, self.run_size, self.columns)
+
+    @staticmethod
+    def _write_csv(path: str, rows: Iterable[Dict], columns: List[str]):
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(rows)
+
+    @staticmethod
+    def _write_xlsx(path: str, rows: Iterable[Dict], columns: List[str]):
+        from openpyxl import Workbook
+
+        # write_only 워크북은 행을 바로 스트리밍하므로 메모리가 일정하다
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(columns)
+        for row in rows:
+            values = dict(row)
+            values["page"] = int(values["page"])
+            values["is_ocr"] = values["is_ocr"] == "True"
+            ws.append([values[col] for col in columns])
+        wb.save(path)
+
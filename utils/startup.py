@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+# 프로세스에서 이 모듈을 처음 import 한 시각 (run.py 가 가장 먼저 import 한다)
+_T0 = time.perf_counter()
+
+
+class StartupTimer:
+    """
+    지연 import / 검사기 초기화 / 첫 결과까지의 시간을 모으는 기록기 (--startup-report).
+    여러 스레드(백그라운드 예열 등)에서 동시에 기록해도 안전하다.
+    """
+
+    def __init__(self):
+        self.sections: List[Tuple[str, float, float, str]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def section(self, label: str):
+        """label 구간의 시작 시각과 소요 시간 기록."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.sections.append((label, start - _T0, end - start, threading.current_thread().name))
+
+    def mark(self, label: str):
+        """순간 이벤트(첫 페이지, 첫 결과 등) 기록."""
+        with self._lock:
+            self.sections.append((label, time.perf_counter() - _T0, 0.0, threading.current_thread().name))
+
+    def report(self) -> str:
+        with self._lock:
+            sections = sorted(self.sections, key=lambda s: s[1])
+        lines = ["=== 시작 시간 보고 ===", f"{'시작(s)':>8} {'소요(s)':>8}  {'스레드':<12} 구간"]
+        for label, start, duration, thread in sections:
+            took = f"{duration:8.3f}" if duration else f"{'-':>8}"
+            lines.append(f"{start:8.3f} {took}  {thread:<12} {label}")
+        return "\n".join(lines)
+
+
+STARTUP = StartupTimer()
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import unicodedata
 import re
-from typing import List
+from typing import List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
 def normalize_text(text: str) -> str:
     """
@@ -36,6 +36,76 @@ def normalize_text(text: str) -> str:
     
     return text.strip()
 
+class PreprocessedText(NamedTuple):
+    """TextPreprocessor 결과."""
+    text: str            # normalize_text와 같은 정규화 텍스트
+    korean_chars: int    # 한글 음절(AC00-D7A3) 수
+    visible_chars: int   # 공백이 아닌 문자 수
+    line_starts: List[int]  # 각 줄의 시작 오프셋
+
+    @property
+    def korean_ratio(self) -> float:
+        """visible_korean_ratio와 같은 한글 비율."""
+        return self.korean_chars / self.visible_chars if self.visible_chars > 0 else 0.0
+
+
+class TextPreprocessor:
+    """
+    normalize_text + visible_korean_ratio를 한 번에 처리하는 전처리기.
+    지울 문자는 미리 컴파일한 문자 클래스 하나로 한 번에 지우고, 공백 축약은 str.replace,
+    계수는 C 수준 스캔(정규식 subn, str.count)으로 처리해 파이썬 루프를 돌지 않는다.
+    """
+
+    def __init__(self):
+        # 제어 문자, 소프트 하이픈, 제로 너비 문자를 한 번에 제거
+        self._delete = re.compile('[\x00-\x08\x0B\x0C\x0E-\x1F\x7F\u00AD\u200B-\u200D\uFEFF]')
+        self._non_hangul = re.compile('[^\uac00-\ud7a3]+')
+        # 정규화 후에도 남을 수 있는 공백 문자 (U+3000 이후에는 공백 문자가 없다)
+        self._whitespace = [
+            ch for ch in map(chr, range(0x3001))
+            if ch.isspace() and not self._delete.match(ch)
+            and unicodedata.normalize("NFKC", ch) == ch and ch not in '\t\u00A0'
+        ]
+
+    def process(self, text: str) -> PreprocessedText:
+        """
+        텍스트를 정규화하고 한글/가시 문자 수와 줄 경계를 함께 계산합니다.
+
+        Args:
+            text: 정규화할 텍스트
+
+        Returns:
+            PreprocessedText
+        """
+        if not text:
+            return PreprocessedText("", 0, 0, [])
+
+        text = self._delete.sub('', unicodedata.normalize("NFKC", text))
+        if '\t' in text:
+            text = text.replace('\t', ' ')
+        if '\u00A0' in text:
+            text = text.replace('\u00A0', ' ')
+        text = _squeeze(_squeeze(text, ' '), '\n').strip()
+
+        korean_chars = len(self._non_hangul.sub('', text))
+        visible_chars = len(text) - sum(text.count(ch) for ch in self._whitespace)
+
+        line_starts = [0]
+        pos = text.find('\n')
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = text.find('\n', pos + 1)
+        return PreprocessedText(text, korean_chars, visible_chars, line_starts)
+
+
+def _squeeze(text: str, ch: str) -> str:
+    """연속된 ch를 하나로 축약."""
+    double = ch * 2
+    while double in text:
+        text = text.replace(double, ch)
+    return text
+
+
 def split_sentences(text: str) -> List[str]:
     """
     텍스트를 문장 단위로 분리합니다.
@@ -48,18 +118,78 @@ def split_sentences(text: str) -> List[str]:
     """
     if not text:
         return []
-    
-    # kss 라이브러리 사용 시도
-    try:
-        import kss
-        sentences = kss.split_sentences(text)
-        return [s.strip() for s in sentences if s.strip()]
-    except ImportError:
-        # kss가 없으면 간단한 정규식으로 분리
-        return _fallback_sentence_split(text)
-    except Exception:
-        # kss 오류 시 fallback 사용
-        return _fallback_sentence_split(text)
+    return _default_splitter().split(text)
+
+class SentenceSplitter:
+    """
+    kss를 한 번만 로드해 두고 여러 텍스트를 한 번의 호출로 분리하는 문장 분리기.
+    kss가 없거나 오류가 나면 _fallback_sentence_split을 사용합니다.
+    num_workers가 1보다 크거나 "auto"면 kss가 split_many 호출마다 프로세스 풀을 새로 만들었다가 닫으므로,
+    검사기 스레드가 돌고 있는 실행 중에는 기본값 1(현재 프로세스에서 분리)을 씁니다.
+    """
+
+    def __init__(self, backend: str = "auto", num_workers: Union[int, str] = 1):
+        self.backend = backend
+        self.num_workers = num_workers
+        try:
+            import kss
+            self._kss = kss
+        except ImportError:
+            # kss가 없으면 간단한 정규식으로 분리
+            self._kss = None
+
+    def split(self, text: str) -> List[str]:
+        """텍스트 하나를 문장 리스트로 분리."""
+        return self.split_many([text])[0]
+
+    def split_many(self, texts: Sequence[str]) -> List[List[str]]:
+        """
+        여러 텍스트를 kss 리스트 입력으로 한 번에 분리합니다.
+
+        Args:
+            texts: 분리할 텍스트들 (예: 페이지 단위)
+
+        Returns:
+            텍스트별 문장 리스트 (입력 순서 유지)
+        """
+        results: List[List[str]] = [[] for _ in texts]
+        targets = [i for i, text in enumerate(texts) if text]
+        if not targets:
+            return results
+
+        if self._kss is None:
+            for i in targets:
+                results[i] = _fallback_sentence_split(texts[i])
+            return results
+
+        try:
+            if len(targets) == 1:
+                # kss는 원소 하나짜리 리스트를 받으면 중첩 없이 문장 리스트를 돌려준다
+                batches = [self._kss.split_sentences(texts[targets[0]], backend=self.backend)]
+            else:
+                batches = self._kss.split_sentences(
+                    [texts[i] for i in targets], backend=self.backend, num_workers=self.num_workers
+                )
+            for i, sentences in zip(targets, batches):
+                results[i] = [s.strip() for s in sentences if s.strip()]
+        except Exception:
+            # 배치 실패 시 텍스트별로 다시 시도하고, 그래도 실패하면 fallback 사용
+            for i in targets:
+                try:
+                    sentences = self._kss.split_sentences(texts[i], backend=self.backend)
+                    results[i] = [s.strip() for s in sentences if s.strip()]
+                except Exception:
+                    results[i] = _fallback_sentence_split(texts[i])
+        return results
+
+_splitter: Optional[SentenceSplitter] = None
+
+def _default_splitter() -> SentenceSplitter:
+    """split_sentences가 공유하는 기본 분리기."""
+    global _splitter
+    if _splitter is None:
+        _splitter = SentenceSplitter()
+    return _splitter
 
 def _fallback_sentence_split(text: str) -> List[str]:
     """kss 실패 시 사용하는 간단한 문장 분리."""
@@ -86,6 +216,48 @@ def _fallback_sentence_split(text: str) -> List[str]:
     # 빈 문장 제거 및 정리
     return [s.strip() for s in sentences if s.strip()]
 
+def running_line_signature(line: str) -> str:
+    """
+    머리글/바닥글 비교용 줄 서명 (숫자는 #, 공백은 하나로).
+    쪽번호만 다른 "030 · 책 제목"과 "032 · 책 제목"이 같은 서명이 됩니다.
+    """
+    line = unicodedata.normalize("NFKC", line)
+    line = re.sub(r'\d', '#', line)
+    return " ".join(line.split())
+
+def strip_running_lines(text: str, signatures: Set[str], edge_lines: int = 3) -> Tuple[str, List[str]]:
+    """
+    페이지 맨 위·맨 아래에서 서명이 signatures에 있는 줄(반복 머리글/바닥글, 쪽번호)을 제거합니다.
+    가장자리부터 연속으로 일치하는 줄만, 각각 최대 edge_lines 줄까지 지우므로
+    본문의 숫자만 있는 줄(표 칸, 목록 번호)이나 장 제목과 같은 본문 제목은 남습니다.
+
+    Args:
+        text: 페이지 텍스트
+        signatures: running_line_signature 서명 집합
+        edge_lines: 위·아래에서 각각 확인할 최대 줄 수 (빈 줄 제외)
+
+    Returns:
+        (제거 후 텍스트, 제거된 줄 리스트)
+    """
+    if not text or not signatures:
+        return text, []
+
+    lines = text.split('\n')
+    drop = set()
+    for order in (range(len(lines)), range(len(lines) - 1, -1, -1)):
+        seen = 0
+        for i in order:
+            if not lines[i].strip():
+                continue
+            if seen >= edge_lines or i in drop or running_line_signature(lines[i]) not in signatures:
+                break
+            drop.add(i)
+            seen += 1
+
+    kept = [line for i, line in enumerate(lines) if i not in drop]
+    removed = [lines[i] for i in sorted(drop)]
+    return '\n'.join(kept), removed
+
 def visible_korean_ratio(text: str) -> float:
     """
     텍스트에서 한글 문자의 비율을 계산합니다.
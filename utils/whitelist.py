@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+화이트리스트(회사명, 제품명 등) 다중 패턴 매칭.
+용어 전체로 Aho-Corasick 오토마타를 한 번 만들고 문장을 한 번만 훑어 모든 등장 위치를 찾는다.
+검사기 결과 중 화이트리스트 구간과 겹치는 지적만 걸러낼 때 쓴다.
+"""
+import difflib
+import os
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Span = Tuple[int, int]
+
+
+class Whitelist:
+    """화이트리스트 용어 집합 + Aho-Corasick 오토마타 (용어를 추가하면 다음 검색 때 다시 만든다)."""
+
+    def __init__(self, terms: Iterable[str] = ()):
+        self._terms = set()
+        self._lock = threading.Lock()
+        self._automaton = None
+        for term in terms:
+            self.add(term)
+
+    @classmethod
+    def from_file(cls, path: Optional[str]) -> "Whitelist":
+        """한 줄에 용어 하나, #으로 시작하는 줄은 주석."""
+        whitelist = cls()
+        if not path or not os.path.exists(path):
+            return whitelist
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    term = line.strip()
+                    if term and not term.startswith("#"):
+                        whitelist.add(term)
+        except Exception as e:
+            print(f"화이트리스트 파일 로드 실패: {e}")
+        return whitelist
+
+    def add(self, term: str):
+        term = term.strip()
+        if term and term not in self._terms:
+            with self._lock:
+                self._terms.add(term)
+                self._automaton = None
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._terms
+
+    def __iter__(self):
+        return iter(sorted(self._terms))
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def _build(self):
+        """goto/fail/출력 테이블 생성. 출력에는 fail 경로의 용어까지 미리 합쳐 둔다."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for term in self._terms:
+            node = 0
+            for ch in term:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(len(term))
+
+        # 깊이 1 노드의 fail 은 루트(0), 그 아래부터 너비 우선으로 계산
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(ch, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+        return goto, fail, outputs
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """text 안의 모든 용어 등장 (시작, 끝, 용어). 겹치는 등장도 모두 돌려준다."""
+        automaton = self._automaton
+        if automaton is None:
+            with self._lock:
+                if self._automaton is None:
+                    self._automaton = self._build()
+                automaton = self._automaton
+        goto, fail, outputs = automaton
+
+        found = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length in outputs[node]:
+                found.append((i + 1 - length, i + 1, text[i + 1 - length:i + 1]))
+        return found
+
+    def spans(self, text: str) -> List[Span]:
+        """화이트리스트 구간 (겹치거나 맞닿은 등장은 합쳐서 정렬)."""
+        if not self._terms:
+            return []
+        merged: List[List[int]] = []
+        for start, end, _ in sorted(self.find(text)):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [(start, end) for start, end in merged]
+
+
+_loaded: Dict[str, Whitelist] = {}
+_loaded_lock = threading.Lock()
+
+
+def load_whitelist(path: Optional[str]) -> Whitelist:
+    """경로별로 한 번만 읽어 공유 (규칙 검사기와 다른 검사기 후처리가 같은 오토마타를 쓴다)."""
+    if not path:
+        return Whitelist()
+    key = os.path.abspath(path)
+    with _loaded_lock:
+        if key not in _loaded:
+            _loaded[key] = Whitelist.from_file(path)
+        return _loaded[key]
+
+
+def overlaps(start: int, end: int, spans: List[Span]) -> bool:
+    """[start, end) 가 화이트리스트 구간과 겹치는지 (길이 0 구간은 구간 안쪽에 있을 때만)."""
+    for span_start, span_end in spans:
+        if start == end:
+            if span_start < start < span_end:
+                return True
+        elif start < span_end and span_start < end:
+            return True
+    return False
+
+
+def mask_hits(hits: List[Dict], spans: List[Span]) -> List[Dict]:
+    """spans 가 있는 hit 에서 화이트리스트 구간과 겹치는 매칭을 빼고, 남은 매칭이 없는 hit 은 버린다."""
+    if not spans:
+        return hits
+    kept = []
+    for hit in hits:
+        if "spans" not in hit:
+            kept.append(hit)
+            continue
+        remaining = [span for span in hit["spans"] if not overlaps(span[0], span[1], spans)]
+        if remaining:
+            kept.append(dict(hit, spans=remaining))
+    return kept
+
+
+def mask_correction(original: str, corrected: str, spans: List[Span]) -> str:
+    """교정문에서 화이트리스트 구간을 고친 부분만 원문대로 되돌린다."""
+    if not spans or corrected == original:
+        return corrected
+    matcher = difflib.SequenceMatcher(None, original, corrected, autojunk=False)
+    pieces = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal" and overlaps(i1, i2, spans):
+            pieces.append(original[i1:i2])
+        else:
+            pieces.append(corrected[j1:j2])
+    return "".join(pieces)